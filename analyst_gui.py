@@ -8,8 +8,15 @@ Run as Administrator for full functionality.
 """
 
 # ── Standard library ──────────────────────────────────────────────────────────
-import os, re, glob, struct, threading, subprocess, time, ctypes, platform
-from datetime import datetime
+import os, re, glob, math, struct, threading, subprocess, time, ctypes, platform
+import argparse, codecs, collections, contextlib, csv, functools, gzip, hashlib, heapq, io, itertools, json, mmap, queue, random
+import selectors, socket, sqlite3, tempfile, urllib.error, urllib.parse, urllib.request, zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import namedtuple
+from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor,
+                                wait, FIRST_COMPLETED)
+from datetime import datetime, timedelta, timezone
+import xml.etree.ElementTree as ET
 from tkinter import filedialog, messagebox
 import tkinter as tk
 from tkinter import ttk
@@ -21,12 +28,20 @@ except ImportError:             PSUTIL_OK = False
 # ── pywin32 ───────────────────────────────────────────────────────────────────
 WIN32_OK = False
 try:
-    import win32evtlog, win32evtlogutil, win32api, win32con, win32process
+    import win32evtlog, win32api, win32con, win32process
     import winreg
     WIN32_OK = True
 except ImportError:
     pass
 
+# ── WMI over COM (pywin32) ────────────────────────────────────────────────────
+WMI_COM_OK = False
+try:
+    import pythoncom, win32com.client
+    WMI_COM_OK = True
+except ImportError:
+    pass
+
 # ── pynvml ────────────────────────────────────────────────────────────────────
 GPU_OK = False
 try:
@@ -71,17 +86,57 @@ S = {
     "tab_network":      {"en": "  🌐  Network  ",        "tr": "  🌐  Ağ  "},
     "tab_sysinfo":      {"en": "  💻  System Info  ",    "tr": "  💻  Sistem Bilgisi  "},
     "tab_startup":      {"en": "  🚀  Startup  ",        "tr": "  🚀  Başlangıç  "},
+    "tab_procs":        {"en": "  ⚙  Processes  ",      "tr": "  ⚙  İşlemler  "},
     "tab_thermal":      {"en": "  🌡  Thermal  ",        "tr": "  🌡  Isı İzleme  "},
+    "tab_bench":        {"en": "  🏁  Benchmark  ",      "tr": "  🏁  Performans Testi  "},
+    "tab_diag":         {"en": "  🩺  Diagnostics  ",    "tr": "  🩺  Tanılama  "},
     "tab_language":     {"en": "  🌍  Language  ",       "tr": "  🌍  Dil  "},
     # ── dashboard ─────────────────────────────────────────────────────────────
     "m_cpu":            {"en": "CPU",                    "tr": "İŞLEMCİ"},
     "m_ram":            {"en": "RAM",                    "tr": "BELLEK"},
     "m_gpu":            {"en": "GPU",                    "tr": "EKRAN KARTI"},
     "m_disk":           {"en": "DISK",                   "tr": "DİSK"},
+    "m_cores":          {"en": "CPU cores",              "tr": "İşlemci çekirdekleri"},
+    "m_volumes":        {"en": "Volumes",                "tr": "Birimler"},
+    "m_disk_io":        {"en": "Disk I/O",               "tr": "Disk G/Ç"},
+    "m_net_io":         {"en": "Network",                "tr": "Ağ"},
+    "m_rw":             {"en": "read {}/s   ·   write {}/s", "tr": "okuma {}/sn   ·   yazma {}/sn"},
+    "m_rx":             {"en": "down {}/s   ·   up {}/s",    "tr": "indirme {}/sn   ·   yükleme {}/sn"},
     # ── analysis ──────────────────────────────────────────────────────────────
     "btn_quick_scan":   {"en": "⚡  Quick Scan",          "tr": "⚡  Hızlı Tarama"},
     "btn_deep_scan":    {"en": "🔬  Deep Scan",           "tr": "🔬  Derin Tarama"},
     "btn_quick_fix":    {"en": "🛠  Quick Fix Pro",        "tr": "🛠  Hızlı Düzeltme Pro"},
+    "btn_batch":        {"en": "🗂  Batch Analyze…",       "tr": "🗂  Toplu Analiz…"},
+    "batch_pick":       {"en": "Select a folder of collected dumps / event logs",
+                         "tr": "Toplanan döküm / olay günlüğü klasörünü seçin"},
+    "log_batch_start":  {"en": "Batch analysis: {} files on {} workers …",
+                         "tr": "Toplu analiz: {} dosya, {} işçi …"},
+    "log_batch_done":   {"en": "Batch done: {} files, {} records ({} errors) in {:.1f} s → {}",
+                         "tr": "Toplu analiz bitti: {} dosya, {} kayıt ({} hata), {:.1f} sn → {}"},
+    "log_batch_top":    {"en": "  Top codes: {}",          "tr": "  En sık kodlar: {}"},
+    "snap_saved":       {"en": "Snapshot {} saved ({} of {} sections new)",
+                         "tr": "Anlık görüntü {} kaydedildi ({}/{} bölüm yeni)"},
+    "snap_since":       {"en": "Changes since {}:",        "tr": "{} tarihinden bu yana değişiklikler:"},
+    "snap_err":         {"en": "  Snapshot failed: {}",     "tr": "  Anlık görüntü alınamadı: {}"},
+    "snap_none":        {"en": "  No changes since {}",    "tr": "  {} tarihinden bu yana değişiklik yok"},
+    "snap_si":          {"en": "  ≠ {}: {} → {}",          "tr": "  ≠ {}: {} → {}"},
+    "snap_su_add":      {"en": "  + Startup entry: {}  ({})", "tr": "  + Başlangıç girdisi: {}  ({})"},
+    "snap_su_rm":       {"en": "  − Startup entry removed: {}", "tr": "  − Başlangıç girdisi kaldırıldı: {}"},
+    "snap_su_chg":      {"en": "  ≠ Startup entry changed: {}  ({})",
+                         "tr": "  ≠ Başlangıç girdisi değişti: {}  ({})"},
+    "snap_drv_upd":     {"en": "  ↑ Driver updated: {}  {} → {}", "tr": "  ↑ Sürücü güncellendi: {}  {} → {}"},
+    "snap_drv_add":     {"en": "  + Driver installed: {}  {}", "tr": "  + Sürücü yüklendi: {}  {}"},
+    "snap_drv_rm":      {"en": "  − Driver removed: {}",   "tr": "  − Sürücü kaldırıldı: {}"},
+    "snap_crash_new":   {"en": "  + New crash code: {}  (×{})", "tr": "  + Yeni çökme kodu: {}  (×{})"},
+    "alert_fire":       {"en": "  ⚠  Alert: {} — {} {} = {} ({} {})",
+                         "tr": "  ⚠  Uyarı: {} — {} {} = {} ({} {})"},
+    "alert_resolved":   {"en": "  ✓  Alert cleared: {}",   "tr": "  ✓  Uyarı kalktı: {}"},
+    "log_fleet_sent":   {"en": "Uploaded {} report(s) to the fleet collector",
+                         "tr": "Filo toplayıcısına {} rapor gönderildi"},
+    "log_fleet_err":    {"en": "  Fleet collector unreachable ({}) — report kept for the next scan",
+                         "tr": "  Filo toplayıcısına ulaşılamadı ({}) — rapor sonraki taramaya saklandı"},
+    "log_fleet_rejected": {"en": "  Fleet collector refused {} report(s) — moved to {}",
+                           "tr": "  Filo toplayıcısı {} raporu reddetti — {} dosyasına taşındı"},
     "crash_history":    {"en": "Crash Report History",    "tr": "Çökme Raporu Geçmişi"},
     "crash_hint":       {"en": "Double-click a row to view diagnosis",
                          "tr": "Teşhis için satıra çift tıklayın"},
@@ -98,6 +153,18 @@ S = {
                          "tr": "Tarayıcı Önbellekleri (Chrome, Edge, Firefox)"},
     "btn_cleanup":      {"en": "🧹  Start Cleanup",       "tr": "🧹  Temizliği Başlat"},
     "btn_opt_ram":      {"en": "🚀  Optimize RAM",        "tr": "🚀  RAM'i Optimize Et"},
+    "opt_dups":         {"en": "Duplicate Files (keep oldest copy)",
+                         "tr": "Yinelenen Dosyalar (en eski kopya kalır)"},
+    "opt_dry":          {"en": "Dry Run (report only, delete nothing)",
+                         "tr": "Deneme (yalnızca raporla, silme)"},
+    "btn_dups":         {"en": "🔎  Find Duplicates",     "tr": "🔎  Yinelenenleri Bul"},
+    "dup_pick":         {"en": "Folder to search for duplicates",
+                         "tr": "Yinelenenlerin aranacağı klasör"},
+    "du_title":         {"en": "Disk Usage",              "tr": "Disk Kullanımı"},
+    "btn_du":           {"en": "📂  Analyze",             "tr": "📂  Analiz Et"},
+    "du_col_path":      {"en": "Folder",                  "tr": "Klasör"},
+    "du_col_size":      {"en": "Size",                    "tr": "Boyut"},
+    "du_col_files":     {"en": "Files",                   "tr": "Dosya"},
     # ── network ───────────────────────────────────────────────────────────────
     "btn_net_diag":     {"en": "🌐  Run Diagnostics",     "tr": "🌐  Teşhis Çalıştır"},
     "btn_speed":        {"en": "⚡  Speed Test",           "tr": "⚡  Hız Testi"},
@@ -120,6 +187,19 @@ S = {
     "si_uptime":        {"en": "System Uptime",            "tr": "Sistem Çalışma Süresi"},
     "si_arch":          {"en": "Architecture",             "tr": "Mimari"},
     "btn_refresh_si":   {"en": "🔄  Refresh",              "tr": "🔄  Yenile"},
+    # ── processes ─────────────────────────────────────────────────────────────
+    "pr_title":         {"en": "Live Processes",           "tr": "Canlı İşlemler"},
+    "pr_col_name":      {"en": "Process",                  "tr": "İşlem"},
+    "pr_col_pid":       {"en": "PID",                      "tr": "PID"},
+    "pr_col_cpu":       {"en": "CPU %",                    "tr": "CPU %"},
+    "pr_col_rss":       {"en": "Memory (MB)",              "tr": "Bellek (MB)"},
+    "pr_col_io":        {"en": "I/O (KB/s)",               "tr": "G/Ç (KB/sn)"},
+    "pr_col_handles":   {"en": "Handles",                  "tr": "Tanıtıcılar"},
+    "pr_col_threads":   {"en": "Threads",                  "tr": "İş Parçacıkları"},
+    "pr_summary":       {"en": "{} processes · sampled in {:.0f} ms · {} rows updated",
+                         "tr": "{} işlem · {:.0f} ms'de örneklendi · {} satır güncellendi"},
+    "pr_hint":          {"en": "Sampled every 2 s while this tab is open — click a heading to sort",
+                         "tr": "Bu sekme açıkken 2 sn'de bir örneklenir — sıralamak için başlığa tıklayın"},
     # ── startup manager ───────────────────────────────────────────────────────
     "sm_title":         {"en": "Startup Applications",     "tr": "Başlangıç Uygulamaları"},
     "sm_hint":          {"en": "Select an entry and click Disable/Enable to toggle it",
@@ -134,6 +214,7 @@ S = {
     "btn_sm_disable":   {"en": "⛔  Disable Selected",      "tr": "⛔  Seçiliyi Devre Dışı Bırak"},
     "btn_sm_enable":    {"en": "✅  Enable Selected",        "tr": "✅  Seçiliyi Etkinleştir"},
     "sm_no_sel":        {"en": "No entry selected.",        "tr": "Seçili giriş yok."},
+    "tbl_filter":       {"en": "Filter:",                   "tr": "Filtre:"},
     "sm_no_win32":      {"en": "pywin32 required for Registry access.",
                          "tr": "Kayıt defteri erişimi için pywin32 gereklidir."},
     # ── thermal ───────────────────────────────────────────────────────────────
@@ -147,8 +228,49 @@ S = {
     "th_hot":           {"en": "Hot 🔴",                    "tr": "Sıcak 🔴"},
     "th_na":            {"en": "N/A — sensor not found",    "tr": "Yok — sensör bulunamadı"},
     "btn_th_refresh":   {"en": "🔄  Refresh",               "tr": "🔄  Yenile"},
-    "th_hint":          {"en": "pynvml required for NVIDIA GPU temp. CPU via WMI/PowerShell.",
-                         "tr": "NVIDIA GPU için pynvml gerekli. CPU sıcaklığı WMI/PowerShell."},
+    "th_hint":          {"en": "Sensors: sysfs hwmon (Linux) · WMI thermal zones + LibreHardwareMonitor (Windows) · "
+                               "pynvml (NVIDIA). Updates every second while this tab is open.",
+                         "tr": "Sensörler: sysfs hwmon (Linux) · WMI ısıl bölgeler + LibreHardwareMonitor (Windows) · "
+                               "pynvml (NVIDIA). Bu sekme açıkken her saniye güncellenir."},
+    "th_all":           {"en": "All Sensors",               "tr": "Tüm Sensörler"},
+    "th_col_sensor":    {"en": "Sensor",                    "tr": "Sensör"},
+    "th_col_group":     {"en": "Component",                 "tr": "Bileşen"},
+    "th_col_value":     {"en": "Reading",                   "tr": "Değer"},
+    "th_col_source":    {"en": "Source",                    "tr": "Kaynak"},
+    # ── benchmark ─────────────────────────────────────────────────────────────
+    "bd_title":         {"en": "Storage Benchmark",         "tr": "Depolama Performans Testi"},
+    "btn_bd":           {"en": "💽  Run Disk Test",          "tr": "💽  Disk Testini Çalıştır"},
+    "bd_col_test":      {"en": "Test",                      "tr": "Test"},
+    "bd_col_mbps":      {"en": "MB/s",                      "tr": "MB/s"},
+    "bd_col_iops":      {"en": "IOPS",                      "tr": "IOPS"},
+    "bd_col_p50":       {"en": "Latency p50",               "tr": "Gecikme p50"},
+    "bd_col_p99":       {"en": "Latency p99",               "tr": "Gecikme p99"},
+    "bd_col_delta":     {"en": "vs. last run",              "tr": "önceki çalıştırmaya göre"},
+    "bc_title":         {"en": "CPU & Memory Benchmark",    "tr": "İşlemci & Bellek Performans Testi"},
+    "btn_bc":           {"en": "🧮  Run CPU Test",           "tr": "🧮  İşlemci Testini Çalıştır"},
+    "bc_col_score":     {"en": "Score",                     "tr": "Puan"},
+    "bd_row_file":      {"en": "Test file",                 "tr": "Test dosyası"},
+    "bd_hint":          {"en": "Uses a temporary file on the chosen volume. * = OS cache could not be bypassed.",
+                         "tr": "Seçilen birimde geçici dosya kullanır. * = işletim sistemi önbelleği atlanamadı."},
+    # ── diagnostics ───────────────────────────────────────────────────────────
+    "dg_title":         {"en": "Slowest Recent Operations", "tr": "En Yavaş Son İşlemler"},
+    "dg_enable":        {"en": "Record trace spans",        "tr": "İzleme kayıtlarını tut"},
+    "btn_dg_refresh":   {"en": "🔄  Refresh",               "tr": "🔄  Yenile"},
+    "btn_dg_export":    {"en": "💾  Export Trace",          "tr": "💾  İzi Dışa Aktar"},
+    "btn_dg_clear":     {"en": "🗑  Clear",                 "tr": "🗑  Temizle"},
+    "dg_col_op":        {"en": "Operation",                 "tr": "İşlem"},
+    "dg_col_cat":       {"en": "Kind",                      "tr": "Tür"},
+    "dg_col_ms":        {"en": "Duration (ms)",             "tr": "Süre (ms)"},
+    "dg_col_thread":    {"en": "Thread",                    "tr": "İş Parçacığı"},
+    "dg_col_at":        {"en": "Started",                   "tr": "Başlangıç"},
+    "dg_col_args":      {"en": "Details",                   "tr": "Ayrıntılar"},
+    "dg_count":         {"en": "{:,} spans recorded",       "tr": "{:,} kayıt tutuldu"},
+    "dg_hint":          {"en": "Open exported traces in chrome://tracing or ui.perfetto.dev. "
+                               "Set PCANALYST_TRACE=1 to record from startup.",
+                         "tr": "Dışa aktarılan izleri chrome://tracing veya ui.perfetto.dev ile açın. "
+                               "Açılıştan itibaren kayıt için PCANALYST_TRACE=1 ayarlayın."},
+    "dg_export_title":  {"en": "Save Chrome Trace",         "tr": "Chrome İzini Kaydet"},
+    "log_dg_export":    {"en": "Trace exported ({:,} spans) →", "tr": "İz dışa aktarıldı ({:,} kayıt) →"},
     # ── language ──────────────────────────────────────────────────────────────
     "lang_title":       {"en": "Interface Language",        "tr": "Arayüz Dili"},
     "lang_sub":         {"en": "Select the display language. UI updates instantly.",
@@ -190,19 +312,41 @@ S = {
     "log_top_cpu":      {"en": "\nTop CPU-consuming processes:",     "tr": "\nEn yüksek CPU kullanan süreçler:"},
     "log_no_crash":     {"en": "No crash events — system stable.",   "tr": "Çökme olayı yok — sistem kararlı."},
     "log_evtlog_err":   {"en": "  Event log error: ",               "tr": "  Olay günlüğü hatası: "},
+    "src_evtlog":       {"en": "Event Log",                         "tr": "Olay Günlüğü"},
     "log_no_mini_dir":  {"en": "  No Minidump directory.",          "tr": "  Minidump dizini bulunamadı."},
+    "log_full_dump":    {"en": "  MEMORY.DMP found ({}, {} dump) — scanning modules…",
+                         "tr": "  MEMORY.DMP bulundu ({}, {} dökümü) — modüller taranıyor…"},
+    "log_dump_mods":    {"en": "       Known modules in dump: {}",  "tr": "       Dökümdeki bilinen modüller: {}"},
     "log_no_dmp":       {"en": "  No .dmp files.",                  "tr": "  .dmp dosyası yok."},
     "log_perm":         {"en": "  PermissionError: run as Admin.",  "tr": "  İzin Hatası: Yönetici olarak çalıştırın."},
     "log_smart_err":    {"en": "  Disk health query failed: ",      "tr": "  Disk sağlık sorgusu başarısız: "},
     "log_disk_lbl":     {"en": "  Disk:",                           "tr": "  Disk:"},
     "log_no_susp":      {"en": "  No suspicious processes.",        "tr": "  Şüpheli süreç yok."},
     "log_susp":         {"en": "  ⚠  Suspicious process:",         "tr": "  ⚠  Şüpheli süreç:"},
+    "log_hash_block":   {"en": "hash on block list:",               "tr": "özet engel listesinde:"},
+    "log_hash_sum":     {"en": "  Hashed {} executables ({} re-hashed) in {:.1f}s — {} blocked, {} allowed, {} unknown",
+                         "tr": "  {} çalıştırılabilir dosya özetlendi ({} yeniden) {:.1f}s — {} engelli, {} izinli, {} bilinmeyen"},
     "log_cl_start":     {"en": "━━━  CLEANUP STARTED  ━━━",         "tr": "━━━  TEMİZLİK BAŞLADI  ━━━"},
     "log_cl_done":      {"en": "━━━  CLEANUP COMPLETE  ━━━",        "tr": "━━━  TEMİZLİK TAMAMLANDI  ━━━"},
     "log_freed":        {"en": "MB freed",                           "tr": "MB temizlendi"},
+    "log_freed_dry":    {"en": "MB would be freed",                  "tr": "MB temizlenebilir"},
+    "log_dry":          {"en": "  Dry run — nothing will be deleted.", "tr": "  Deneme — hiçbir şey silinmeyecek."},
+    "log_dup_lbl":      {"en": "Duplicates",                         "tr": "Yinelenenler"},
+    "log_dup_first":    {"en": "  Duplicates: run Find Duplicates first.",
+                         "tr": "  Yinelenenler: önce Yinelenenleri Bul çalıştırın."},
+    "log_dup_start":    {"en": "━━━  DUPLICATE SEARCH: {}  ━━━",   "tr": "━━━  YİNELENEN ARAMASI: {}  ━━━"},
+    "log_dup_sum":      {"en": "  {} groups, {} redundant copies — {} reclaimable",
+                         "tr": "  {} grup, {} fazla kopya — {} kazanılabilir"},
+    "log_dup_io":       {"en": "  Read {} of {} scanned ({:.2f}%) across {:,} files in {:.1f}s",
+                         "tr": "  Taranan {1} içinden {0} okundu (%{2:.2f}), {3:,} dosya, {4:.1f}s"},
     "log_total_freed":  {"en": "\n  TOTAL FREED:",                  "tr": "\n  TOPLAM TEMİZLENEN:"},
     "log_pf_nf":        {"en": "  Prefetch: no access.",            "tr": "  Prefetch: erişim yok."},
     "log_wu_nf":        {"en": "  WU cache: not accessible.",       "tr": "  WU önbelleği: erişilemiyor."},
+    "log_du_start":     {"en": "━━━  DISK USAGE: {}  ━━━",          "tr": "━━━  DİSK KULLANIMI: {}  ━━━"},
+    "log_du_sum":       {"en": "  {} in {:,} files, {:,} folders ({:,} re-listed) — {:.1f}s",
+                         "tr": "  {} / {:,} dosya, {:,} klasör ({:,} yeniden listelendi) — {:.1f}s"},
+    "log_du_dirs":      {"en": "  Largest folders (own files):",    "tr": "  En büyük klasörler (kendi dosyaları):"},
+    "log_du_files":     {"en": "  Largest files:",                  "tr": "  En büyük dosyalar:"},
     "log_net_start":    {"en": "━━━  NETWORK DIAGNOSTICS  ━━━",     "tr": "━━━  AĞ TEŞHİSİ  ━━━"},
     "log_net_done":     {"en": "━━━  DIAGNOSTICS COMPLETE  ━━━",    "tr": "━━━  TEŞHİS TAMAMLANDI  ━━━"},
     "log_dns_ok":       {"en": "  DNS cache flushed.",              "tr": "  DNS önbelleği temizlendi."},
@@ -222,6 +366,17 @@ S = {
     "log_ram_before":   {"en": "  RAM before:",                     "tr": "  RAM öncesi:"},
     "log_ram_after":    {"en": "  RAM after: ",                     "tr": "  RAM sonrası:"},
     "log_ram_saved":    {"en": "  Freed:   ",                       "tr": "  Kurtarıldı:"},
+    "log_bd_start":     {"en": "━━━  DISK BENCHMARK: {} ({} MB)  ━━━", "tr": "━━━  DİSK TESTİ: {} ({} MB)  ━━━"},
+    "log_bd_done":      {"en": "━━━  DISK BENCHMARK COMPLETE ({} · run #{})  ━━━",
+                         "tr": "━━━  DİSK TESTİ TAMAMLANDI ({} · {}. çalıştırma)  ━━━"},
+    "log_bc_start":     {"en": "━━━  CPU & MEMORY BENCHMARK  ━━━",   "tr": "━━━  İŞLEMCİ & BELLEK TESTİ  ━━━"},
+    "log_bc_done":      {"en": "━━━  CPU BENCHMARK COMPLETE ({} · run #{})  ━━━",
+                         "tr": "━━━  İŞLEMCİ TESTİ TAMAMLANDI ({} · {}. çalıştırma)  ━━━"},
+    "log_bd_err":       {"en": "  Disk benchmark failed: ",       "tr": "  Disk testi başarısız: "},
+    "log_bd_fallback":  {"en": "  ⚠  {} is not writable — benchmarking {} instead.",
+                         "tr": "  ⚠  {} yazılabilir değil — bunun yerine {} test ediliyor."},
+    "log_bd_cached":    {"en": "  ⚠  * page cache not bypassed — results include OS caching.",
+                         "tr": "  ⚠  * sayfa önbelleği atlanamadı — sonuçlar önbelleği içerir."},
     "log_qf_start":     {"en": "━━━  QUICK FIX PRO STARTED  ━━━",  "tr": "━━━  HIZLI DÜZELTME PRO BAŞLADI  ━━━"},
     "log_qf_done":      {"en": "━━━  QUICK FIX COMPLETE  ━━━",     "tr": "━━━  HIZLI DÜZELTME TAMAMLANDI  ━━━"},
     "log_qf_sfc":       {"en": "  [1/3] Running SFC /scannow …",   "tr": "  [1/3] SFC /scannow çalıştırılıyor …"},
@@ -229,8 +384,21 @@ S = {
     "log_qf_dns":       {"en": "  [3/3] Flushing DNS …",           "tr": "  [3/3] DNS temizleniyor …"},
     "log_qf_ok":        {"en": "       ✓ Done",                     "tr": "       ✓ Tamamlandı"},
     "log_qf_err":       {"en": "       ✗ Error: ",                  "tr": "       ✗ Hata: "},
+    "log_qf_rc":        {"en": "       ✗ Exit code {}: {}",         "tr": "       ✗ Çıkış kodu {}: {}"},
+    "log_qf_idle":      {"en": "       ✗ No output for {:.0f}s — stopped.",
+                         "tr": "       ✗ {:.0f}s boyunca çıktı yok — durduruldu."},
+    "log_qf_log":       {"en": "       Full output: {}",            "tr": "       Tam çıktı: {}"},
     "net_ok":           {"en": "Connected ✓",                       "tr": "Bağlı ✓"},
     "net_fail":         {"en": "No internet",                       "tr": "İnternet yok"},
+    "dns_system":       {"en": "system",                            "tr": "sistem"},
+    "log_dns_bench":    {"en": "  Benchmarking {} DNS resolvers…", "tr": "  {} DNS çözümleyici ölçülüyor…"},
+    "log_dns_row":      {"en": "  {:<32} cached {:>4.0f}/{:<4.0f} ms · uncached {:>4.0f}/{:<4.0f} ms (p50/p90) · {:.0%} failed",
+                         "tr": "  {:<32} önbellekli {:>4.0f}/{:<4.0f} ms · önbelleksiz {:>4.0f}/{:<4.0f} ms (p50/p90) · {:.0%} başarısız"},
+    "log_dns_best":     {"en": "  ➜ Fastest resolver: {} ({}) — consider setting it as your DNS server.",
+                         "tr": "  ➜ En hızlı çözümleyici: {} ({}) — DNS sunucusu olarak ayarlamayı düşünün."},
+    "log_dns_keep":     {"en": "  ✓ Your configured resolver {} is the fastest.",
+                         "tr": "  ✓ Yapılandırılmış çözümleyiciniz {} en hızlısı."},
+    "log_dns_none":     {"en": "  ✗ No DNS resolver answered reliably.", "tr": "  ✗ Hiçbir DNS çözümleyici güvenilir yanıt vermedi."},
     "net_flushed":      {"en": "Flushed ✓",                         "tr": "Temizlendi ✓"},
     "sp_miss_title":    {"en": "Missing Library",                   "tr": "Eksik Kütüphane"},
     "sp_miss_msg":      {"en": "speedtest-cli not installed.\npip install speedtest-cli",
@@ -253,13 +421,79 @@ S = {
     "drv_risk":         {"en": "Potential Stability Risk",         "tr": "Olası Kararlılık Riski"},
     "drv_age_old":      {"en": "Driver older than 2 years: {}",    "tr": "2 yıldan eski sürücü: {}"},
     "drv_age_none":     {"en": "No outdated drivers found.",      "tr": "Eski sürücü bulunamadı."},
+    "log_job_busy":     {"en": "  {} is already running.",       "tr": "  {} zaten çalışıyor."},
+    "log_job_cancel":   {"en": "  {} cancelled.",                "tr": "  {} iptal edildi."},
+    "log_job_fail":     {"en": "  {} failed: {}",                "tr": "  {} başarısız: {}"},
+    "job_cancel_tip":   {"en": "Cancel",                          "tr": "İptal"},
+    "gov_status":       {"en": "⚙ self {:.2f}% CPU · {}",      "tr": "⚙ uygulama %{:.2f} CPU · {}"},
+    "gov_throttled":    {"en": " · polling ×{:.1f}",             "tr": " · yoklama ×{:.1f}"},
+    "job_drivers":      {"en": "Driver aging",                    "tr": "Sürücü yaşı"},
+    "log_sched_run":    {"en": "  ⏰  Scheduled {} started (low priority).",
+                         "tr": "  ⏰  Zamanlanmış {} başladı (düşük öncelik)."},
+    "log_sched_wait":   {"en": "  ⏸  Scheduled {} paused — {}.",  "tr": "  ⏸  Zamanlanmış {} duraklatıldı — {}."},
+    "sched_input":      {"en": "user is active",                  "tr": "kullanıcı etkin"},
+    "sched_load":       {"en": "system is busy",                  "tr": "sistem meşgul"},
+    "job_si_reval":     {"en": "System info check",              "tr": "Sistem bilgisi denetimi"},
+    "log_si_changed":   {"en": "  System info changed — {}: {}",  "tr": "  Sistem bilgisi değişti — {}: {}"},
+    "log_lang_switch":  {"en": "  Language switched in {:.1f} ms ({} of {} widgets, {} strings)",
+                         "tr": "  Dil {:.1f} ms içinde değiştirildi ({}/{} bileşen, {} metin)"},
 }
 
+# S is the authoring format; T() reads a flat {key: text} table compiled once
+# per language (English fallback baked in), so a lookup is a single dict hit.
 _LANG = "en"
-def set_lang(code: str): global _LANG; _LANG = code
+_TABLES: dict = {}
+
+def _compile_lang(code: str) -> dict:
+    tbl = {k: (e.get(code) or e.get("en", f"[{k}]")) for k, e in S.items()}
+    _TABLES[code] = tbl
+    return tbl
+
+_TABLE = _compile_lang(_LANG)
+
+def set_lang(code: str):
+    global _LANG, _TABLE
+    _LANG  = code
+    _TABLE = _TABLES.get(code) or _compile_lang(code)
+
 def T(k: str) -> str:
-    e = S.get(k)
-    return (e.get(_LANG) or e.get("en", f"[{k}]")) if e else f"[{k}]"
+    t = _TABLE.get(k)
+    return t if t is not None else f"[{k}]"
+
+
+class TranslationBinder:
+    """Registry of re-render callbacks, grouped by the notebook tab owning the
+    widget ("" = always visible: header, tab titles, console).  A language
+    switch re-renders only the visible scopes; the others are marked stale and
+    re-rendered by reveal() the first time their tab is shown."""
+
+    def __init__(self):
+        self._scopes: dict = {}
+        self._stale: set   = set()
+
+    def add(self, scope: str, fn):
+        self._scopes.setdefault(scope, []).append(fn)
+        return fn
+
+    def text(self, scope: str, widget, key: str, fmt: str = "{}"):
+        self.add(scope, lambda: widget.config(text=fmt.format(T(key))))
+        return widget
+
+    def switch(self, visible: str) -> int:
+        self._stale = set(self._scopes) - {"", visible}
+        return self._render("") + self._render(visible)
+
+    def reveal(self, scope: str) -> int:
+        if scope not in self._stale: return 0
+        self._stale.discard(scope)
+        return self._render(scope)
+
+    def _render(self, scope: str) -> int:
+        fns = self._scopes.get(scope, ())
+        for fn in fns: fn()
+        return len(fns)
+
+    def __len__(self): return sum(len(v) for v in self._scopes.values())
 
 
 # ════════════════════════════════════════════════════════════════════════════════
@@ -327,6 +561,32 @@ BSOD_DB = {
         "Ağ/donanım sürücüsü çok yüksek IRQL'de sayfalanmış belleğe erişti.",
         "Update network adapter and chipset drivers.",
         "Ağ adaptörü ve yonga seti sürücülerini güncelleyin."),
+    "0x00000124": _bsod("WHEA_UNCORRECTABLE_ERROR","Hardware Failure","Donanım Arızası",
+        "The CPU reported an uncorrectable hardware error — often voltage, heat or OC.",
+        "İşlemci düzeltilemeyen donanım hatası bildirdi — genellikle voltaj, ısı veya OC.",
+        "Reset BIOS/OC to defaults. Check CPU temps and PSU. Update BIOS.",
+        "BIOS/OC ayarlarını varsayılana döndürün. İşlemci ısısını ve PSU'yu kontrol edin. BIOS güncelleyin."),
+    # Pseudo-codes for event-log records that carry no bugcheck of their own
+    "KERNEL_POWER_41": _bsod("Kernel-Power 41","Hang / Power Loss","Donma / Güç Kaybı",
+        "Windows restarted without shutting down cleanly — hard hang, power cut or PSU trip.",
+        "Windows düzgün kapanmadan yeniden başladı — donma, elektrik kesintisi veya PSU.",
+        "Check PSU and power cabling. Test RAM. Watch temperatures under load.",
+        "PSU ve güç kablolarını kontrol edin. RAM'i test edin. Yük altında ısıyı izleyin."),
+    "EVENT_6008": _bsod("Unexpected Shutdown","Hang / Power Loss","Donma / Güç Kaybı",
+        "The previous shutdown was unexpected — no bugcheck was recorded.",
+        "Önceki kapanma beklenmedikti — hata kodu kaydedilmedi.",
+        "Correlate with Kernel-Power 41 and WHEA events. Check PSU and temps.",
+        "Kernel-Power 41 ve WHEA olaylarıyla karşılaştırın. PSU ve ısıyı kontrol edin."),
+    "WHEA_FATAL": _bsod("WHEA Fatal Hardware Error","Hardware Failure","Donanım Arızası",
+        "The hardware error architecture logged a fatal CPU, memory or PCIe error.",
+        "Donanım hata mimarisi ölümcül bir işlemci, bellek veya PCIe hatası kaydetti.",
+        "Remove overclocks, reseat RAM/GPU, update BIOS and chipset drivers.",
+        "Hız aşırtmayı kaldırın, RAM/GPU'yu yeniden takın, BIOS ve yonga seti sürücülerini güncelleyin."),
+    "WHEA_CORRECTED": _bsod("WHEA Corrected Hardware Error","Hardware Warning","Donanım Uyarısı",
+        "A hardware error was detected and corrected — repeated ones predict failures.",
+        "Bir donanım hatası algılandı ve düzeltildi — tekrarlaması arızanın habercisidir.",
+        "Note the component (CPU/memory/PCIe). Update BIOS; test RAM if memory.",
+        "Bileşeni not edin (İşlemci/bellek/PCIe). BIOS güncelleyin; bellekse RAM'i test edin."),
     "UNKNOWN": _bsod("Unknown Error Code","Unclassified","Sınıflandırılmamış",
         "Error code not in local database.",
         "Hata kodu yerel veritabanında yok.",
@@ -338,6 +598,12 @@ def BF(entry, field):
     v = entry.get(field, "")
     return (v.get(_LANG) or v.get("en", "")) if isinstance(v, dict) else v
 
+def bsod_entry(code: str) -> dict:
+    """BSOD_DB entry for a bugcheck ("0x0000009f" / "0x0000009F") or pseudo-code."""
+    c = (code or "").strip()
+    if c[:2].lower() == "0x": c = "0x" + c[2:].upper()
+    return BSOD_DB.get(c, BSOD_DB["UNKNOWN"])
+
 # Mapping driver filenames to friendly names (bilingual via S keys used in UI)
 DRIVER_MAP = {
     "nvlddmkm.sys": "NVIDIA Graphics Driver",
@@ -346,6 +612,12 @@ DRIVER_MAP = {
     "ntfs.sys":     "Windows File System",
 }
 
+# Drivers that ship with Windows sit in every kernel dump's module list, so
+# finding one says nothing; it is only blamed for its own bugchecks.
+INBOX_DRIVERS = {
+    "ntfs.sys": {"0x00000024"},                             # NTFS_FILE_SYSTEM
+}
+
 # Precompile regex to search for known drivers in text/binary dumps
 _DRIVER_RE = re.compile(r"\b(nvlddmkm|igdkmd64|rtwlane|ntfs)\.sys\b", re.IGNORECASE)
 
@@ -403,6 +675,533 @@ RECOMM_MAP = {
 }
 
 
+# ════════════════════════════════════════════════════════════════════════════════
+#  TRACING  (spans → Chrome trace-event JSON; one attribute check when disabled)
+# ════════════════════════════════════════════════════════════════════════════════
+class _NullSpan:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tr", "name", "cat", "args", "t0")
+
+    def __init__(self, tr, name, cat, args):
+        self.tr, self.name, self.cat, self.args = tr, name, cat, args
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, etype, *_):
+        if etype is not None: self.args["error"] = etype.__name__
+        self.tr.record(self.name, self.cat, self.t0, time.perf_counter(), self.args)
+        return False
+
+
+class Tracer:
+    """Ring buffer of complete ("ph": "X") trace events.  span() returns a
+    shared no-op context while disabled, so instrumented code pays one
+    attribute check.  export() writes a file chrome://tracing / Perfetto load."""
+
+    def __init__(self, capacity: int = 50_000):
+        self.enabled = bool(os.environ.get("PCANALYST_TRACE"))
+        self._events = collections.deque(maxlen=capacity)
+        self._threads: dict = {}
+        self._tlock = threading.Lock()      # workers add threads while export() reads
+        self._t0 = time.perf_counter()
+
+    def span(self, name: str, cat: str = "op", **args):
+        if not self.enabled: return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def record(self, name: str, cat: str, t0: float, t1: float, args: dict = None):
+        th = threading.current_thread()
+        if self._threads.get(th.ident) != th.name:
+            with self._tlock: self._threads[th.ident] = th.name
+        self._events.append((name, cat, t0, t1 - t0, th.ident, args or {}))
+
+    def traced(self, name: str = None, cat: str = "op"):
+        """Decorator form of span(); the wrapped call is direct when disabled."""
+        def deco(fn):
+            label = name or fn.__name__
+            @functools.wraps(fn)
+            def wrapper(*a, **kw):
+                if not self.enabled: return fn(*a, **kw)
+                with _Span(self, label, cat, {}): return fn(*a, **kw)
+            return wrapper
+        return deco
+
+    def clear(self):
+        self._events.clear()
+
+    def __len__(self): return len(self._events)
+
+    def slowest(self, n: int = 200) -> list:
+        """Recent events as dicts, longest first."""
+        evs = heapq.nlargest(n, list(self._events), key=lambda e: e[3])
+        return [{"name": nm, "cat": cat, "ms": dur * 1000,
+                 "thread": self._threads.get(tid, str(tid)),
+                 "at": datetime.fromtimestamp(time.time() - (time.perf_counter() - t0)),
+                 "args": args} for nm, cat, t0, dur, tid, args in evs]
+
+    def export(self, path: str) -> int:
+        pid, evs = os.getpid(), list(self._events)
+        with self._tlock: threads = list(self._threads.items())
+        out = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": nm}} for tid, nm in threads]
+        out += [{"name": nm, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                 "ts": round((t0 - self._t0) * 1e6, 1), "dur": round(dur * 1e6, 1),
+                 "args": {k: str(v) for k, v in args.items()}}
+                for nm, cat, t0, dur, tid, args in evs]
+        save_json(path, {"traceEvents": out, "displayTimeUnit": "ms"})
+        return len(evs)
+
+
+TRACE  = Tracer()
+span   = TRACE.span
+traced = TRACE.traced
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  JOBS  (bounded worker pool · one job per kind in flight · cooperative cancel)
+# ════════════════════════════════════════════════════════════════════════════════
+class JobCancelled(Exception):
+    """Raised by CancelToken.check() to unwind a cancelled job."""
+
+
+class CancelToken:
+    """Cooperative cancel flag.  Calling the token returns True once cancelled,
+    so it plugs straight into the `cancel=` parameters of the scanners."""
+    __slots__ = ("_ev",)
+
+    def __init__(self): self._ev = threading.Event()
+    def __call__(self) -> bool: return self._ev.is_set()
+    def cancel(self): self._ev.set()
+
+    def check(self):
+        if self._ev.is_set(): raise JobCancelled()
+
+
+class Job:
+    __slots__ = ("kind", "token", "state", "error", "t0", "t1")
+
+    def __init__(self, kind: str, token: CancelToken = None):
+        self.kind, self.token, self.state, self.error = kind, token or CancelToken(), "queued", None
+        self.t0, self.t1 = time.time(), None
+
+    @property
+    def background(self) -> bool: return isinstance(self.token, PoliteToken)
+
+    @property
+    def active(self) -> bool: return self.state in ("queued", "running")
+
+    def elapsed(self) -> float: return (self.t1 or time.time()) - self.t0
+
+
+class JobExecutor:
+    """Runs every button action on a bounded pool.  submit() returns None while
+    a job of the same kind is queued or running, so a double-click can't start
+    a second Deep Scan.  Workers are called as fn(*args, cancel=token);
+    `on_change(job)` fires from the worker thread on every state change.
+    A job submitted with a PoliteToken runs in background mode."""
+
+    def __init__(self, workers: int = 4, on_change=None):
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="job")
+        self._jobs: dict = {}
+        self._lock = threading.Lock()
+        self.on_change = on_change
+
+    def submit(self, kind: str, fn, *args, token: CancelToken = None):
+        with self._lock:
+            cur = self._jobs.get(kind)
+            if cur and cur.active: return None
+            job = self._jobs[kind] = Job(kind, token)
+        self._notify(job)
+        self._pool.submit(self._run, job, fn, args)
+        return job
+
+    def _run(self, job: Job, fn, args):
+        if job.token():
+            job.state, job.t1 = "cancelled", time.time(); self._notify(job); return
+        job.state, job.t0 = "running", time.time(); self._notify(job)
+        try:
+            with background_mode() if job.background else contextlib.nullcontext():
+                fn(*args, cancel=job.token)
+            job.state = "cancelled" if job.token() else "done"
+        except JobCancelled:
+            job.state = "cancelled"
+        except Exception as e:
+            job.state, job.error = "failed", f"{type(e).__name__}: {e}"
+        finally:
+            job.t1 = time.time(); self._notify(job)
+
+    def _notify(self, job: Job):
+        if self.on_change: self.on_change(job)
+
+    def cancel(self, kind: str) -> bool:
+        job = self._jobs.get(kind)
+        if not (job and job.active): return False
+        job.token.cancel(); return True
+
+    def cancel_all(self):
+        for kind in list(self._jobs): self.cancel(kind)
+
+    def jobs(self) -> list:
+        with self._lock: return list(self._jobs.values())
+
+    def shutdown(self):
+        self.cancel_all()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_cmd(cmd, timeout: float = 60, cancel=None) -> subprocess.CompletedProcess:
+    """subprocess.run(capture_output=True) that polls `cancel` and kills the
+    child when it fires (JobCancelled) or when `timeout` passes."""
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          creationflags=child_flags()) as p:
+        demote_child(p.pid)
+        while True:
+            try:
+                out, err = p.communicate(timeout=0.25); break
+            except subprocess.TimeoutExpired:
+                stop = bool(cancel and cancel())
+                if stop or time.monotonic() > deadline:
+                    p.kill(); p.communicate()
+                    if stop: raise JobCancelled()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+        account_child(p)
+    return subprocess.CompletedProcess(cmd, p.returncode, out, err)
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  BACKGROUND MODE  (low CPU / I/O priority · back off on user input or load)
+# ════════════════════════════════════════════════════════════════════════════════
+# Scheduled jobs run their worker thread in Windows background mode (lower CPU,
+# I/O and memory priority) and start their children in BELOW_NORMAL with low
+# I/O priority.  Foreground jobs are untouched.  Background mode is per thread;
+# POSIX threads can't raise their nice value back afterwards, so there the
+# worker thread itself is left alone and only children are demoted.
+_BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
+_CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)   # Windows-only attribute
+_THREAD_MODE_BACKGROUND_BEGIN, _THREAD_MODE_BACKGROUND_END = 0x00010000, 0x00020000
+_bg = threading.local()
+
+def in_background() -> bool:
+    return getattr(_bg, "on", False)
+
+@contextlib.contextmanager
+def background_mode():
+    k32 = ctypes.windll.kernel32 if os.name == "nt" else None
+    if k32: k32.SetThreadPriority(k32.GetCurrentThread(), _THREAD_MODE_BACKGROUND_BEGIN)
+    _bg.on = True
+    try: yield
+    finally:
+        _bg.on = False
+        if k32: k32.SetThreadPriority(k32.GetCurrentThread(), _THREAD_MODE_BACKGROUND_END)
+
+def child_flags() -> int:
+    """Popen creationflags: no console window, below-normal class in background."""
+    flags = _CREATE_NO_WINDOW
+    if os.name == "nt" and in_background(): flags |= _BELOW_NORMAL_PRIORITY_CLASS
+    return flags
+
+def demote_child(pid: int):
+    """Low I/O priority (and nice 10 off Windows) for a background job's child."""
+    if not (in_background() and PSUTIL_OK): return
+    try:
+        p = psutil.Process(pid)
+        if os.name == "nt": p.ionice(psutil.IOPRIO_LOW)
+        else: p.nice(10); p.ionice(psutil.IOPRIO_CLASS_IDLE)
+    except (psutil.Error, OSError, AttributeError): pass
+
+class _LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+def user_idle_seconds():
+    """Seconds since the last keyboard/mouse input, or None if unknown."""
+    if os.name != "nt": return None
+    li = _LASTINPUTINFO(ctypes.sizeof(_LASTINPUTINFO), 0)
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(li)): return None
+    return ((ctypes.windll.kernel32.GetTickCount() - li.dwTime) & 0xFFFFFFFF) / 1000
+
+class Backoff:
+    """busy() names why a background job should wait — "input" while the user
+    was active in the last `idle` seconds, "load" while system CPU (measured
+    between calls from cpu_times, so other cpu_percent users aren't disturbed)
+    is above `cpu` % — or returns None."""
+
+    def __init__(self, idle: float = 60, cpu: float = 60, idle_fn=user_idle_seconds):
+        self.idle, self.cpu, self._idle_fn, self._last = idle, cpu, idle_fn, None
+
+    def load(self):
+        if not PSUTIL_OK: return None
+        t = psutil.cpu_times()
+        prev, self._last = self._last, (sum(t), t.idle)
+        if not prev or self._last[0] <= prev[0]: return None
+        return 100 * (1 - (self._last[1] - prev[1]) / (self._last[0] - prev[0]))
+
+    def busy(self):
+        idle = self._idle_fn()
+        if idle is not None and idle < self.idle: return "input"
+        load = self.load()
+        if load is not None and load > self.cpu: return "load"
+        return None
+
+class PoliteToken(CancelToken):
+    """CancelToken whose check() also waits, polling every `poll` seconds,
+    while `gate.busy()`; `on_wait(reason)` fires once per pause."""
+    __slots__ = ("gate", "poll", "on_wait", "waited")
+
+    def __init__(self, gate: Backoff, poll: float = 5.0, on_wait=None):
+        super().__init__()
+        self.gate, self.poll, self.on_wait, self.waited = gate, poll, on_wait, 0.0
+
+    def check(self):
+        super().check()
+        reason = self.gate.busy()
+        if reason and self.on_wait: self.on_wait(reason)
+        while reason:
+            t = time.monotonic()
+            if self._ev.wait(self.poll): raise JobCancelled()
+            self.waited += time.monotonic() - t
+            reason = self.gate.busy()
+
+# schedule.json — jobs run daily at "at" (optionally only on "days"), or once
+# the user has been idle for "idle" seconds and the last run is "every" seconds
+# old.  A missed time slot is caught up within "grace" hours:
+#   {"jobs": [{"job": "deep_scan", "at": "02:30"},
+#             {"job": "drivers",   "at": "03:00", "days": ["sun"]},
+#             {"job": "cleanup",   "idle": 900, "every": 86400}],
+#    "backoff": {"idle": 60, "cpu": 60}}
+SCHEDULE_JOBS = ("deep_scan", "drivers", "cleanup")
+_AT_RE = re.compile(r"\s*([01]?\d|2[0-3]):([0-5]\d)\s*$")
+
+def _schedule_entry(e) -> dict:
+    """A validated copy of one schedule.json job (parsed "at" in "_hm",
+    three-letter lower-case "days"), or None when it cannot be run."""
+    if not isinstance(e, dict) or e.get("job") not in SCHEDULE_JOBS: return None
+    out = dict(e)
+    try:
+        for k in ("idle", "every", "grace"):
+            if k in e: out[k] = float(e[k])
+    except (TypeError, ValueError):
+        return None
+    if "at" in e:
+        m = _AT_RE.match(e["at"]) if isinstance(e["at"], str) else None
+        if not m: return None
+        out["_hm"] = (int(m.group(1)), int(m.group(2)))
+    elif "idle" not in e:
+        return None
+    days = e.get("days")
+    if days:
+        days = [days] if isinstance(days, str) else days if isinstance(days, list) else ()
+        out["days"] = {str(d).strip()[:3].lower() for d in days}
+    return out
+
+class ScanScheduler:
+    def __init__(self, path: str = None, state_path: str = None):
+        self.path  = path or app_path("schedule.json")
+        cfg = load_json(self.path, {})
+        if not isinstance(cfg, dict): cfg = {}
+        jobs = cfg.get("jobs")
+        self.entries = [e for e in map(_schedule_entry, jobs if isinstance(jobs, list) else ()) if e]
+        bo = cfg.get("backoff") if isinstance(cfg.get("backoff"), dict) else {}
+        self.backoff = {k: v for k, v in bo.items()
+                        if k in ("idle", "cpu") and isinstance(v, (int, float))}
+        self._state_path = state_path or app_path("schedule_state.json")
+        last = load_json(self._state_path, {})
+        self.last = {k: v for k, v in (last.items() if isinstance(last, dict) else ())
+                     if isinstance(v, (int, float))}
+
+    @staticmethod
+    def key(e: dict) -> str:
+        return f"{e['job']}@{e.get('at') or 'idle'}"
+
+    def due(self, now: datetime, idle) -> list:
+        out = []
+        for e in self.entries:
+            k = self.key(e)
+            if k not in self.last:                       # new entry: start from now, no catch-up
+                self.last[k] = now.timestamp(); continue
+            last = self.last[k]
+            if "at" in e:
+                h, m = e["_hm"]
+                slot = now.replace(hour=h, minute=m, second=0, microsecond=0)
+                if slot > now: slot -= timedelta(days=1)
+                if e.get("days") and slot.strftime("%a").lower() not in e["days"]: continue
+                if last < slot.timestamp() and now - slot <= timedelta(hours=e.get("grace", 12)):
+                    out.append(e)
+            elif idle is not None and idle >= e["idle"] and \
+                 now.timestamp() - last >= e.get("every", 86400):
+                out.append(e)
+        return out
+
+    def mark(self, e: dict, now: datetime):
+        self.last[self.key(e)] = now.timestamp()
+        save_json(self._state_path, self.last)
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  SELF-MONITOR  (own CPU + memory · AIMD governor over polling intervals)
+# ════════════════════════════════════════════════════════════════════════════════
+# POSIX folds reaped children into the parent's children_user/system times.
+# Windows doesn't, so run_cmd / stream_cmd add each child's kernel + user time
+# (GetProcessTimes on the still-open handle) to a process-wide counter.
+_child_cpu, _child_lock = [0.0], threading.Lock()
+
+def account_child(p: subprocess.Popen):
+    if os.name != "nt": return
+    ft = (ctypes.c_ulonglong * 4)()                      # creation, exit, kernel, user
+    try:
+        ok = ctypes.windll.kernel32.GetProcessTimes(
+            int(p._handle), *(ctypes.byref(ft, 8 * i) for i in range(4)))
+    except (AttributeError, OSError): return
+    if ok:
+        with _child_lock: _child_cpu[0] += (ft[2] + ft[3]) / 1e7
+
+class OverheadGovernor:
+    """The app's own CPU use (process + finished children, as % of all logical
+    CPUs, EWMA over ticks) and RSS.  `scale` multiplies the polling
+    intervals: ×1.5 per tick while over `budget`, ÷1.25 per tick once below
+    half of it, bounded to [1, MAX_SCALE].  defer() tells non-urgent
+    collectors to skip their turn while over budget."""
+
+    MAX_SCALE = 16.0
+
+    def __init__(self, budget: float = 0.5, alpha: float = 0.3, proc=None):
+        self.budget, self.alpha = budget, alpha
+        self.scale, self.cpu, self.rss = 1.0, 0.0, 0
+        self._proc = proc or (psutil.Process() if PSUTIL_OK else None)
+        self._ncpu = (psutil.cpu_count() if PSUTIL_OK else None) or os.cpu_count() or 1
+        self._last = None
+
+    @classmethod
+    def from_config(cls, path: str = None):
+        """governor.json: {"budget": 0.5}  (% of total CPU)."""
+        cfg = load_json(path or app_path("governor.json"), {})
+        return cls(float(cfg.get("budget", 0.5)))
+
+    def _cpu_seconds(self) -> float:
+        t = self._proc.cpu_times()
+        with _child_lock: kids = _child_cpu[0]
+        return (t.user + t.system + getattr(t, "children_user", 0.0)
+                + getattr(t, "children_system", 0.0) + kids)
+
+    def tick(self, now: float = None) -> float:
+        if self._proc is None: return self.scale
+        now = time.monotonic() if now is None else now
+        cs = self._cpu_seconds()
+        if self._last and now > self._last[0]:
+            pct = 100 * (cs - self._last[1]) / (now - self._last[0]) / self._ncpu
+            self.cpu = pct if self._last[2] else self.cpu + self.alpha * (pct - self.cpu)
+        self._last = (now, cs, not self._last)
+        self.rss = self._proc.memory_info().rss
+        if self.cpu > self.budget:       self.scale = min(self.MAX_SCALE, self.scale * 1.5)
+        elif self.cpu < self.budget / 2: self.scale = max(1.0, self.scale / 1.25)
+        return self.scale
+
+    @property
+    def over(self) -> bool: return self.cpu > self.budget
+
+    def defer(self) -> bool: return self.over
+
+    def interval(self, base_ms: int) -> int: return int(base_ms * self.scale)
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  PROCESS RUNNER  (streamed output → log file · % progress · inactivity timeout)
+# ════════════════════════════════════════════════════════════════════════════════
+StreamResult = namedtuple("StreamResult", "returncode log_path tail seconds")
+
+_PCT_RE = re.compile(r"(\d{1,3}(?:[.,]\d+)?)\s*%")
+
+def _line_pct(line: str):
+    """Last percentage on a progress line ("[===  45.0% ===]", "Verification
+    62% complete."), or None."""
+    m = _PCT_RE.findall(line)
+    if not m: return None
+    v = float(m[-1].replace(",", "."))
+    return v if 0 <= v <= 100 else None
+
+def _pump(stream, q: queue.Queue):
+    for chunk in iter(lambda: stream.read1(4096), b""): q.put(chunk)
+    q.put(None)
+
+LOG_KEEP = 20                                   # newest run logs kept per command name
+_log_seq = itertools.count(1)
+
+def _run_log(name: str) -> str:
+    """logs/<name>_<time>_<pid>-<n>.log (unique even within one second); older
+    logs of the same command beyond LOG_KEEP are deleted."""
+    path = app_path("logs", f"{name}_{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}-{next(_log_seq)}.log")
+    old = sorted(glob.glob(os.path.join(glob.escape(os.path.dirname(path)), f"{glob.escape(name)}_[0-9]*.log")),
+                 key=os.path.getmtime)
+    for f in old[:max(0, len(old) - LOG_KEEP + 1)]:
+        try: os.remove(f)
+        except OSError: pass
+    return path
+
+def stream_cmd(cmd, name: str = None, idle_timeout: float = 120, on_progress=None,
+               on_line=None, cancel=None) -> StreamResult:
+    """Run `cmd`, reading stdout+stderr as it arrives.  Lines (split on CR as
+    well as LF, since DISM/SFC redraw progress in place) go to a log file
+    under logs/ and to `on_line`; percentages go to `on_progress(pct)`.
+    The child is killed when it prints nothing for the inactivity limit —
+    `idle_timeout`, stretched to 3× the longest gap seen between progress
+    steps — raising TimeoutExpired, or when `cancel` fires (JobCancelled)."""
+    name = name or os.path.basename(str(cmd[0])).split(".")[0]
+    log_path = _run_log(name)
+    tail = collections.deque(maxlen=20)
+    q, t0 = queue.Queue(), time.monotonic()
+    with open(log_path, "w", encoding="utf-8") as log, \
+         subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          stdin=subprocess.DEVNULL,
+                          creationflags=child_flags()) as p:
+        demote_child(p.pid)
+        threading.Thread(target=_pump, args=(p.stdout, q), daemon=True).start()
+        dec, buf, last_pct = None, "", None
+        last_out = last_step = time.monotonic()
+        limit = idle_timeout
+        while True:
+            if cancel and cancel():             # checked per chunk too: a chatty child still stops
+                p.kill(); raise JobCancelled()
+            try:
+                chunk = q.get(timeout=0.25)
+            except queue.Empty:
+                if time.monotonic() - last_out > limit:
+                    p.kill(); raise subprocess.TimeoutExpired(cmd, limit)
+                continue
+            if chunk is not None:
+                if dec is None:     # sfc writes UTF-16LE; everything else is 8-bit
+                    utf16 = chunk[1:64:2].count(0) > len(chunk[1:64:2]) // 2
+                    dec = codecs.getincrementaldecoder(
+                        "utf-16-le" if utf16 else "utf-8")(errors="replace")
+                buf += dec.decode(chunk)
+                last_out = time.monotonic()
+            *lines, buf = re.split(r"\r\n|\r|\n", buf) if chunk is not None else [buf, ""]
+            for line in lines:
+                line = line.strip()
+                if not line: continue
+                log.write(line + "\n"); tail.append(line)
+                if on_line: on_line(line)
+                pct = _line_pct(line)
+                if pct is not None and pct != last_pct:
+                    if last_pct is not None and pct > last_pct:
+                        now = time.monotonic()
+                        limit = max(limit, 3 * (now - last_step)); last_step = now
+                    last_pct = pct
+                    if on_progress: on_progress(pct)
+            if chunk is None: break
+        rc = p.wait()
+        account_child(p)
+    return StreamResult(rc, log_path, list(tail), time.monotonic() - t0)
+
+
 # ════════════════════════════════════════════════════════════════════════════════
 #  HELPER WIDGETS  (DRY)
 # ════════════════════════════════════════════════════════════════════════════════
@@ -431,135 +1230,1859 @@ def progressbar(parent, color, key):
     st.configure(sn, background=color, troughcolor=C["surface"], thickness=18)
     return ttk.Progressbar(parent, mode="determinate", style=sn)
 
-def ps_query(script: str, timeout: int = 15) -> str:
+def fmt_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024: return f"{n:.1f} {unit}" if unit != "B" else f"{n:.0f} B"
+        n /= 1024
+    return f"{n:.2f} TB"
+
+def _sort_key(v):
+    try:    return (0, float(v), "")
+    except (TypeError, ValueError): return (1, 0.0, str(v).lower())
+
+class RowIndex:
+    """Row store behind VirtualTable.  `rows` holds the records in insertion
+    order; `view` holds row positions in display order after sort + filter,
+    so sorting and filtering never touch the widget."""
+
+    def __init__(self, fmt, key=None):
+        self.fmt  = fmt                 # record -> tuple of cell values
+        self.key  = key                 # record -> identity, for apply()
+        self.rows: list = []
+        self.view: list = []
+        self._pos = {}                  # key -> row position (keyed tables only)
+        self.sort_col, self.sort_desc, self.needle = None, False, ""
+        self._hay   = None              # lower-cased row text, built on demand
+        self._order = None              # sorted row positions, pre-filter
+
+    def __len__(self): return len(self.view)
+
+    def values(self, pos: int) -> tuple: return self.fmt(self.rows[self.view[pos]])
+
+    def clear(self):
+        self.rows, self.view, self._hay, self._order, self._pos = [], [], None, None, {}
+
+    def apply(self, upserts, removed=()):
+        """Row diff by key: replace or append `upserts`, drop `removed` keys."""
+        key = self.key
+        if removed:
+            gone = set(removed)
+            self.rows = [r for r in self.rows if key(r) not in gone]
+            self._pos = {key(r): i for i, r in enumerate(self.rows)}
+        for r in upserts:
+            i = self._pos.get(key(r))
+            if i is None: self._pos[key(r)] = len(self.rows); self.rows.append(r)
+            else:         self.rows[i] = r
+        self._hay, self._order = None, None
+        self.rebuild()
+
+    def extend(self, recs):
+        start = len(self.rows)
+        self.rows.extend(recs)
+        if self.sort_col is None and not self.needle:
+            self.view.extend(range(start, len(self.rows)))
+            self._hay = None
+        else:
+            self._order = None
+            self.rebuild()
+
+    def sort(self, col, desc: bool = False):
+        self.sort_col, self.sort_desc, self._order = col, desc, None
+        self.rebuild()
+
+    def filter(self, needle: str):
+        self.needle = needle.strip().lower()
+        self.rebuild()
+
+    def rebuild(self):
+        order = range(len(self.rows))
+        if self.sort_col is not None:
+            if self._order is None:
+                c, fmt, rows = self.sort_col, self.fmt, self.rows
+                self._order = sorted(order, key=lambda i: _sort_key(fmt(rows[i])[c]),
+                                     reverse=self.sort_desc)
+            order = self._order
+        if self.needle:
+            if self._hay is None or len(self._hay) != len(self.rows):
+                self._hay = ["\x00".join(map(str, self.fmt(r))).lower()
+                             for r in self.rows]
+            hay, n = self._hay, self.needle
+            order = [i for i in order if n in hay[i]]
+        self.view = list(order)
+
+    def invalidate(self):
+        """Cell text changed (e.g. language switch) — re-derive sort/filter."""
+        self._hay, self._order = None, None
+        if self.sort_col is not None or self.needle: self.rebuild()
+
+
+class VirtualTable(tk.Frame):
+    """Treeview that materialises only the rows on screen.  Data lives in a
+    RowIndex; scrolling re-fills a fixed set of item slots, so cost per
+    scroll step is the visible row count, not the table size.  Worker threads
+    hand rows over with post(), which coalesces into one UI callback."""
+
+    def __init__(self, parent, cols, fmt, height=10, bg=None, key=None):
+        super().__init__(parent, bg=bg or C["surface"])
+        self.index = RowIndex(fmt, key)
+        self._cols = cols
+        self.tree = ttk.Treeview(self, columns=[c for c, _, _ in cols],
+                                 show="headings", height=height, selectmode="browse")
+        for col, key, w in cols:
+            self.tree.heading(col, text=T(key), command=lambda c=col: self.sort_by(c))
+            self.tree.column(col, width=w, anchor="w")
+        self.sb = ttk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.sb.pack(side="right", fill="y")
+        self._top, self._rows, self._sel = 0, height, None
+        self._shown: list = []          # values currently in each item slot
+        self._pending, self._posted = [], False
+        self._lock = threading.Lock()
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll(-e.delta // 120 * 3))
+        self.tree.bind("<Button-4>",   lambda e: self._scroll(-3))
+        self.tree.bind("<Button-5>",   lambda e: self._scroll(3))
+        self.tree.bind("<Up>",    lambda e: self._move(-1))
+        self.tree.bind("<Down>",  lambda e: self._move(1))
+        self.tree.bind("<Prior>", lambda e: self._move(-self._rows))
+        self.tree.bind("<Next>",  lambda e: self._move(self._rows))
+
+    # ── data ──────────────────────────────────────────────────────────────────
+    def post(self, recs):
+        """Thread-safe append; any number of posts share one UI callback."""
+        with self._lock:
+            self._pending.extend(recs)
+            if self._posted: return
+            self._posted = True
+        self.after(0, self._drain)
+
+    def _drain(self):
+        with self._lock:
+            recs, self._pending, self._posted = self._pending, [], False
+        self.extend(recs)
+
+    def extend(self, recs):
+        self.index.extend(recs); self._render()
+
+    def clear(self):
+        self.index.clear(); self._top, self._sel = 0, None; self._render()
+
+    def apply(self, upserts, removed=()):
+        """Keyed row diff (needs `key=`); the selection follows its record."""
+        ix = self.index
+        sel = ix.key(ix.rows[self._sel]) if self._sel is not None else None
+        ix.apply(upserts, removed)
+        self._sel = ix._pos.get(sel)
+        self._render()
+
+    @property
+    def records(self) -> list: return self.index.rows
+
+    def selected(self):
+        return self.index.rows[self._sel] if self._sel is not None else None
+
+    def refresh(self):
+        self.index.invalidate(); self._render()
+
+    def retranslate(self):
+        for col, key, _ in self._cols: self.tree.heading(col, text=T(key))
+
+    def sort_by(self, col):
+        c = [k for k, _, _ in self._cols].index(col)
+        desc = (self.index.sort_col == c and not self.index.sort_desc)
+        self.index.sort(c, desc); self._render()
+
+    def set_filter(self, needle: str):
+        self.index.filter(needle); self._top = 0; self._render()
+
+    # ── viewport ──────────────────────────────────────────────────────────────
+    @traced("VirtualTable.render", cat="ui")
+    def _render(self):
+        ix, n = self.index, len(self.index)
+        self._top = max(0, min(self._top, n - self._rows))
+        vis  = max(0, min(self._rows, n - self._top))
+        kids, shown = self.tree.get_children(), self._shown
+        if len(kids) > vis: self.tree.delete(*kids[vis:]); del shown[vis:]
+        sel_iid = None
+        for k in range(vis):
+            pos = self._top + k
+            vals = ix.values(pos)
+            if k >= len(kids):
+                self.tree.insert("", "end", iid=str(k), values=vals); shown.append(vals)
+            elif shown[k] != vals:                  # unchanged slots cost no Tk call
+                self.tree.item(kids[k], values=vals); shown[k] = vals
+            if ix.view[pos] == self._sel: sel_iid = str(k)
+        self.tree.selection_set(sel_iid if sel_iid else ())
+        self.sb.set(self._top / n if n else 0.0,
+                    (self._top + vis) / n if n else 1.0)
+
+    def _on_resize(self, e):
+        rows = max(1, e.height // 24 - 1)
+        if rows != self._rows: self._rows = rows; self._render()
+
+    def _on_select(self, _):
+        sel = self.tree.selection()
+        if sel and self._top + int(sel[0]) < len(self.index):
+            self._sel = self.index.view[self._top + int(sel[0])]
+
+    def _scroll(self, units: int):
+        self._top += units; self._render()
+        return "break"
+
+    def _yview(self, *a):
+        if a[0] == "moveto":  self._top = int(float(a[1]) * len(self.index))
+        elif a[0] == "scroll":
+            self._top += int(a[1]) * (self._rows if a[2] == "pages" else 1)
+        self._render()
+
+    def _move(self, step: int):
+        n = len(self.index)
+        if not n: return "break"
+        view = self.index.view
+        try:    pos = view.index(self._sel, self._top, self._top + self._rows)
+        except ValueError: pos = self._top - 1 if step > 0 else self._top + self._rows
+        pos = max(0, min(n - 1, pos + step))
+        self._sel = view[pos]
+        if pos < self._top:                 self._top = pos
+        elif pos >= self._top + self._rows: self._top = pos - self._rows + 1
+        self._render()
+        return "break"
+
+
+def _decode_ps(out_b) -> str:
+    """Robust decoding of PowerShell output (UTF-8, UTF-16LE, fallback)."""
+    if isinstance(out_b, str):
+        # Python may already return str on some platforms
+        return out_b.strip()
     try:
-        # Run powershell and try robust decoding (UTF-8, UTF-16LE, fallback)
-        r = subprocess.run([
-            "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", script
-        ], capture_output=True, timeout=timeout, creationflags=subprocess.CREATE_NO_WINDOW)
-        out_b = r.stdout
-        if isinstance(out_b, str):
-            # Python may already return str on some platforms
-            return out_b.strip()
+        return out_b.decode("utf-8").strip()
+    except Exception:
         try:
-            return out_b.decode("utf-8").strip()
+            return out_b.decode("utf-16le").strip()
         except Exception:
             try:
-                return out_b.decode("utf-16le").strip()
+                return out_b.decode("latin-1").strip()
             except Exception:
-                try:
-                    return out_b.decode("latin-1").strip()
-                except Exception:
-                    return ""
+                return ""
+
+def ps_query(script: str, timeout: int = 15) -> str:
+    try:
+        with span("ps_query", "powershell", script=script[:160]):
+            r = run_cmd([
+                "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", script
+            ], timeout=timeout)
+        return _decode_ps(r.stdout)
     except Exception:
         return ""
 
 
 # ════════════════════════════════════════════════════════════════════════════════
-#  SYSTEM INFO  (platform + PowerShell / Get-CimInstance)
+#  WMI QUERY LAYER  (in-process COM · PowerShell fallback · in-memory fake)
 # ════════════════════════════════════════════════════════════════════════════════
-def collect_sysinfo() -> dict:
-    info = {}
-    
-    # OS Bilgisi (Platform + PS)
+# Providers run a WQL query against a namespace and return typed rows: dicts of
+# property -> value, with CIM datetimes as datetime and 64-bit integers as int.
+_WQL_RE  = re.compile(r"^\s*SELECT\s+(.+?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+?))?\s*$",
+                      re.I | re.S)
+_DATE_RE = re.compile(r"^/Date\((-?\d+)\)/$")
+
+def _wql_props(wql: str) -> list:
+    """Projected property names of a WQL SELECT; [] for *."""
+    m = _WQL_RE.match(wql)
+    if not m or m.group(1).strip() == "*": return []
+    return [p.strip() for p in m.group(1).split(",")]
+
+def wmi_datetime(v):
+    """CIM_DATETIME ("20190101000000.000000+000"), PowerShell JSON
+    ("/Date(1546300800000)/") or ISO text → datetime; None if unparseable."""
+    if isinstance(v, datetime) or v is None: return v
+    s = str(v).strip()
+    m = _DATE_RE.match(s)
+    try:
+        if m: return datetime.fromtimestamp(int(m.group(1)) / 1000)
+        if len(s) >= 14 and s[:14].isdigit(): return datetime.strptime(s[:14], "%Y%m%d%H%M%S")
+        return datetime.fromisoformat(s)
+    except (ValueError, OSError):
+        return None
+
+
+class ComWmiProvider:
+    """WMI through SWbemLocator in-process.  COM objects are bound to the
+    thread that created them, so each worker thread keeps its own connection
+    per namespace, opened on first use and reused for every later query."""
+    name = "com"
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _svc(self, namespace: str):
+        loc = self._local
+        if not hasattr(loc, "conns"):
+            pythoncom.CoInitialize(); loc.conns = {}
+        svc = loc.conns.get(namespace)
+        if svc is None:
+            svc = loc.conns[namespace] = win32com.client.Dispatch(
+                "WbemScripting.SWbemLocator").ConnectServer(".", namespace.replace("/", "\\"))
+        return svc
+
+    @staticmethod
+    def _value(prop):
+        v = prop.Value
+        if v is None: return None
+        if prop.CIMType in (20, 21): return int(v)            # sint64 / uint64 arrive as str
+        if prop.CIMType == 101:      return wmi_datetime(v)
+        return v
+
+    def query(self, wql: str, namespace: str = "root/cimv2") -> list:
+        props, rows = _wql_props(wql), []
+        for obj in self._svc(namespace).ExecQuery(wql, "WQL", 0x30):   # forward-only, immediate
+            if props: rows.append({p: self._value(obj.Properties_(p)) for p in props})
+            else:     rows.append({p.Name: self._value(p) for p in obj.Properties_})
+        return rows
+
+
+class PowerShellWmiProvider:
+    """Get-CimInstance in a child PowerShell, returned as JSON.  Used when
+    pywin32 is missing; one process start per query."""
+    name = "powershell"
+
+    def query(self, wql: str, namespace: str = "root/cimv2") -> list:
+        props = _wql_props(wql)
+        sel = f" | Select-Object {','.join(props)}" if props else ""
+        q = wql.replace("'", "''")
+        return self._parse(ps_query(f"Get-CimInstance -Namespace '{namespace}' -Query '{q}' "
+                                    f"-EA Stop{sel} | ConvertTo-Json -Compress -Depth 2"))
+
+    @staticmethod
+    def _parse(out: str) -> list:
+        if not out: return []
+        try: data = json.loads(out.lstrip("\ufeff"))
+        except ValueError: return []
+        rows = data if isinstance(data, list) else [data]
+        return [{k: (wmi_datetime(v) if isinstance(v, str) and _DATE_RE.match(v) else v)
+                 for k, v in r.items()} for r in rows if isinstance(r, dict)]
+
+
+class FakeWmiProvider:
+    """In-memory WMI for running the collectors without Windows.  Tables are
+    keyed by (namespace, class); WHERE supports `Prop = 'x'` / `<>` terms
+    joined by AND / OR, compared case-insensitively as WQL does (so
+    `IPEnabled = TRUE` matches a True row).  Every query is appended to
+    `queries`."""
+    name = "fake"
+    _COND = re.compile(r"(\w+)\s*(=|<>|!=)\s*'?([^']*?)'?\s*$")
+
+    def __init__(self, tables: dict = None):
+        self.tables: dict = {}
+        self.queries: list = []
+        for (ns, cls), rows in (tables or {}).items(): self.add(cls, rows, ns)
+
+    def add(self, cls: str, rows, namespace: str = "root/cimv2"):
+        self.tables[(namespace.lower(), cls.lower())] = list(rows)
+
+    def _match(self, row: dict, where: str) -> bool:
+        low = {k.lower(): v for k, v in row.items()}
+        for alt in re.split(r"\s+OR\s+", where, flags=re.I):
+            ok = True
+            for term in re.split(r"\s+AND\s+", alt, flags=re.I):
+                m = self._COND.match(term.strip())
+                if not m: continue
+                v, lit = str(low.get(m.group(1).lower())).lower(), m.group(3).lower()
+                ok &= (v == lit) if m.group(2) == "=" else (v != lit)
+            if ok: return True
+        return False
+
+    def query(self, wql: str, namespace: str = "root/cimv2") -> list:
+        self.queries.append((namespace, wql))
+        m = _WQL_RE.match(wql)
+        if not m: return []
+        rows = self.tables.get((namespace.lower(), m.group(2).lower()), [])
+        if m.group(3): rows = [r for r in rows if self._match(r, m.group(3))]
+        props = _wql_props(wql)
+        if not props: return [dict(r) for r in rows]
+        out = []
+        for r in rows:
+            low = {k.lower(): v for k, v in r.items()}
+            out.append({p: low.get(p.lower()) for p in props})
+        return out
+
+
+_WMI = None
+
+def wmi():
+    """The process-wide provider: COM when pywin32 is present, PowerShell on
+    other Windows installs, an empty fake elsewhere.  set_wmi() overrides."""
+    global _WMI
+    if _WMI is None:
+        _WMI = (ComWmiProvider() if WMI_COM_OK else
+                PowerShellWmiProvider() if os.name == "nt" else FakeWmiProvider())
+    return _WMI
+
+def set_wmi(provider):
+    global _WMI
+    _WMI = provider
+
+def wmi_query(wql: str, namespace: str = "root/cimv2", provider=None) -> list:
+    """Traced query through `provider` (default: wmi()); [] on any WMI error."""
+    with span("wmi", "wmi", wql=wql, ns=namespace):
+        try: return (provider or wmi()).query(wql, namespace)
+        except Exception: return []
+
+def wmi_value(wql: str, namespace: str = "root/cimv2"):
+    """First property of the first row (str values stripped), or None."""
+    rows = wmi_query(wql, namespace)
+    if not rows: return None
+    v = next(iter(rows[0].values()), None)
+    return v.strip() if isinstance(v, str) else v
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  APP DATA  (caches, history, user lists — %LOCALAPPDATA%\PC Analyst Pro)
+# ════════════════════════════════════════════════════════════════════════════════
+APP_DIR = os.path.join(os.environ.get("LOCALAPPDATA")
+                       or os.path.join(os.path.expanduser("~"), ".local", "share"),
+                       "PC Analyst Pro")
+
+def app_path(*parts) -> str:
+    p = os.path.join(APP_DIR, *parts)
+    os.makedirs(os.path.dirname(p), exist_ok=True)
+    return p
+
+def load_json(path: str, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+def save_json(path: str, obj):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f: json.dump(obj, f)
+    os.replace(tmp, path)
+
+def append_history(name: str, rec: dict):
+    with open(app_path("history", name), "a", encoding="utf-8") as f:
+        f.write(json.dumps(rec) + "\n")
+
+def load_history(name: str, **match) -> list:
+    """Records of history/<name> whose fields equal `match`, oldest first."""
+    out = []
     try:
-        info["os"] = ps_query("(Get-CimInstance Win32_OperatingSystem).Caption") or platform.system()
-    except: info["os"] = "Windows"
+        with open(app_path("history", name), "r", encoding="utf-8") as f:
+            for line in f:
+                try: rec = json.loads(line)
+                except ValueError: continue
+                if all(rec.get(k) == v for k, v in match.items()): out.append(rec)
+    except OSError:
+        pass
+    return out
+
+def percentile(sorted_vals, p: float) -> float:
+    if not sorted_vals: return 0.0
+    k = (len(sorted_vals) - 1) * p / 100
+    f = int(k); c = min(f + 1, len(sorted_vals) - 1)
+    return sorted_vals[f] + (sorted_vals[c] - sorted_vals[f]) * (k - f)
 
-    # Mimari
-    info["arch"] = platform.machine()
 
-    # CPU Bilgisi
+# ════════════════════════════════════════════════════════════════════════════════
+#  EXECUTABLE HASH REPUTATION  (SHA-256 + persistent (path, size, mtime) cache)
+# ════════════════════════════════════════════════════════════════════════════════
+def sha256_file(path: str) -> str:
+    """Hash through a read-only mapping: no read buffers, and hashlib drops the
+    GIL on large inputs, so a thread pool hashes several files in parallel."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as mv: h.update(mv)
+    return h.hexdigest()
+
+class HashCache:
+    """{path: [size, mtime_ns, sha256]} on disk; an entry is reused only while
+    the file's size and mtime are unchanged."""
+
+    def __init__(self, path: str = None):
+        self.path  = path or app_path("hash_cache.json")
+        self._d    = load_json(self.path, {})
+        self.dirty = False
+
+    def get(self, path: str, st):
+        e = self._d.get(path)
+        return e[2] if e and e[0] == st.st_size and e[1] == st.st_mtime_ns else None
+
+    def put(self, path: str, st, digest: str):
+        self._d[path] = [st.st_size, st.st_mtime_ns, digest]; self.dirty = True
+
+    def save(self):
+        """Write back, first dropping entries whose file is gone or changed."""
+        for p, e in list(self._d.items()):
+            try:    st = os.stat(p)
+            except OSError: st = None
+            if st is None or e[0] != st.st_size or e[1] != st.st_mtime_ns:
+                del self._d[p]; self.dirty = True
+        if self.dirty: save_json(self.path, self._d); self.dirty = False
+
+@traced(cat="fs")
+def hash_files(paths, cache: HashCache = None, workers: int = None) -> tuple:
+    """Return ({path: sha256}, number of files actually hashed)."""
+    out, todo = {}, []
+    for p in set(paths):
+        try: st = os.stat(p)
+        except OSError: continue
+        d = cache.get(p, st) if cache else None
+        if d: out[p] = d
+        else: todo.append((p, st))
+    def _one(item):
+        try:    return item, sha256_file(item[0])
+        except (OSError, ValueError): return item, None
+    with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 2)) as ex:
+        for (p, st), d in ex.map(_one, todo):
+            if not d: continue
+            out[p] = d
+            if cache: cache.put(p, st, d)
+    return out, len(todo)
+
+def load_hash_list(name: str) -> dict:
+    """Read APP_DIR/<name>: one "<sha256> [label]" per line, '#' comments."""
+    out = {}
     try:
-        cpu_name = ps_query("(Get-CimInstance Win32_Processor).Name")
-        info["cpu"] = cpu_name or platform.processor()
-        info["cores"] = f"{psutil.cpu_count(logical=False)} Cores / {psutil.cpu_count(logical=True)} Threads"
-    except: info["cpu"] = "N/A"
+        with open(app_path(name), "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split("#", 1)[0].split(None, 1)
+                if parts and len(parts[0]) == 64:
+                    out[parts[0].lower()] = parts[1].strip() if len(parts) > 1 else ""
+    except OSError:
+        pass
+    return out
 
-    # RAM
-    if PSUTIL_OK:
-        vm = psutil.virtual_memory()
-        info["ram_total"] = f"{vm.total // (1024**3)} GB"
-        info["ram_avail"] = f"{vm.available // (1024**3)} GB ({100 - vm.percent:.0f}% free)"
 
-    # BIOS
-    info["bios"] = ps_query("(Get-CimInstance Win32_BIOS).SMBIOSBIOSVersion") or "N/A"
+# ════════════════════════════════════════════════════════════════════════════════
+#  DISK USAGE ANALYZER  (parallel os.scandir, mtime-keyed incremental rescans)
+# ════════════════════════════════════════════════════════════════════════════════
+DiskUsage = namedtuple("DiskUsage",
+                       "root total files tree top_dirs top_files listed visited seconds")
+
+def _is_reparse(entry) -> bool:
+    """Junctions/mount points look like plain dirs on Windows — never follow."""
+    try: return bool(getattr(entry.stat(follow_symlinks=False),
+                             "st_file_attributes", 0) & 0x400)
+    except OSError: return True
+
+class DiskUsageScanner:
+    """Walks a volume with a pool of os.scandir workers.  Per folder only its
+    own file bytes, file count and subfolder names are kept; file paths live
+    in one bounded heap per scan, so memory grows with the number of
+    folders, never with the number of files.
+
+    Folder totals are cached with the folder's mtime.  On a rescan a folder
+    whose mtime is unchanged is not re-listed; its subfolders are still
+    stat'ed, since nested changes don't touch the parent's mtime.  An
+    in-place size change of an existing file doesn't bump the folder mtime
+    either, so such growth shows up on the next listing of that folder.
+    The largest files of unchanged folders come from the previous scan's
+    candidate list (2 × top_n entries): the top list is exact after a full
+    scan and stays exact on rescans unless more than top_n of the previous
+    candidates were deleted."""
+
+    def __init__(self, top_n: int = 25, workers: int = None):
+        self.top_n   = top_n
+        self.workers = workers or min(32, (os.cpu_count() or 4) * 4)   # I/O bound
+        self._cache: dict = {}   # dir -> (mtime_ns, own, nfiles, subdirs)
+        self._cand:  dict = {}   # root -> previous scan's largest files, (size, path), 2 × top_n
+
+    def _list(self, path: str):
+        """(path, cache entry, freshly listed, this folder's largest files)."""
+        try: mt = os.stat(path).st_mtime_ns
+        except OSError: return path, None, False, ()
+        c = self._cache.get(path)
+        if c and c[0] == mt: return path, c, False, ()
+        own = nfiles = 0; subs, top, n = [], [], 2 * self.top_n
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            if not _is_reparse(e): subs.append(e.path)
+                        elif e.is_file(follow_symlinks=False):
+                            sz = e.stat(follow_symlinks=False).st_size
+                            own += sz; nfiles += 1
+                            if len(top) < n:      heapq.heappush(top, (sz, e.path))
+                            elif sz > top[0][0]:  heapq.heapreplace(top, (sz, e.path))
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        c = self._cache[path] = (mt, own, nfiles, tuple(subs))
+        return path, c, True, top
+
+    @traced("DiskUsageScanner.scan", cat="fs")
+    def scan(self, root: str, cancel=None) -> DiskUsage:
+        t0 = time.perf_counter()
+        order, listing, listed, fresh_dirs = [], {}, 0, set()
+        top, n = [], 2 * self.top_n                      # one candidate heap for the whole scan
+        def push(item):
+            if len(top) < n:         heapq.heappush(top, item)
+            elif item[0] > top[0][0]: heapq.heapreplace(top, item)
+        with ThreadPoolExecutor(max_workers=self.workers) as ex:
+            pending = {ex.submit(self._list, root)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    path, c, fresh, files = f.result()
+                    if c is None: continue
+                    order.append(path); listing[path] = c; listed += fresh
+                    if fresh: fresh_dirs.add(path)
+                    for item in files: push(item)
+                    if cancel and cancel(): continue
+                    pending.update(ex.submit(self._list, d) for d in c[3])
+        # Previous candidates stand in for the files of folders not re-listed
+        for item in self._cand.get(root, ()):
+            d = os.path.dirname(item[1])
+            if d in listing and d not in fresh_dirs: push(item)
+        cand = self._cand[root] = sorted(top, reverse=True)
+        # Drop cached folders under root that no longer exist
+        under = root if root.endswith(os.sep) else root + os.sep
+        for k in [k for k in self._cache
+                  if (k == root or k.startswith(under)) and k not in listing]:
+            del self._cache[k]
+        # Children are always appended after their parent → reverse = bottom-up
+        tree = {}
+        for path in reversed(order):
+            _, own, nf, subs = listing[path]
+            tot, cnt = own, nf
+            for d in subs:
+                t = tree.get(d)
+                if t: tot += t[0]; cnt += t[1]
+            tree[path] = (tot, cnt, subs)
+        top_dirs = heapq.nlargest(self.top_n, ((t[0], p) for p, t in tree.items() if p != root))
+        tot, cnt, _ = tree.get(root, (0, 0, ()))
+        return DiskUsage(root, tot, cnt, tree, top_dirs, cand[:self.top_n],
+                         listed, len(order), time.perf_counter() - t0)
+
 
-    # Disk Modeli (Garantili yol)
+# ════════════════════════════════════════════════════════════════════════════════
+#  CLEANUP  (temp-style folder wipe + duplicate finder: size → head/tail → full)
+# ════════════════════════════════════════════════════════════════════════════════
+@traced(cat="fs")
+def clean_folder(folder: str, ext: str = "", dry_run: bool = False) -> int:
+    """Delete every file under `folder` (optionally only *ext); return bytes
+    freed — or, with dry_run, the bytes that would be freed."""
+    freed = 0
+    for rd, _, files in os.walk(folder):
+        for fn in files:
+            if ext and not fn.endswith(ext): continue
+            fp = os.path.join(rd, fn)
+            try:
+                sz = os.path.getsize(fp)
+                if not dry_run: os.remove(fp)
+                freed += sz
+            except (PermissionError, FileNotFoundError, OSError): pass
+    return freed
+
+DupResult = namedtuple("DupResult", "groups wasted scanned bytes_read files seconds")
+_DUP_BLOCK = 16 * 1024
+
+def _list_files(path: str, min_size: int, dev: int = 0):
+    """One folder → ([(size, dev, inode, path)], [subfolders], dev).  DirEntry.stat()
+    leaves st_dev at 0 on Windows, so the caller passes the volume's device
+    (reparse points aren't followed, so a walk never leaves its root's volume)."""
+    files, subs = [], []
     try:
-        info["disk"] = ps_query("(Get-CimInstance Win32_DiskDrive | Select-Object -First 1).Model") or "N/A"
-    except: info["disk"] = "N/A"
+        with os.scandir(path) as it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if not _is_reparse(e): subs.append(e.path)
+                    elif e.is_file(follow_symlinks=False):
+                        st = e.stat(follow_symlinks=False)
+                        if st.st_size >= min_size:
+                            files.append((st.st_size, st.st_dev or dev, e.inode(), e.path))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return files, subs, dev
+
+def _head_tail_digest(path: str, size: int):
+    """Hash of the first and last block; for small files this is the whole file."""
+    with open(path, "rb") as f:
+        h = hashlib.blake2b(f.read(_DUP_BLOCK), digest_size=16)
+        if size > _DUP_BLOCK:
+            f.seek(max(_DUP_BLOCK, size - _DUP_BLOCK)); h.update(f.read(_DUP_BLOCK))
+    return h.digest(), min(size, 2 * _DUP_BLOCK)
+
+def _full_digest(path: str, size: int):
+    h, buf, n = hashlib.blake2b(digest_size=32), bytearray(1 << 20), 0
+    mv = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            k = f.readinto(buf)
+            if not k: break
+            h.update(mv[:k]); n += k
+    return h.digest(), n
+
+@traced(cat="fs")
+def find_duplicates(roots, min_size: int = 1, workers: int = None, cancel=None) -> DupResult:
+    """Each stage only sees files that still share a key with another file,
+    and each runs on a thread pool.  Hard links of one file count once."""
+    t0 = time.perf_counter()
+    workers = workers or min(16, (os.cpu_count() or 4) * 2)
+    by_size, seen, read = {}, set(), 0
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        # 1 ── walk + group by size
+        devs = {}
+        for r in roots:
+            try: devs[r] = os.stat(r).st_dev
+            except OSError: pass
+        pending = {ex.submit(_list_files, r, min_size, dev) for r, dev in devs.items()}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                files, subs, vol = f.result()
+                for size, dev, ino, path in files:
+                    if ino and (dev, ino) in seen: continue
+                    seen.add((dev, ino)); by_size.setdefault(size, []).append(path)
+                if not (cancel and cancel()):
+                    pending.update(ex.submit(_list_files, d, min_size, vol) for d in subs)
+        scanned = sum(size * len(ps) for size, ps in by_size.items())
+        nfiles  = sum(len(ps) for ps in by_size.values())
+        groups  = [(size, ps) for size, ps in by_size.items() if len(ps) > 1]
+        # 2 ── head/tail digest, 3 ── full digest (only where head/tail wasn't the whole file)
+        for stage in (_head_tail_digest, _full_digest):
+            if cancel and cancel(): groups = []; break
+            jobs = [(size, p) for size, ps in groups
+                    if stage is _head_tail_digest or size > 2 * _DUP_BLOCK for p in ps]
+            def _one(job):
+                try:    return job, stage(job[1], job[0])
+                except OSError: return job, (None, 0)
+            keyed = {}
+            for (size, p), (d, n) in ex.map(_one, jobs):
+                read += n
+                if d is not None: keyed.setdefault((size, d), []).append(p)
+            done_small = [(size, ps) for size, ps in groups
+                          if stage is _full_digest and size <= 2 * _DUP_BLOCK]
+            groups = done_small + [(k[0], ps) for k, ps in keyed.items() if len(ps) > 1]
+    groups.sort(key=lambda g: g[0] * (len(g[1]) - 1), reverse=True)
+    wasted = sum(size * (len(ps) - 1) for size, ps in groups)
+    return DupResult(groups, wasted, scanned, read, nfiles, time.perf_counter() - t0)
+
+@traced(cat="fs")
+def remove_duplicates(groups, dry_run: bool = False) -> int:
+    """Keep the oldest copy of each group, delete the rest; return bytes freed.
+    Groups may be stale, so the kept copy and every candidate are re-hashed
+    first: a file changed since the scan (even at the same size) is skipped."""
+    freed = 0
+    for size, paths in groups:
+        try:
+            keep = min(paths, key=os.path.getmtime)
+            if os.path.getsize(keep) != size: continue
+            want = _full_digest(keep, size)[0]
+        except OSError: continue
+        for p in paths:
+            if p == keep: continue
+            try:
+                if os.path.getsize(p) != size or _full_digest(p, size)[0] != want: continue
+                if os.path.samefile(p, keep): continue
+                if not dry_run: os.remove(p)
+                freed += size
+            except OSError: pass
+    return freed
 
-    # GPU
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  STORAGE BENCHMARK  (sequential + 4K random at several queue depths)
+# ════════════════════════════════════════════════════════════════════════════════
+_BLOCK_SEQ, _BLOCK_RND = 1024 * 1024, 4096
+DISK_BENCH_QD = (1, 4, 32)
+
+def _open_uncached(path: str) -> tuple:
+    """FileIO that bypasses the page cache where the OS allows it, plus a flag
+    saying whether it does.  Buffers must be page-aligned (mmap) and I/O
+    sizes/offsets multiples of 4 KB."""
+    if os.name == "nt":
+        try:
+            import msvcrt
+            k32 = ctypes.windll.kernel32
+            k32.CreateFileW.restype = ctypes.c_void_p
+            h = k32.CreateFileW(path, 0xC0000000, 3, None, 3,       # RW, share RW, OPEN_EXISTING
+                                0x20000000 | 0x80000000, None)     # NO_BUFFERING | WRITE_THROUGH
+            if h and h != ctypes.c_void_p(-1).value:
+                return io.FileIO(msvcrt.open_osfhandle(h, os.O_RDWR | os.O_BINARY), "r+"), True
+        except Exception:
+            pass
+    elif hasattr(os, "O_DIRECT"):
+        try:
+            f = io.FileIO(os.open(path, os.O_RDWR | os.O_DIRECT), "r+")
+        except OSError:
+            f = None
+        if f is not None:
+            try:
+                with mmap.mmap(-1, _BLOCK_RND) as probe:       # some FSes accept the flag
+                    f.readinto(probe); f.seek(0)               # but reject the I/O
+                return f, True
+            except OSError:
+                f.close()
+    return io.FileIO(path, "r+"), False
+
+def _seq_pass(path: str, size: int, write: bool, cancel=None) -> dict:
+    f, direct = _open_uncached(path)
+    buf = mmap.mmap(-1, _BLOCK_SEQ); buf.write(os.urandom(_BLOCK_SEQ))
+    done, t0 = 0, time.perf_counter()
+    with f, buf:
+        while done < size and not (cancel and cancel()):
+            n = f.write(buf) if write else f.readinto(buf)
+            if not n: break
+            done += n
+        if write: os.fsync(f.fileno())
+    dt = time.perf_counter() - t0
+    return {"mbps": done / dt / 1024**2 if dt else 0.0, "direct": direct}
+
+def _rand_pass(path: str, size: int, write: bool, qd: int, seconds: float,
+               cancel=None) -> dict:
+    """`qd` threads, each with its own handle and one I/O in flight."""
+    blocks, stop = size // _BLOCK_RND, time.perf_counter() + seconds
+    lats, direct = [], [True]
+    def _worker():
+        f, d = _open_uncached(path)
+        direct[0] &= d
+        buf, rnd, mine = mmap.mmap(-1, _BLOCK_RND), random.Random(), []
+        if write: buf.write(os.urandom(_BLOCK_RND))
+        op = f.write if write else f.readinto
+        pc = time.perf_counter
+        with f, buf:
+            while not (cancel and cancel()):
+                t = pc()
+                if t >= stop: break
+                f.seek(rnd.randrange(blocks) * _BLOCK_RND); op(buf)
+                mine.append(pc() - t)
+        lats.extend(mine)
+    t0 = time.perf_counter()
+    ths = [threading.Thread(target=_worker, daemon=True) for _ in range(qd)]
+    for t in ths: t.start()
+    for t in ths: t.join()
+    dt, lats = time.perf_counter() - t0, sorted(lats)
+    us = [v * 1e6 for v in (percentile(lats, 50), percentile(lats, 95), percentile(lats, 99))]
+    return {"iops": len(lats) / dt if dt else 0.0,
+            "mbps": len(lats) * _BLOCK_RND / dt / 1024**2 if dt else 0.0,
+            "p50_us": us[0], "p95_us": us[1], "p99_us": us[2], "direct": direct[0]}
+
+@traced(cat="bench")
+def bench_disk(volume: str, size_mb: int = 256, seconds: float = 3.0,
+               qds=DISK_BENCH_QD, cancel=None, progress=None) -> dict:
+    """Run the suite on a temporary file on `volume`; return {test: metrics}
+    plus "_path" (the file actually used: the temp dir when `volume` is not
+    writable).  The file is written first (seq write) so every later pass
+    reads/writes real allocated blocks."""
+    size = size_mb * 1024**2
+    for d in (volume, tempfile.gettempdir()):
+        path = os.path.join(d, f"pcanalyst_bench_{os.getpid()}.tmp")
+        try: open(path, "wb").close(); break
+        except OSError: path = None
+    if not path: raise OSError("no writable location for the test file")
+    tests = ([("seq_write", lambda: _seq_pass(path, size, True, cancel)),
+              ("seq_read",  lambda: _seq_pass(path, size, False, cancel))] +
+             [(f"rnd_read_qd{q}",  lambda q=q: _rand_pass(path, size, False, q, seconds, cancel))
+              for q in qds] +
+             [(f"rnd_write_qd{q}", lambda q=q: _rand_pass(path, size, True, q, seconds, cancel))
+              for q in qds])
+    res = {"_path": path}
     try:
-        if GPU_OK:
-            h = pynvml.nvmlDeviceGetHandleByIndex(0)
-            info["gpu"] = pynvml.nvmlDeviceGetName(h).decode()
-        else:
-            info["gpu"] = ps_query("(Get-CimInstance Win32_VideoController | Select-Object -First 1).Name") or "N/A"
-    except: info["gpu"] = "N/A"
+        for i, (name, fn) in enumerate(tests):
+            if cancel and cancel(): break
+            if progress: progress(i, len(tests), name)
+            res[name] = fn()
+    finally:
+        try: os.remove(path)
+        except OSError: pass
+    return res
 
-    # Uptime
-    if PSUTIL_OK:
-        up = datetime.now() - datetime.fromtimestamp(psutil.boot_time())
-        info["uptime"] = f"{int(up.total_seconds() // 3600)}h {int((up.total_seconds() % 3600) // 60)}m"
 
-    return info
+# ════════════════════════════════════════════════════════════════════════════════
+#  CPU / MEMORY BENCHMARK  (process pool sized to the logical CPU count)
+# ════════════════════════════════════════════════════════════════════════════════
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+def _cpu_int_work(seconds: float) -> float:
+    """xorshift64 rounds per second (integer ALU + shifts)."""
+    x, n, pc = 88172645463325252, 0, time.perf_counter
+    end = pc() + seconds
+    while pc() < end:
+        for _ in range(5000):
+            x ^= (x << 13) & _MASK64; x ^= x >> 7; x ^= (x << 17) & _MASK64
+        n += 5000
+    return n / (seconds + pc() - end)
+
+def _cpu_float_work(seconds: float) -> float:
+    """Mandelbrot-style complex iterations per second (FP multiply/add)."""
+    n, pc = 0, time.perf_counter
+    end = pc() + seconds
+    while pc() < end:
+        zr = zi = 0.0; cr, ci = -0.7453, 0.1127
+        for _ in range(5000):
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+            if zr * zr + zi * zi > 4.0: zr = zi = 0.0
+        n += 5000
+    return n / (seconds + pc() - end)
+
+def _mem_bandwidth(size_mb: int, rounds: int = 5) -> dict:
+    """Best-of-N GB/s for a large buffer copy and fill."""
+    size = size_mb * 1024**2
+    src, dst = bytearray(b"\x5a") * size, bytearray(size)
+    cdst = (ctypes.c_char * size).from_buffer(dst)
+    best_copy = best_fill = float("inf")
+    for i in range(rounds):
+        t = time.perf_counter(); dst[:] = src
+        best_copy = min(best_copy, time.perf_counter() - t)
+        t = time.perf_counter(); ctypes.memset(cdst, i, size)
+        best_fill = min(best_fill, time.perf_counter() - t)
+    del cdst
+    return {"mem_copy": size / best_copy / 1024**3, "mem_fill": size / best_fill / 1024**3}
+
+@traced(cat="bench")
+def bench_cpu(seconds: float = 3.0, mem_mb: int = 256, workers: int = None,
+              cancel=None, progress=None) -> dict:
+    """Scores: int/float M-ops/s on one core and on every logical core at
+    once, plus memory copy/fill GB/s."""
+    workers = workers or (psutil.cpu_count() if PSUTIL_OK else None) or os.cpu_count() or 1
+    res = {}
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(abs, range(workers)))                    # spawn + import up front
+        steps = [("int_single",   _cpu_int_work, 1), ("float_single", _cpu_float_work, 1),
+                 ("int_multi",    _cpu_int_work, workers),
+                 ("float_multi",  _cpu_float_work, workers)]
+        for i, (name, fn, n) in enumerate(steps):
+            if cancel and cancel(): return res
+            if progress: progress(i, len(steps) + 1, name)
+            res[name] = sum(ex.map(fn, [seconds] * n)) / 1e6
+    if progress: progress(len(steps), len(steps) + 1, "memory")
+    res.update(_mem_bandwidth(mem_mb))
+    return res
+
 
 # ════════════════════════════════════════════════════════════════════════════════
-#  THERMAL MONITORING  (pynvml GPU  +  PowerShell WMI CPU)
+#  CRASH SOURCES  (dump headers + streamed module scan + System event records)
 # ════════════════════════════════════════════════════════════════════════════════
-def collect_thermal() -> dict:
-    t = {}
+# Kernel dumps (Minidump\*.dmp and MEMORY.DMP alike) start with a DUMP_HEADER:
+# "PAGEDUMP" (32-bit) or "PAGEDU64" (64-bit) with the bugcheck code and its
+# four parameters at fixed offsets.  User-mode minidumps ("MDMP") carry the
+# code in the exception stream instead.
+DumpHeader = namedtuple("DumpHeader", "format code params dump_type")
+_DUMP_LAYOUT = {   # signature: (code offset, params struct, params offset, DumpType offset)
+    b"PAGEDUMP": (0x28, "<4I", 0x2C, 0xF88),
+    b"PAGEDU64": (0x38, "<4Q", 0x40, 0xF98),
+}
+_DUMP_TYPES = {1: "full", 2: "kernel", 4: "mini", 5: "full", 6: "kernel", 8: "kernel"}
+_NO_HEADER  = DumpHeader("", "UNKNOWN", (), "")
 
-    # ── CPU temperature (WMI MSAcpi_ThermalZoneTemperature → Kelvin × 10) ────
+def dump_header(path: str) -> DumpHeader:
+    """Bugcheck code / parameters from the first page(s); never reads further."""
     try:
-        raw = ps_query(
-            "(Get-CimInstance -Namespace root/wmi MSAcpi_ThermalZoneTemperature "
-            "| Select-Object -First 1 CurrentTemperature).CurrentTemperature")
-        if raw:
-            celsius = (int(raw) / 10) - 273.15
-            t["cpu_temp"] = f"{celsius:.1f} °C"
-            t["cpu_status"] = ("hot" if celsius > 85
-                               else "warm" if celsius > 70 else "normal")
+        with open(path, "rb") as f: data = f.read(0x1000)
+    except OSError: return _NO_HEADER
+    if data[:8] in _DUMP_LAYOUT and len(data) >= 0x1000:
+        c_off, p_fmt, p_off, t_off = _DUMP_LAYOUT[data[:8]]
+        code = struct.unpack_from("<I", data, c_off)[0]
+        dt = struct.unpack_from("<I", data, t_off)[0]
+        return DumpHeader(data[:8].decode(), f"0x{code:08X}",
+                          struct.unpack_from(p_fmt, data, p_off), _DUMP_TYPES.get(dt, ""))
+    if data[:4] != b"MDMP" or len(data) < 0x20: return _NO_HEADER
+    # MINIDUMP_HEADER: NumberOfStreams @0x08, StreamDirectoryRva @0x0C;
+    # directory entries are (StreamType, DataSize, Rva); ExceptionStream = 6
+    ns, rva = struct.unpack_from("<II", data, 0x08)
+    for i in range(min(ns, 32)):
+        off = rva + i * 12
+        if off + 12 > len(data): break
+        stype, _, s_rva = struct.unpack_from("<III", data, off)
+        if stype == 6 and s_rva + 0x48 <= len(data):
+            # MINIDUMP_EXCEPTION_STREAM: ThreadId, pad, then ExceptionCode @+8,
+            # NumberParameters @+0x20, ExceptionInformation[] @+0x28
+            code, = struct.unpack_from("<I", data, s_rva + 8)
+            n,    = struct.unpack_from("<I", data, s_rva + 0x20)
+            return DumpHeader("MDMP", f"0x{code:08X}",
+                              struct.unpack_from(f"<{min(n, 4)}Q", data, s_rva + 0x28), "")
+    return DumpHeader("MDMP", "UNKNOWN", (), "")
+
+def _read_dump(path: str) -> str:
+    return dump_header(path).code
+
+# Module names appear as ASCII (image paths, debugger data) and UTF-16LE
+# (LDR_DATA_TABLE_ENTRY.BaseDllName).  The regex only looks for the ".sys"
+# extension in either spelling (a literal-prefixed pattern, ~1 GB/s); the stem
+# in front of each hit is then compared against the wanted names.
+_SYS_RE    = re.compile(rb"\.[sS][yY][sS](?![0-9A-Za-z_])|\.\x00[sS]\x00[yY]\x00[sS]\x00")
+_WORD      = frozenset(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_")
+DUMP_CHUNK = 16 * 1024 * 1024
+
+def scan_dump_modules(path: str, names=None, chunk: int = DUMP_CHUNK, cancel=None) -> dict:
+    """{module filename: first offset} for `names` (default DRIVER_MAP) over
+    the whole file.  Each window is its own read-only mapping of `chunk`
+    bytes plus an overlap of the longest UTF-16 match, so names straddling a
+    boundary are still found and resident memory stays at one window
+    whatever the dump size."""
+    names = [n.lower() for n in (names or DRIVER_MAP)]
+    stems = collections.defaultdict(set)                     # stem length → stems
+    for n in names: stems[len(n) - 4].add(n[:-4].encode())
+    overlap = 2 * max(map(len, names))
+    gran, found = mmap.ALLOCATIONGRANULARITY, {}
+    chunk = max(gran, chunk // gran * gran)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        for off in range(0, size, chunk):
+            if cancel: cancel.check()
+            with mmap.mmap(f.fileno(), min(chunk + overlap, size - off),
+                           access=mmap.ACCESS_READ, offset=off) as mm:
+                for m in _SYS_RE.finditer(mm):
+                    i, wide = m.start(), mm[m.start() + 1] == 0
+                    for n, group in stems.items():
+                        if wide:
+                            raw = mm[max(0, i - 2 * n):i]
+                            stem, before = raw[::2].lower(), mm[i - 2 * n - 2] if i > 2 * n + 1 else 0
+                            if raw[1::2].strip(b"\x00"): continue
+                        else:
+                            stem, before = mm[max(0, i - n):i].lower(), mm[i - n - 1] if i > n else 0
+                        if stem in group and before not in _WORD:
+                            found.setdefault(stem.decode() + ".sys", off + i - (2 * n if wide else n))
+            if len(found) == len(names): break
+    return found
+
+def _scan_dump_for_driver(path: str, cancel=None, code: str = None):
+    """(filename, friendly name, every known module found) for a dump.  An
+    inbox driver whose own bugcheck `code` this is ranks first, then
+    third-party drivers, then other inbox ones (never blamed); the first
+    offset breaks ties."""
+    try: found = scan_dump_modules(path, cancel=cancel)
+    except OSError: return (None, None, [])
+    def _rank(n):
+        inbox = INBOX_DRIVERS.get(n)
+        return (1 if inbox is None else 0 if code in inbox else 2, found[n])
+    mods = sorted(found, key=_rank)
+    fn = mods[0] if mods and _rank(mods[0])[0] < 2 else None
+    return (fn, DRIVER_MAP.get(fn, fn) if fn else None, mods)
+
+def _extract_code(msg: str) -> str:
+    m = re.search(r"0x([0-9A-Fa-f]{8})", msg)
+    return "0x" + m.group(1).upper() if m else "UNKNOWN"
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  EVENT QUERY LAYER  (XPath pushed to the event log service · in-memory fake)
+# ════════════════════════════════════════════════════════════════════════════════
+# Only crash-relevant records leave the service: the filter below becomes one
+# XPath query, so unrelated System events are never transferred or rendered.
+# Providers yield raw events: {"provider", "id", "time", "data": {name: value}}.
+EventSpec = namedtuple("EventSpec", "provider ids kind")
+
+CRASH_EVENTS = (
+    EventSpec("Microsoft-Windows-WER-SystemErrorReporting", (1001,),          "bugcheck"),
+    EventSpec("Microsoft-Windows-Kernel-Power",             (41,),            "power"),
+    EventSpec("EventLog",                                   (6008,),          "shutdown"),
+    EventSpec("Microsoft-Windows-WHEA-Logger",              (1, 17, 18, 19, 20, 46, 47), "whea"),
+)
+WHEA_FATAL = {1, 18, 20, 46}
+
+CrashEvent = namedtuple("CrashEvent", "time kind provider event_id code params culprit detail")
+
+def event_xpath(specs=CRASH_EVENTS, since: datetime = None) -> str:
+    """XPath filter selecting `specs` (provider + ID set), optionally newer than `since`."""
+    terms = " or ".join(
+        f"(Provider[@Name='{sp.provider}'] and ({' or '.join(f'EventID={i}' for i in sp.ids)}))"
+        for sp in specs)
+    if since:
+        ms = max(0, int((datetime.now() - since).total_seconds() * 1000))
+        terms = f"({terms}) and TimeCreated[timediff(@SystemTime) <= {ms}]"
+    return f"*[System[{terms}]]"
+
+_EVT_NS = "{http://schemas.microsoft.com/win/2004/08/events/event}"
+
+def _evt_time(s: str):
+    """SystemTime ("2024-05-01T10:11:12.1234567Z", UTC) → local naive datetime."""
+    try:
+        return (datetime.strptime(s[:19], "%Y-%m-%dT%H:%M:%S")
+                .replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None))
+    except (TypeError, ValueError):
+        return None
+
+def event_from_xml(xml: str) -> dict:
+    """Rendered <Event> XML → raw event dict."""
+    return _event_from_elem(ET.fromstring(xml))
+
+def _event_from_elem(root) -> dict:
+    """<Event> element → raw event dict.  Unnamed <Data> items are keyed by
+    position ("0", "1", …)."""
+    sysn = root.find(f"{_EVT_NS}System")
+    prov = sysn.find(f"{_EVT_NS}Provider")
+    tc   = sysn.find(f"{_EVT_NS}TimeCreated")
+    data = {}
+    for i, d in enumerate(root.iterfind(f"{_EVT_NS}EventData/{_EVT_NS}Data")):
+        data[d.get("Name") or str(i)] = d.text or ""
+    return {"provider": prov.get("Name") if prov is not None else "",
+            "id":       int(sysn.findtext(f"{_EVT_NS}EventID") or 0) & 0xFFFF,
+            "time":     _evt_time(tc.get("SystemTime") if tc is not None else None),
+            "data":     data}
+
+
+class EvtEventProvider:
+    """Windows Event Log API (EvtQuery) via pywin32: newest first, fetched in
+    batches and rendered as XML — no message-table formatting.  `log` is a
+    channel name or the path of an exported .evtx file."""
+    name = "evt"
+
+    def query(self, log: str, xpath: str, limit: int = 500, cancel=None):
+        src = (win32evtlog.EvtQueryFilePath if os.path.isfile(log)
+               else win32evtlog.EvtQueryChannelPath)
+        h = win32evtlog.EvtQuery(log, src | win32evtlog.EvtQueryReverseDirection, xpath)
+        n = 0
+        while n < limit and not (cancel and cancel()):
+            batch = win32evtlog.EvtNext(h, min(64, limit - n))
+            if not batch: break
+            for e in batch:
+                yield event_from_xml(win32evtlog.EvtRender(e, win32evtlog.EvtRenderEventXml))
+            n += len(batch)
+
+
+class FakeEventProvider:
+    """In-memory event log for running the crash collectors without Windows.
+    Events are raw dicts per log; the filter is applied from the specs the
+    XPath was built from, and every query is appended to `queries`."""
+    name = "fake"
+
+    def __init__(self, logs: dict = None, specs=CRASH_EVENTS):
+        self.logs: dict = {k: list(v) for k, v in (logs or {}).items()}
+        self.specs = specs
+        self.queries: list = []
+
+    def add(self, log: str, events):
+        self.logs.setdefault(log, []).extend(events)
+
+    def query(self, log: str, xpath: str, limit: int = 500, cancel=None):
+        self.queries.append((log, xpath))
+        want = {(sp.provider, i) for sp in self.specs for i in sp.ids}
+        n = 0
+        for ev in reversed(self.logs.get(log, [])):
+            if n >= limit or (cancel and cancel()): break
+            if (ev["provider"], ev["id"]) in want:
+                n += 1; yield ev
+
+
+_EVENTS = None
+
+def events():
+    """The process-wide event provider: EvtQuery when pywin32 is present, an
+    empty fake elsewhere.  set_events() overrides."""
+    global _EVENTS
+    if _EVENTS is None:
+        _EVENTS = EvtEventProvider() if WIN32_OK else FakeEventProvider()
+    return _EVENTS
+
+def set_events(provider):
+    global _EVENTS
+    _EVENTS = provider
+
+def iter_event_xml(path: str):
+    """Raw events from an exported XML log (`wevtutil qe … /f:xml`, Event
+    Viewer "Save as XML"), streamed so large exports stay flat in memory."""
+    for _, el in ET.iterparse(path):
+        if el.tag == f"{_EVT_NS}Event":
+            yield _event_from_elem(el)
+            el.clear()
+
+def _hex(v) -> int:
+    try: return int(str(v), 0)
+    except ValueError: return 0
+
+def crash_record(ev: dict, kind: str) -> CrashEvent:
+    """Map a raw event of `kind` to a CrashEvent with a BSOD_DB code."""
+    d, params, culprit, detail = ev["data"], (), None, ""
+    if kind == "bugcheck":
+        # param1 = "0x0000009f (0x…, 0x…, 0x…, 0x…)", param2 = dump path
+        p1 = d.get("param1", "")
+        code = _extract_code(p1)
+        params = tuple(_hex(x) for x in re.findall(r"0x[0-9A-Fa-f]+", p1)[1:5])
+        detail = d.get("param2", "")
+        if detail and os.path.isfile(detail): culprit = _scan_dump_for_driver(detail, code=code)[1]
+    elif kind == "power":
+        bc = _hex(d.get("BugcheckCode", 0))
+        code = f"0x{bc:08X}" if bc else "KERNEL_POWER_41"
+        params = tuple(_hex(d.get(f"BugcheckParameter{i}", 0)) for i in range(1, 5)) if bc else ()
+    elif kind == "shutdown":
+        code, detail = "EVENT_6008", " ".join(v for k, v in d.items() if k in ("0", "1"))
+    else:
+        code   = "WHEA_FATAL" if ev["id"] in WHEA_FATAL else "WHEA_CORRECTED"
+        detail = d.get("ErrorSource") or d.get("Component") or ""
+    return CrashEvent(ev["time"], kind, ev["provider"], ev["id"], code, params, culprit, detail)
+
+@traced(cat="collector")
+def crash_events(provider=None, log: str = "System", specs=CRASH_EVENTS,
+                 since: datetime = None, limit: int = 500, cancel=None) -> list:
+    """Crash and hardware-error records from `log`, newest first."""
+    kinds = {(sp.provider, i): sp.kind for sp in specs for i in sp.ids}
+    out = []
+    for ev in (provider or events()).query(log, event_xpath(specs, since), limit, cancel):
+        kind = kinds.get((ev["provider"], ev["id"]))
+        if kind: out.append(crash_record(ev, kind))
+    return out
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  OFFLINE BATCH ANALYSIS  (collected dump folders → one crash CSV)
+# ════════════════════════════════════════════════════════════════════════════════
+# Walks a tree such as  <root>/<machine>/Minidump/*.dmp  +  <root>/<machine>/System.xml
+# and analyses every file on a process pool with the same dump / event logic
+# the live scan uses.  Workers return plain tuples; the parent adds the
+# BSOD_DB fields and writes the CSV, so only small rows cross processes.
+BATCH_COLS = ("machine", "file", "time", "code", "name", "category", "culprit", "source", "error")
+_BATCH_EXT = (".dmp", ".xml", ".evtx")
+
+def batch_files(root: str) -> list:
+    out = []
+    for dp, _, names in os.walk(root):
+        out += [os.path.join(dp, n) for n in names if n.lower().endswith(_BATCH_EXT)]
+    return sorted(out)
+
+def _analyze_file(path: str) -> list:
+    """(time, code, culprit, source, error) rows for one dump or event export."""
+    low = path.lower()
+    try:
+        if low.endswith(".dmp"):
+            ts = datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M")
+            code = _read_dump(path)
+            return [(ts, code, _scan_dump_for_driver(path, code=code)[1], "dump", "")]
+        if low.endswith(".xml"):
+            kinds = {(sp.provider, i): sp.kind for sp in CRASH_EVENTS for i in sp.ids}
+            evs = (crash_record(ev, kinds[ev["provider"], ev["id"]]) for ev in iter_event_xml(path)
+                   if (ev["provider"], ev["id"]) in kinds)
+        elif WIN32_OK:
+            evs = crash_events(EvtEventProvider(), log=path, limit=100_000)
         else:
-            t["cpu_temp"] = None
-    except Exception:
-        t["cpu_temp"] = None
+            return [("", "", None, "evtx", "pywin32 required for .evtx")]
+        return [(ev.time.strftime("%Y-%m-%d %H:%M") if ev.time else "", ev.code, ev.culprit,
+                 f"{ev.provider.rsplit('-', 1)[-1]} {ev.event_id}", "") for ev in evs]
+    except Exception as e:
+        return [("", "", None, "", f"{type(e).__name__}: {e}")]
+
+@traced(cat="task")
+def batch_analyze(root: str, out_csv: str, workers: int = None,
+                  progress=None, cancel=None) -> dict:
+    """Analyse every dump / event export under `root` into `out_csv`.
+    `progress(done, total)` is called per file.  Returns a summary dict."""
+    files = batch_files(root)
+    workers = workers or os.cpu_count() or 1
+    codes, n_rows, n_err = collections.Counter(), 0, 0
+    t0 = time.perf_counter()
+    ex = ProcessPoolExecutor(max_workers=workers)
+    try:
+        with open(out_csv, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f); w.writerow(BATCH_COLS)
+            chunk = max(1, min(64, len(files) // (workers * 4)))
+            for i, (path, rows) in enumerate(zip(files, ex.map(_analyze_file, files,
+                                                               chunksize=chunk)), 1):
+                rel = os.path.relpath(path, root)
+                machine = rel.split(os.sep, 1)[0] if os.sep in rel else ""
+                for ts, code, culprit, src, err in rows:
+                    entry = bsod_entry(code) if code else None
+                    w.writerow((machine, rel, ts, code,
+                                entry["name"] if entry else "",
+                                BF(entry, "category") if entry else "",
+                                culprit or "", src, err))
+                    n_rows += 1; n_err += bool(err)
+                    if code: codes[code] += 1
+                if progress: progress(i, len(files))
+                if cancel and cancel(): break
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+    return {"files": len(files), "rows": n_rows, "errors": n_err,
+            "seconds": time.perf_counter() - t0, "top": codes.most_common(5), "csv": out_csv}
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  SYSTEM INFO  (platform + PowerShell / Get-CimInstance)
+# ════════════════════════════════════════════════════════════════════════════════
+class _Provisional(str):
+    """A value from a fallback source (or "N/A"): shown, but never cached."""
+
+_SI_NA = _Provisional("N/A")
+
+def _si_os():
+    return wmi_value("SELECT Caption FROM Win32_OperatingSystem") or _Provisional(platform.system())
+
+def _si_cpu():
+    return wmi_value("SELECT Name FROM Win32_Processor") or _Provisional(platform.processor())
+
+def _si_cores():
+    return f"{psutil.cpu_count(logical=False)} Cores / {psutil.cpu_count(logical=True)} Threads"
 
-    # ── GPU temperature via pynvml ─────────────────────────────────────────────
+def _si_gpu():
     if GPU_OK:
+        return pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(0)).decode()
+    return wmi_value("SELECT Name FROM Win32_VideoController") or _SI_NA
+
+def _si_ram_avail():
+    vm = psutil.virtual_memory()
+    return f"{vm.available // (1024**3)} GB ({100 - vm.percent:.0f}% free)"
+
+def _si_uptime():
+    up = (datetime.now() - datetime.fromtimestamp(psutil.boot_time())).total_seconds()
+    return f"{int(up // 3600)}h {int((up % 3600) // 60)}m"
+
+# field -> probe; a probe returning None leaves the field out
+_SI_PROBES = {
+    "os":        _si_os,
+    "arch":      platform.machine,
+    "cpu":       _si_cpu,
+    "cores":     _si_cores,
+    "ram_total": lambda: f"{psutil.virtual_memory().total // (1024**3)} GB" if PSUTIL_OK else None,
+    "ram_avail": lambda: _si_ram_avail() if PSUTIL_OK else None,
+    "bios":      lambda: wmi_value("SELECT SMBIOSBIOSVersion FROM Win32_BIOS") or _SI_NA,
+    "disk":      lambda: wmi_value("SELECT Model FROM Win32_DiskDrive") or _SI_NA,
+    "gpu":       _si_gpu,
+    "uptime":    lambda: _si_uptime() if PSUTIL_OK else None,
+}
+
+@traced(cat="collector")
+def collect_sysinfo(fields=None) -> dict:
+    """Live probe of `fields` (default: all)."""
+    info = {}
+    for k in fields or _SI_PROBES:
+        try:    v = _SI_PROBES[k]()
+        except Exception: v = _SI_NA
+        if v is not None: info[k] = v
+    return info
+
+
+class SysinfoCache:
+    """Static sysinfo fields on disk (sysinfo_cache.json), valid only for the
+    boot and hardware fingerprint they were read on.  Each field also has a
+    TTL; an expired field is still served, and returned by collect() as due
+    for a background re-probe.  Dynamic fields and failed probes are never
+    cached.  Several jobs update it at once, so fields are read and written
+    under a lock."""
+
+    TTL = {"os": 7 * 86400, "arch": 365 * 86400, "cpu": 30 * 86400,
+           "cores": 30 * 86400, "ram_total": 7 * 86400, "bios": 30 * 86400,
+           "disk": 86400, "gpu": 86400}
+    DYNAMIC = ("ram_avail", "uptime")
+
+    def __init__(self, path: str = None):
+        self.path = path or app_path("sysinfo_cache.json")
+        d = load_json(self.path, {})
+        self.boot, self.fp = self._boot(), self._fingerprint()
+        same = (d.get("fp") == self.fp and self.boot is not None
+                and abs((d.get("boot") or 0) - self.boot) < 5)   # boot_time jitters
+        fields = d.get("fields", {}) if same else {}
+        self.fields: dict = {k: e for k, e in fields.items() if e and e[0] != "N/A"}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _boot():
+        try:    return psutil.boot_time() if PSUTIL_OK else None
+        except Exception: return None
+
+    @staticmethod
+    def _fingerprint() -> str:
+        ram = psutil.virtual_memory().total if PSUTIL_OK else 0
+        raw = "|".join(map(str, (platform.node(), platform.machine(), platform.version(),
+                                 os.cpu_count(), ram)))
+        return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+    def lookup(self) -> tuple:
+        """(cached values, expired field names)."""
+        now, vals, expired = time.time(), {}, []
+        with self._lock:
+            for k, ttl in self.TTL.items():
+                if k in self.fields:
+                    v, ts = self.fields[k]
+                    vals[k] = v
+                    if now - ts > ttl: expired.append(k)
+        return vals, expired
+
+    def update(self, values: dict) -> list:
+        """Store fresh static values; returns the fields whose value changed.
+        A failed probe keeps the cached value, so it is retried next time."""
+        now, changed = time.time(), []
+        with self._lock:
+            for k, v in values.items():
+                if k not in self.TTL or isinstance(v, _Provisional): continue
+                if k in self.fields and self.fields[k][0] != v: changed.append(k)
+                self.fields[k] = [v, now]
+            try: save_json(self.path, {"boot": self.boot, "fp": self.fp, "fields": self.fields})
+            except OSError: pass
+        return changed
+
+    def collect(self) -> tuple:
+        """(full sysinfo, expired fields).  Only uncached static fields and the
+        dynamic ones are probed live."""
+        vals, expired = self.lookup()
+        missing = [k for k in self.TTL if k not in vals]
+        live = collect_sysinfo(missing + list(self.DYNAMIC))
+        if missing: self.update({k: live[k] for k in missing if k in live})
+        return {**vals, **live}, expired
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  THERMAL MONITORING  (sensor registry: sysfs · WMI · NVML backends)
+# ════════════════════════════════════════════════════════════════════════════════
+# kind: "temp" (°C) | "fan" (RPM, or % for NVML);  group: cpu core gpu zone disk board
+Sensor = namedtuple("Sensor", "key kind group label value unit source")
+
+# group -> (warm, hot) °C
+TEMP_LIMITS = {"cpu": (70, 85), "core": (70, 85), "zone": (70, 85),
+               "gpu": (75, 90), "disk": (50, 60), "board": (60, 80)}
+
+def sensor_status(s: Sensor) -> str:
+    if s.kind != "temp": return "normal"
+    warm, hot = TEMP_LIMITS.get(s.group, (70, 85))
+    return "hot" if s.value > hot else "warm" if s.value > warm else "normal"
+
+
+class SysfsSensors:
+    """Linux hwmon + thermal zones.  Files are discovered once and kept open;
+    read() is one pread() per sensor, so polling every second is cheap."""
+    name = "sysfs"
+    _GROUPS = {"coretemp": "cpu", "k10temp": "cpu", "zenpower": "cpu", "cpu_thermal": "cpu",
+               "amdgpu": "gpu", "radeon": "gpu", "nouveau": "gpu",
+               "nvme": "disk", "drivetemp": "disk", "acpitz": "zone"}
+
+    def __init__(self, root: str = "/sys/class"):
+        self._files = []                # (fd, key, kind, group, label, scale)
+        for hw in sorted(glob.glob(os.path.join(root, "hwmon", "hwmon*"))):
+            chip  = self._read_text(os.path.join(hw, "name")) or os.path.basename(hw)
+            group = self._GROUPS.get(chip, "board")
+            for kind, pat, scale in (("temp", "temp*_input", 1000), ("fan", "fan*_input", 1)):
+                for f in sorted(glob.glob(os.path.join(hw, pat))):
+                    base  = f[:-len("_input")]
+                    label = self._read_text(base + "_label") or f"{chip} {os.path.basename(base)}"
+                    g = "core" if group == "cpu" and label.lower().startswith("core") else group
+                    self._open(f, f"{os.path.basename(hw)}/{os.path.basename(base)}",
+                               kind, g, label, scale)
+        for z in sorted(glob.glob(os.path.join(root, "thermal", "thermal_zone*"))):
+            ztype = self._read_text(os.path.join(z, "type")) or os.path.basename(z)
+            group = "cpu" if ztype in ("x86_pkg_temp", "cpu-thermal") else "zone"
+            self._open(os.path.join(z, "temp"), os.path.basename(z), "temp", group, ztype, 1000)
+
+    @staticmethod
+    def _read_text(path: str) -> str:
         try:
-            h = pynvml.nvmlDeviceGetHandleByIndex(0)
-            temp = pynvml.nvmlDeviceGetTemperature(h, pynvml.NVML_TEMPERATURE_GPU)
-            t["gpu_temp"] = f"{temp} °C"
-            t["gpu_status"] = ("hot" if temp > 90
-                               else "warm" if temp > 75 else "normal")
-        except Exception:
-            t["gpu_temp"] = None
-    else:
-        t["gpu_temp"] = None
+            with open(path, "r") as f: return f.read().strip()
+        except OSError: return ""
+
+    def _open(self, path, key, kind, group, label, scale):
+        try: self._files.append((os.open(path, os.O_RDONLY), key, kind, group, label, scale))
+        except OSError: pass
+
+    def available(self) -> bool: return bool(self._files)
+
+    def read(self) -> list:
+        out = []
+        for fd, key, kind, group, label, scale in self._files:
+            try: v = int(os.pread(fd, 32, 0)) / scale
+            except (OSError, ValueError): continue
+            out.append(Sensor(key, kind, group, label, v, "°C" if kind == "temp" else "RPM", self.name))
+        return out
+
+    def close(self):
+        for fd, *_ in self._files:
+            try: os.close(fd)
+            except OSError: pass
+        self._files = []
+
+
+class WmiSensors:
+    """Every ACPI thermal zone, plus LibreHardwareMonitor's per-core
+    temperatures and real fan RPMs when its WMI provider is running."""
+    name = "wmi"
+
+    def __init__(self, provider=None):
+        self._wmi = provider
+
+    def available(self) -> bool: return self._wmi is not None or os.name == "nt"
+
+    def read(self) -> list:
+        out = []
+        for r in wmi_query("SELECT InstanceName, CurrentTemperature "
+                           "FROM MSAcpi_ThermalZoneTemperature", "root/wmi", self._wmi):
+            if r.get("CurrentTemperature") is None: continue
+            name = str(r.get("InstanceName") or "zone")
+            out.append(Sensor(name, "temp", "zone", name.split("\\")[-1],
+                              r["CurrentTemperature"] / 10 - 273.15, "°C", self.name))
+        for r in wmi_query("SELECT Identifier, Name, SensorType, Value FROM Sensor "
+                           "WHERE SensorType = 'Temperature' OR SensorType = 'Fan'",
+                           "root/LibreHardwareMonitor", self._wmi):
+            ident, label, v = str(r.get("Identifier") or ""), str(r.get("Name") or ""), r.get("Value")
+            if v is None: continue
+            kind  = "temp" if r.get("SensorType") == "Temperature" else "fan"
+            group = ("gpu" if "gpu" in ident else "disk" if "/hdd" in ident or "/nvme" in ident
+                     else ("core" if "core" in label.lower() else "cpu") if "cpu" in ident
+                     else "board")
+            out.append(Sensor(ident, kind, group, label, float(v),
+                              "°C" if kind == "temp" else "RPM", self.name))
+        return out
+
+    def close(self): pass
+
+
+class NvmlSensors:
+    """Core temperature and fan duty (%) of every NVIDIA GPU."""
+    name = "nvml"
+
+    def __init__(self):
+        self._gpus = []
+        if GPU_OK:
+            try:
+                for i in range(pynvml.nvmlDeviceGetCount()):
+                    h = pynvml.nvmlDeviceGetHandleByIndex(i)
+                    n = pynvml.nvmlDeviceGetName(h)
+                    self._gpus.append((i, h, n.decode() if isinstance(n, bytes) else n))
+            except Exception: pass
 
-    # ── CPU fan speed via WMI ──────────────────────────────────────────────────
-    try:
-        fan = ps_query(
-            "(Get-CimInstance -Namespace root/wmi MSAcpi_ThermalZoneTemperature "
-            "| Select-Object -First 1).ThermalZone")
-        fan_raw = ps_query(
-            "(Get-CimInstance Win32_Fan | Select-Object -First 1).DesiredSpeed")
-        t["cpu_fan"] = f"{fan_raw} RPM" if fan_raw else None
-    except Exception:
-        t["cpu_fan"] = None
+    def available(self) -> bool: return bool(self._gpus)
+
+    def read(self) -> list:
+        out = []
+        for i, h, name in self._gpus:
+            try:
+                out.append(Sensor(f"gpu{i}", "temp", "gpu", name, float(
+                    pynvml.nvmlDeviceGetTemperature(h, pynvml.NVML_TEMPERATURE_GPU)), "°C", self.name))
+            except Exception: pass
+            try:
+                out.append(Sensor(f"gpu{i}/fan", "fan", "gpu", name,
+                                  float(pynvml.nvmlDeviceGetFanSpeed(h)), "%", self.name))
+            except Exception: pass
+        return out
+
+    def close(self): pass
+
+
+class SensorRegistry:
+    """All available backends, read in one pass."""
 
+    def __init__(self, backends=None):
+        cands = backends if backends is not None else [SysfsSensors(), WmiSensors(), NvmlSensors()]
+        self.backends = [b for b in cands if b.available()]
+
+    def read(self) -> list:
+        out = []
+        for b in self.backends:
+            try: out.extend(b.read())
+            except Exception: pass
+        return out
+
+    def close(self):
+        for b in self.backends: b.close()
+
+
+_SENSORS = None
+
+def sensors() -> SensorRegistry:
+    global _SENSORS
+    if _SENSORS is None: _SENSORS = SensorRegistry()
+    return _SENSORS
+
+
+@traced(cat="collector")
+def collect_thermal(reg: SensorRegistry = None) -> dict:
+    """Headline CPU / GPU / fan readings plus every sensor under "sensors"."""
+    all_s = (reg or sensors()).read()
+    t = {"sensors": all_s, "cpu_temp": None, "gpu_temp": None, "cpu_fan": None}
+    temps = [s for s in all_s if s.kind == "temp"]
+    for key, groups in (("cpu", ("cpu", "core")), ("cpu", ("zone",)), ("gpu", ("gpu",))):
+        if t[f"{key}_temp"]: continue
+        hot = max((s for s in temps if s.group in groups), key=lambda s: s.value, default=None)
+        if hot:
+            t[f"{key}_temp"] = f"{hot.value:.1f} °C"
+            t[f"{key}_status"] = sensor_status(hot)
+    fans = [s for s in all_s if s.kind == "fan" and s.unit == "RPM"]
+    fan = next((s for s in fans if "cpu" in s.label.lower()), fans[0] if fans else None)
+    if fan: t["cpu_fan"] = f"{fan.value:.0f} RPM"
     return t
 
 
+# ════════════════════════════════════════════════════════════════════════════════
+#  LIVE METRICS  (one bulk psutil call per source per tick · rates from deltas)
+# ════════════════════════════════════════════════════════════════════════════════
+_SYS_VOLUME = (os.environ.get("SystemDrive", "C:") + "\\") if os.name == "nt" else "/"
+
+class MetricSampler:
+    """Dashboard sampler.  Per-core CPU comes from cpu_percent(percpu=True)
+    since the previous call (no blocking interval); disk and network
+    throughput from system-wide io counter deltas.  The volume list is
+    re-read every VOLUME_EVERY ticks, usage for each volume every tick."""
+
+    VOLUME_EVERY = 30
+
+    def __init__(self):
+        self._t = self._dio = self._nio = None
+        self._vols, self._tick = [], 0
+        if PSUTIL_OK: psutil.cpu_percent(percpu=True)          # prime the delta
+
+    def _volumes(self) -> list:
+        out = []
+        for part in psutil.disk_partitions(all=False):
+            if "cdrom" in part.opts or not part.fstype: continue   # empty drives / optical
+            out.append(part.mountpoint)
+        return out
+
+    @staticmethod
+    def _rate(new, old, dt, *fields) -> list:
+        if new is None or old is None or dt <= 0: return [0.0] * len(fields)
+        return [max(0.0, (getattr(new, f) - getattr(old, f)) / dt) for f in fields]
+
+    def sample(self) -> dict:
+        now = time.monotonic()
+        dt = now - self._t if self._t else 0.0
+        cores = psutil.cpu_percent(percpu=True)
+        if self._tick % self.VOLUME_EVERY == 0: self._vols = self._volumes()
+        self._tick += 1
+        vols = []
+        for m in self._vols:
+            try: u = psutil.disk_usage(m)
+            except OSError: continue
+            vols.append((m, u.percent, u.used, u.total))
+        try: dio = psutil.disk_io_counters(perdisk=False)
+        except Exception: dio = None                           # no physical disks (containers)
+        nio = psutil.net_io_counters(pernic=False)
+        d = {"cpu": sum(cores) / len(cores) if cores else 0.0, "cores": cores,
+             "ram": psutil.virtual_memory().percent, "volumes": vols,
+             "disk": next((v[1] for v in vols if v[0].lower() == _SYS_VOLUME.lower()),
+                          max((v[1] for v in vols), default=0.0))}
+        d["disk_read"], d["disk_write"] = self._rate(dio, self._dio, dt, "read_bytes", "write_bytes")
+        d["net_recv"], d["net_sent"]    = self._rate(nio, self._nio, dt, "bytes_recv", "bytes_sent")
+        self._t, self._dio, self._nio = now, dio, nio
+        return d
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  ALERT RULES  (O(1) rolling statistics over the monitor stream)
+# ════════════════════════════════════════════════════════════════════════════════
+# alert_rules.json holds a list of rules; each compares one statistic of one
+# metric with a threshold and may require the condition to hold for a while:
+#   {"name": "CPU pegged", "metric": "cpu", "stat": "value", "op": ">",
+#    "threshold": 95, "for": 300}
+#   {"name": "GPU heating up", "metric": "gpu_temp", "stat": "rate",
+#    "window": 60, "op": ">", "threshold": 2}            # rate is per minute
+# metrics: cpu ram disk gpu (%) · cpu_temp gpu_temp (°C)
+#          disk_read disk_write net_recv net_sent (bytes/s)
+# stat: value | ewma | max | rate   — over `window` seconds (default 60)
+# for: seconds the condition must hold · cooldown: min seconds between firings
+ALERT_RULES_DEFAULT = [
+    {"name": "CPU pegged",          "metric": "cpu",      "stat": "value", "op": ">",
+     "threshold": 95, "for": 300},
+    {"name": "Memory pressure",     "metric": "ram",      "stat": "ewma",  "op": ">",
+     "threshold": 90, "window": 120, "for": 120},
+    {"name": "Disk almost full",    "metric": "disk",     "stat": "value", "op": ">",
+     "threshold": 90, "cooldown": 3600},
+    {"name": "CPU overheating",     "metric": "cpu_temp", "stat": "ewma",  "op": ">",
+     "threshold": 85, "window": 30, "for": 30, "severity": "critical"},
+    {"name": "GPU overheating",     "metric": "gpu_temp", "stat": "max",   "op": ">",
+     "threshold": 88, "window": 30, "for": 30, "severity": "critical"},
+    {"name": "GPU heating up",      "metric": "gpu_temp", "stat": "rate",  "op": ">",
+     "threshold": 2, "window": 60, "for": 60},
+]
+_ALERT_OPS = {">": lambda a, b: a > b, ">=": lambda a, b: a >= b,
+              "<": lambda a, b: a < b, "<=": lambda a, b: a <= b}
+
+Alert = namedtuple("Alert", "rule state metric stat value threshold op severity ts")
+
+
+class RollingStat:
+    """EWMA, windowed max and rate of change (per minute) of one metric over
+    `window` seconds.  The max is a monotonic deque and the rate compares the
+    newest sample with the oldest one still in the window, so every update is
+    amortised O(1)."""
+    __slots__ = ("window", "value", "ewma", "_t", "_max", "_hist")
+
+    def __init__(self, window: float):
+        self.window = float(window)
+        self.value = self.ewma = self._t = None
+        self._max  = collections.deque()
+        self._hist = collections.deque()
+
+    def add(self, t: float, v: float):
+        if self.ewma is None: self.ewma = v
+        else:                 self.ewma += (1 - math.exp(-(t - self._t) / self.window)) * (v - self.ewma)
+        self.value, self._t, cut = v, t, t - self.window
+        mx = self._max
+        while mx and mx[-1][1] <= v: mx.pop()
+        mx.append((t, v))
+        while mx[0][0] < cut: mx.popleft()
+        h = self._hist
+        h.append((t, v))
+        while h[0][0] < cut: h.popleft()
+
+    def get(self, stat: str):
+        if stat == "value": return self.value
+        if stat == "ewma":  return self.ewma
+        if stat == "max":   return self._max[0][1] if self._max else None
+        (t0, v0), (t1, v1) = self._hist[0], self._hist[-1]
+        return (v1 - v0) / (t1 - t0) * 60 if t1 - t0 >= self.window / 2 else None   # rate
+
+
+class AlertRule:
+    __slots__ = ("name", "metric", "stat", "op", "threshold", "window",
+                 "hold", "cooldown", "severity")
+    STATS = ("value", "ewma", "max", "rate")
+
+    def __init__(self, d: dict):
+        self.name, self.metric = str(d["name"]), str(d["metric"])
+        self.stat, self.op     = d.get("stat", "value"), d.get("op", ">")
+        self.threshold = float(d["threshold"])
+        self.window    = float(d.get("window", 60))
+        self.hold      = float(d.get("for", 0))
+        self.cooldown  = float(d.get("cooldown", 600))
+        self.severity  = d.get("severity", "warn")
+        if self.stat not in self.STATS or self.op not in _ALERT_OPS or self.window <= 0:
+            raise ValueError(f"bad rule {self.name!r}")
+
+
+class RulesEngine:
+    """Feeds each sample into one RollingStat per (metric, window) and walks
+    the rules: a condition that has held for `for` seconds fires once, and
+    resolves when it stops holding.  A rule whose metric is absent from the
+    sample (a deferred sensor read) is left as it was.  `sink(alert)`
+    receives both transitions."""
+
+    def __init__(self, rules, sink=None):
+        self.rules = [r if isinstance(r, AlertRule) else AlertRule(r) for r in rules]
+        self.sink  = sink
+        self._stats = {}
+        for r in self.rules: self._stats.setdefault((r.metric, r.window), RollingStat(r.window))
+        self._since: dict = {}                   # rule -> monotonic time condition began
+        self._last:  dict = {}                   # rule -> monotonic time of last firing
+        self.firing: set = set()
+
+    @property
+    def metrics(self) -> set:
+        return {m for m, _ in self._stats}
+
+    def feed(self, sample: dict, t: float = None) -> list:
+        t = time.monotonic() if t is None else t
+        for (m, _), st in self._stats.items():
+            v = sample.get(m)
+            if v is not None: st.add(t, float(v))
+        out = []
+        for r in self.rules:
+            if r.metric not in sample: continue
+            v = self._stats[r.metric, r.window].get(r.stat) if sample.get(r.metric) is not None else None
+            if v is None or not _ALERT_OPS[r.op](v, r.threshold):
+                self._since.pop(r, None)
+                if r in self.firing:
+                    self.firing.discard(r)
+                    out.append(Alert(r.name, "resolved", r.metric, r.stat, v, r.threshold,
+                                     r.op, r.severity, time.time()))
+                continue
+            since = self._since.setdefault(r, t)
+            if (r not in self.firing and t - since >= r.hold
+                    and t - self._last.get(r, -math.inf) >= r.cooldown):
+                self.firing.add(r); self._last[r] = t
+                out.append(Alert(r.name, "firing", r.metric, r.stat, v, r.threshold,
+                                 r.op, r.severity, time.time()))
+        if self.sink:
+            for a in out: self.sink(a)
+        return out
+
+def load_alert_rules(path: str = None) -> list:
+    """Rules from alert_rules.json (written with the defaults on first run);
+    malformed rules are skipped."""
+    path = path or app_path("alert_rules.json")
+    raw = load_json(path, None)
+    if raw is None:
+        raw = ALERT_RULES_DEFAULT
+        try: save_json(path, raw)
+        except OSError: pass
+    rules = []
+    for d in raw if isinstance(raw, list) else ():
+        try: rules.append(AlertRule(d))
+        except (KeyError, TypeError, ValueError): continue
+    return rules
+
+def thermal_metrics(reg: SensorRegistry = None) -> dict:
+    """Hottest CPU (package / core / ACPI zone) and GPU temperature in °C."""
+    out = {"cpu_temp": None, "gpu_temp": None}
+    for s in (reg or sensors()).read():
+        if s.kind != "temp": continue
+        k = "gpu_temp" if s.group == "gpu" else "cpu_temp" if s.group in ("cpu", "core", "zone") else None
+        if k and (out[k] is None or s.value > out[k]): out[k] = s.value
+    return out
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  PROCESS MONITOR  (psutil oneshot batches · per-pid deltas · row diffs)
+# ════════════════════════════════════════════════════════════════════════════════
+class ProcessSampler:
+    """One pass over every process per sample().  Process.as_dict() reads the
+    requested attributes inside oneshot(), so each process costs one batched
+    fetch (a single proc_info call on Windows).  CPU time and memory are read
+    every pass; I/O, thread and handle counts for a rotating third of the
+    processes, and the name only once per pid.  CPU % and I/O rates are
+    deltas against the previous reading.  sample() returns (changed rows,
+    vanished pids), so the table only receives rows whose values moved."""
+
+    FAST = ["create_time", "cpu_times", "memory_info"]
+    SLOW = ["io_counters", "num_threads", "num_handles" if os.name == "nt" else "num_fds"]
+    SLOW_EVERY = 3
+
+    def __init__(self):
+        self._procs: dict = {}          # pid -> psutil.Process
+        self._cpu:   dict = {}          # pid -> (create_time, t, cpu seconds)
+        self._io:    dict = {}          # pid -> (t, io bytes)
+        self.rows:   dict = {}          # pid -> last row handed out
+        self.cost  = 0.0                # EWMA seconds per sample()
+        self._pass = 0
+        self._ncpu = (psutil.cpu_count() if PSUTIL_OK else None) or 1
+
+    def sample(self) -> tuple:
+        t0 = time.perf_counter()
+        now, pids = time.monotonic(), set(psutil.pids())
+        self._pass += 1
+        gone = [pid for pid in self._procs if pid not in pids]
+        upserts, fast, slow, full = [], self.FAST, self.FAST + self.SLOW, self.FAST + self.SLOW + ["name"]
+        for pid in pids:
+            p = self._procs.get(pid)
+            try:
+                if p is None:
+                    p = self._procs[pid] = psutil.Process(pid); attrs = full
+                else:
+                    attrs = slow if (pid // 4 + self._pass) % self.SLOW_EVERY == 0 else fast
+                d = p.as_dict(attrs, ad_value=None)
+            except psutil.Error:
+                gone.append(pid); continue
+            prev_row = self.rows.get(pid)
+            ct, created = d["cpu_times"], d["create_time"]
+            if prev_row and self._cpu.get(pid, (None,))[0] != created:      # pid reused
+                prev_row = None; self._io.pop(pid, None)
+                d.update(p.as_dict(full, ad_value=None)); attrs = full
+            cpu_s, cpu = (ct.user + ct.system if ct else None), 0.0
+            prev = self._cpu.get(pid)
+            self._cpu[pid] = (created, now, cpu_s)
+            if prev and prev_row and cpu_s is not None and prev[2] is not None and now > prev[1]:
+                cpu = max(0.0, (cpu_s - prev[2]) / (now - prev[1]) / self._ncpu * 100)
+            row = dict(prev_row) if prev_row else {"pid": pid, "name": "?", "io": 0.0,
+                                                  "handles": None, "threads": None}
+            if "name" in d: row["name"] = d["name"] or "?"
+            if attrs is not fast:
+                ioc = d["io_counters"]
+                if ioc:
+                    io_b, pio = ioc.read_bytes + ioc.write_bytes, self._io.get(pid)
+                    self._io[pid] = (now, io_b)
+                    if pio and now > pio[0]: row["io"] = round(max(0.0, (io_b - pio[1]) / (now - pio[0]) / 1024), 1)
+                row["threads"] = d["num_threads"]
+                row["handles"] = d.get("num_handles", d.get("num_fds"))
+            mem = d["memory_info"]
+            row["cpu"] = round(cpu, 1)
+            row["rss"] = round(mem.rss / 1024**2, 1) if mem else 0.0
+            if prev_row != row:
+                self.rows[pid] = row; upserts.append(row)
+        for pid in gone:
+            for m in (self._procs, self._cpu, self._io, self.rows): m.pop(pid, None)
+        dt = time.perf_counter() - t0
+        self.cost = dt if self.cost == 0 else self.cost + 0.3 * (dt - self.cost)
+        return upserts, gone
+
+
 # ════════════════════════════════════════════════════════════════════════════════
 #  STARTUP MANAGER  (Registry HKLM + HKCU)
 # ════════════════════════════════════════════════════════════════════════════════
 _RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 _DISABLED_PREFIX = "HKEY_DISABLED_"
 
+@traced(cat="collector")
 def get_startup_entries() -> list:
     """Return list of dicts: {name, path, hive, disabled}."""
     entries = []
@@ -635,6 +3158,7 @@ def toggle_startup_entry(entry: dict, disable: bool) -> bool:
 # ════════════════════════════════════════════════════════════════════════════════
 #  RAM OPTIMISER
 # ════════════════════════════════════════════════════════════════════════════════
+@traced(cat="collector")
 def optimise_ram() -> tuple:
     if not PSUTIL_OK: return 0, 0
     before = psutil.virtual_memory().used
@@ -659,6 +3183,589 @@ def optimise_ram() -> tuple:
     return before, psutil.virtual_memory().used
 
 
+# ════════════════════════════════════════════════════════════════════════════════
+#  DNS BENCHMARK  (raw UDP queries · many in flight per resolver · one selector)
+# ════════════════════════════════════════════════════════════════════════════════
+# Each resolver gets one connected UDP socket (the kernel drops replies from
+# other addresses) with up to `inflight` outstanding queries matched back by
+# ID; every socket shares one selector loop.  "Cached" latency is a repeat
+# lookup of a popular name after a warm-up query; "uncached" asks for a random
+# label under the same zones, which no resolver can have cached, so it times a
+# full recursive lookup.  NOERROR and NXDOMAIN count as answers; SERVFAIL,
+# REFUSED and timeouts as failures.
+DNS_ALTERNATIVES = [(("1.1.1.1", 53), "Cloudflare"), (("8.8.8.8", 53), "Google"),
+                    (("9.9.9.9", 53), "Quad9"), (("208.67.222.222", 53), "OpenDNS")]
+DNS_NAMES = ("microsoft.com", "google.com", "youtube.com", "amazon.com", "wikipedia.org",
+             "github.com", "cloudflare.com", "windowsupdate.com", "office.com", "steampowered.com")
+DnsResult = namedtuple("DnsResult",
+                       "server label cached_p50 cached_p90 uncached_p50 uncached_p90 fail_rate sent")
+
+def dns_query(qid: int, name: str, qtype: int = 1) -> bytes:
+    """Recursion-desired query for `name` (A record by default)."""
+    qname = b"".join(bytes([len(l)]) + l for l in name.strip(".").encode("ascii").split(b".")) + b"\0"
+    return struct.pack(">HHHHHH", qid, 0x0100, 1, 0, 0, 0) + qname + struct.pack(">HH", qtype, 1)
+
+def system_resolvers(provider=None) -> list:
+    """Configured DNS servers (IP strings), in order, without duplicates.
+    From WMI on Windows or when a `provider` is given, else resolv.conf."""
+    out = []
+    if os.name == "nt" or provider is not None:
+        for r in wmi_query("SELECT DNSServerSearchOrder FROM Win32_NetworkAdapterConfiguration "
+                           "WHERE IPEnabled = TRUE", provider=provider):
+            v = r.get("DNSServerSearchOrder") or ()
+            out += [v] if isinstance(v, str) else list(v)
+    else:
+        try:
+            with open("/etc/resolv.conf", encoding="utf-8") as f:
+                out = [l.split()[1] for l in f if l.startswith("nameserver") and len(l.split()) > 1]
+        except OSError: pass
+    return list(dict.fromkeys(out))
+
+class _DnsTarget:
+    __slots__ = ("addr", "label", "sock", "queue", "pending", "cached", "uncached", "failed", "sent",
+                 "answered", "misses")
+
+    def __init__(self, addr, label):
+        self.addr, self.label = addr, label
+        fam, _, _, _, sa = socket.getaddrinfo(addr[0], addr[1], type=socket.SOCK_DGRAM)[0]
+        self.sock = socket.socket(fam, socket.SOCK_DGRAM)
+        self.sock.setblocking(False); self.sock.connect(sa)
+        self.queue, self.pending = collections.deque(), {}
+        self.cached, self.uncached, self.failed, self.sent = [], [], 0, 0
+        self.answered, self.misses = False, 0
+
+def _dns_run(targets: list, inflight: int, timeout: float, cancel=None):
+    """Drain every target's queue; results land on the targets.  A target
+    that lets `inflight` queries time out without ever answering is written
+    off, so a dead resolver costs one timeout rather than one per query."""
+    sel, rnd = selectors.DefaultSelector(), random.Random()
+    for t in targets: sel.register(t.sock, selectors.EVENT_READ, t)
+    try:
+        while True:
+            if cancel: cancel.check()
+            now, busy = time.perf_counter(), False
+            for t in targets:
+                for qid in [q for q, (_, t0) in t.pending.items() if now - t0 > timeout]:
+                    if t.pending.pop(qid)[0] != "warm": t.failed += 1
+                    t.misses += 1
+                if t.misses >= inflight and not t.answered:
+                    lost = sum(k != "warm" for k, _ in t.queue)
+                    t.sent += lost; t.failed += lost; t.queue.clear()
+                while t.queue and len(t.pending) < inflight:
+                    kind, name = t.queue.popleft()
+                    qid = rnd.randrange(65536)
+                    while qid in t.pending: qid = rnd.randrange(65536)
+                    if kind != "warm": t.sent += 1
+                    try:
+                        t.sock.send(dns_query(qid, name))
+                        t.pending[qid] = (kind, time.perf_counter())
+                    except OSError:
+                        if kind != "warm": t.failed += 1
+                busy |= bool(t.pending or t.queue)
+            if not busy: return
+            for key, _ in sel.select(min(timeout, 0.25)):
+                t = key.data
+                while True:
+                    try: data = t.sock.recv(4096)
+                    except OSError: break              # drained, or ICMP unreachable (WSAECONNRESET)
+                    t1 = time.perf_counter()
+                    if len(data) < 12: continue
+                    qid, flags = struct.unpack_from(">HH", data)
+                    q = t.pending.pop(qid, None) if flags & 0x8000 else None
+                    if not q: continue
+                    t.answered = True
+                    if q[0] == "warm": continue
+                    if flags & 0xF in (0, 3): getattr(t, q[0]).append((t1 - q[1]) * 1000)
+                    else: t.failed += 1
+    finally:
+        sel.close()
+
+@traced(cat="net")
+def dns_benchmark(servers: list, names=DNS_NAMES, rounds: int = 3, inflight: int = 8,
+                  timeout: float = 2.0, cancel=None) -> list:
+    """Benchmark `servers` [((host, port), label)] concurrently; a DnsResult per
+    server, latencies in ms.  Each server gets len(names) × rounds cached and
+    as many uncached queries, interleaved."""
+    targets = []
+    try:
+        for addr, label in servers:
+            try: targets.append(_DnsTarget(addr, label))
+            except OSError: continue
+        for t in targets: t.queue.extend(("warm", n) for n in names)
+        _dns_run(targets, inflight, timeout, cancel)
+        rnd = random.Random()
+        for t in targets:
+            plan = [("cached", n) for n in names for _ in range(rounds)]
+            plan += [("uncached", f"pca-{rnd.getrandbits(48):012x}.{n}") for n in names for _ in range(rounds)]
+            rnd.shuffle(plan); t.queue.extend(plan)
+        _dns_run(targets, inflight, timeout, cancel)
+    finally:
+        for t in targets: t.sock.close()
+    out = []
+    for t in targets:
+        c, u = sorted(t.cached), sorted(t.uncached)
+        out.append(DnsResult(t.addr, t.label, percentile(c, 50), percentile(c, 90),
+                             percentile(u, 50), percentile(u, 90),
+                             t.failed / t.sent if t.sent else 1.0, t.sent))
+    return out
+
+def best_resolver(results: list, max_fail: float = 0.05):
+    """Lowest cached + uncached median among resolvers failing ≤ max_fail."""
+    ok = [r for r in results if r.sent and r.fail_rate <= max_fail]
+    return min(ok, key=lambda r: r.cached_p50 + r.uncached_p50, default=None)
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  FLEET COLLECTOR  (agents → gzip JSON batches over HTTP → indexed SQLite)
+# ════════════════════════════════════════════════════════════════════════════════
+# Agents spool one report per Deep Scan and POST the spool as a single gzip
+# JSON array.  The collector folds a batch into one transaction: crashes are
+# de-duplicated per (machine, time, code, source) because agents resend their
+# whole crash history, and disks keep only the latest reading per volume.
+FLEET_SCHEMA = """
+CREATE TABLE IF NOT EXISTS machines (name TEXT PRIMARY KEY, os TEXT, cpu TEXT, last_seen REAL);
+CREATE TABLE IF NOT EXISTS reports  (machine TEXT, ts REAL, received REAL);
+CREATE TABLE IF NOT EXISTS crashes  (machine TEXT, time TEXT, code TEXT, source TEXT, culprit TEXT,
+                                     UNIQUE (machine, time, code, source));
+CREATE TABLE IF NOT EXISTS disks    (machine TEXT, mount TEXT, percent REAL, total_gb REAL, ts REAL,
+                                     PRIMARY KEY (machine, mount));
+CREATE INDEX IF NOT EXISTS ix_reports_machine ON reports (machine, ts);
+CREATE INDEX IF NOT EXISTS ix_crashes_code    ON crashes (code, time, machine);
+CREATE INDEX IF NOT EXISTS ix_crashes_time    ON crashes (time);
+CREATE INDEX IF NOT EXISTS ix_disks_percent   ON disks (percent);
+"""
+FLEET_MAX_BODY = 8 * 1024**2          # compressed
+FLEET_MAX_RAW  = 64 * 1024**2         # after gunzip
+FLEET_SPOOL_MAX = 50                  # reports kept while the collector is down
+
+def _fleet_text(v):
+    """A TEXT column value as sent by an agent; anything else is rejected."""
+    if v is None or isinstance(v, str): return v
+    if isinstance(v, (int, float)) and not isinstance(v, bool): return str(v)
+    raise TypeError(type(v).__name__)
+
+def _fleet_real(v):
+    if v is None: return None
+    try: v = float(v)
+    except OverflowError: raise ValueError("out of range") from None
+    if not math.isfinite(v): raise ValueError("not finite")
+    return v
+
+def _fleet_list(v) -> list:
+    return [x for x in v if isinstance(x, dict)] if isinstance(v, list) else []
+
+def scan_payload(crashes: list, sysinfo: dict = None) -> dict:
+    """One agent report: identity, crash list and current volume usage."""
+    disks = []
+    if PSUTIL_OK:
+        for part in psutil.disk_partitions(all=False):
+            try: u = psutil.disk_usage(part.mountpoint)
+            except OSError: continue
+            disks.append({"mount": part.mountpoint, "percent": u.percent,
+                          "total_gb": round(u.total / 1024**3, 1)})
+    si = sysinfo or {}
+    return {"v": 1, "machine": socket.gethostname(), "ts": time.time(),
+            "os": si.get("os"), "cpu": si.get("cpu"), "disks": disks,
+            "crashes": [{"time": c["time"], "code": c["code"], "source": c.get("file", ""),
+                         "culprit": c.get("culprit")} for c in crashes]}
+
+
+class FleetStore:
+    """SQLite in WAL mode: one writer connection behind a lock, one reader
+    connection per thread, so aggregate queries never wait on ingest."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock  = threading.Lock()
+        self._local = threading.local()
+        self._w = self._connect()
+        self._w.executescript(FLEET_SCHEMA)
+
+    def _connect(self):
+        con = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        con.execute("PRAGMA journal_mode=WAL"); con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    def _r(self):
+        con = getattr(self._local, "con", None)
+        if con is None: con = self._local.con = self._connect()
+        return con
+
+    def ingest(self, reports: list) -> int:
+        now = time.time()
+        machines, rows, crashes, disks = {}, [], [], []
+        # A malformed report is skipped, and so is a malformed crash or disk
+        # row inside a good one: nothing an agent sends can fail the batch.
+        for r in reports:
+            m = str(r.get("machine") or "")[:128]
+            if not m: continue
+            try:
+                ts = _fleet_real(r.get("ts") or now)
+                os_, cpu = _fleet_text(r.get("os")), _fleet_text(r.get("cpu"))
+            except (TypeError, ValueError):
+                continue
+            machines[m] = (m, os_, cpu, ts)
+            rows.append((m, ts, now))
+            for c in _fleet_list(r.get("crashes")):
+                try: crashes.append((m, _fleet_text(c.get("time")), _fleet_text(c.get("code")),
+                                     _fleet_text(c.get("source")) or "", _fleet_text(c.get("culprit"))))
+                except TypeError: continue
+            for d in _fleet_list(r.get("disks")):
+                try: disks.append((m, _fleet_text(d.get("mount")), _fleet_real(d.get("percent")),
+                                   _fleet_real(d.get("total_gb")), ts))
+                except (TypeError, ValueError): continue
+        with self._lock, self._w:
+            self._w.executemany(
+                "INSERT INTO machines VALUES (?,?,?,?) ON CONFLICT(name) DO UPDATE SET "
+                "os=excluded.os, cpu=excluded.cpu, last_seen=MAX(last_seen, excluded.last_seen)",
+                machines.values())
+            self._w.executemany("INSERT INTO reports VALUES (?,?,?)", rows)
+            self._w.executemany("INSERT OR IGNORE INTO crashes VALUES (?,?,?,?,?)", crashes)
+            self._w.executemany(
+                "INSERT INTO disks VALUES (?,?,?,?,?) ON CONFLICT(machine, mount) DO UPDATE SET "
+                "percent=excluded.percent, total_gb=excluded.total_gb, ts=excluded.ts "
+                "WHERE excluded.ts >= disks.ts", disks)
+        return len(rows)
+
+    def top_crashes(self, days: int = None, limit: int = 10) -> list:
+        since = (datetime.fromtimestamp(time.time() - days * 86400).strftime("%Y-%m-%d %H:%M")
+                 if days else "")
+        cur = self._r().execute(
+            "SELECT code, COUNT(*), COUNT(DISTINCT machine) FROM crashes WHERE time >= ? "
+            "GROUP BY code ORDER BY 2 DESC LIMIT ?", (since, limit))
+        return [{"code": c, "count": n, "machines": m} for c, n, m in cur]
+
+    def disks_over(self, percent: float = 90, limit: int = 500) -> list:
+        cur = self._r().execute(
+            "SELECT machine, mount, percent, total_gb, ts FROM disks WHERE percent > ? "
+            "ORDER BY percent DESC LIMIT ?", (percent, limit))
+        return [dict(zip(("machine", "mount", "percent", "total_gb", "ts"), r)) for r in cur]
+
+    def machines(self, limit: int = 1000) -> list:
+        cur = self._r().execute(
+            "SELECT name, os, cpu, last_seen FROM machines ORDER BY last_seen DESC LIMIT ?", (limit,))
+        return [dict(zip(("name", "os", "cpu", "last_seen"), r)) for r in cur]
+
+    def close(self):
+        self._w.close()
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"                # keep-alive for agents that batch
+    server_version   = "PCAnalystCollector/1"
+
+    def log_message(self, *_): pass
+
+    def _reply(self, code: int, obj):
+        body = json.dumps(obj).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers(); self.wfile.write(body)
+
+    def _authorised(self) -> bool:
+        tok = self.server.token
+        if tok and self.headers.get("X-Agent-Token") != tok:
+            self.close_connection = True        # the unread body must not be parsed as a request
+            self._reply(401, {"error": "bad token"}); return False
+        return True
+
+    def do_POST(self):
+        if not self._authorised(): return
+        if urllib.parse.urlsplit(self.path).path != "/v1/reports":
+            return self._reply(404, {"error": "not found"})
+        n = int(self.headers.get("Content-Length") or 0)
+        if n > FLEET_MAX_BODY:
+            self.close_connection = True
+            return self._reply(413, {"error": "too large"})
+        body = self.rfile.read(n)
+        try:
+            if self.headers.get("Content-Encoding", "").lower() == "gzip":
+                d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                body = d.decompress(body, FLEET_MAX_RAW)
+                if d.unconsumed_tail: return self._reply(413, {"error": "too large"})
+            data = json.loads(body)
+        except (zlib.error, ValueError):
+            return self._reply(400, {"error": "bad payload"})
+        reports = data if isinstance(data, list) else [data]
+        reports = [r for r in reports if isinstance(r, dict)]
+        with span("fleet_ingest", "fleet", reports=len(reports)):
+            try:
+                n = self.server.store.ingest(reports)
+            except sqlite3.Error:               # locked / disk full: the agent retries
+                return self._reply(503, {"error": "store unavailable"})
+            self._reply(200, {"accepted": n})
+
+    def do_GET(self):
+        if not self._authorised(): return
+        u = urllib.parse.urlsplit(self.path)
+        q = {k: v[-1] for k, v in urllib.parse.parse_qs(u.query).items()}
+        st = self.server.store
+        try:
+            if   u.path == "/health":          self._reply(200, {"ok": True})
+            elif u.path == "/v1/top-crashes":  self._reply(200, st.top_crashes(
+                int(q["days"]) if "days" in q else None, int(q.get("limit", 10))))
+            elif u.path == "/v1/disks":        self._reply(200, st.disks_over(float(q.get("over", 90))))
+            elif u.path == "/v1/machines":     self._reply(200, st.machines())
+            else:                              self._reply(404, {"error": "not found"})
+        except ValueError:
+            self._reply(400, {"error": "bad query"})
+
+
+class CollectorServer(ThreadingHTTPServer):
+    """LAN collector: POST /v1/reports (JSON or gzip JSON, one report or a
+    list); GET /v1/top-crashes?days=&limit=, /v1/disks?over=, /v1/machines."""
+    daemon_threads     = True
+    request_queue_size = 256            # listen backlog; the default 5 resets bursts
+
+    def __init__(self, addr: tuple, store: FleetStore, token: str = None):
+        super().__init__(addr, _CollectorHandler)
+        self.store, self.token = store, token
+
+    def start(self) -> threading.Thread:
+        t = threading.Thread(target=self.serve_forever, name="collector", daemon=True)
+        t.start(); return t
+
+
+class FleetAgent:
+    """Uploader: reports are appended to a local spool (one JSON per line,
+    newest FLEET_SPOOL_MAX kept) and sent as gzip batches below the
+    collector's body limit.  Batches are kept when the collector is down or
+    answers 5xx; a batch it refuses outright (other 4xx) is moved to
+    <spool>.rejected so it cannot block later uploads."""
+
+    def __init__(self, url: str, token: str = None, spool: str = None):
+        self.url   = url.rstrip("/") + "/v1/reports"
+        self.token = token
+        self.spool = spool or app_path("fleet_spool.jsonl")
+        self.rejected = 0                       # reports set aside by the last flush()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, path: str = None):
+        """Agent for fleet.json {"url": …, "token": …}; None when not configured."""
+        cfg = load_json(path or app_path("fleet.json"), {})
+        return cls(cfg["url"], cfg.get("token")) if cfg.get("url") else None
+
+    def _read(self) -> list:
+        try:
+            with open(self.spool, "r", encoding="utf-8") as f:
+                return [l for l in f.read().splitlines() if l.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _write(self, lines: list):
+        if not lines:
+            try: os.remove(self.spool)
+            except FileNotFoundError: pass
+            return
+        tmp = self.spool + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f: f.write("\n".join(lines) + "\n")
+        os.replace(tmp, self.spool)
+
+    def submit(self, report: dict):
+        # every report carries the whole crash history, so the newest ones
+        # are all that is worth keeping while the collector is down
+        with self._lock:
+            self._write((self._read() + [json.dumps(report, default=str)])[-FLEET_SPOOL_MAX:])
+
+    def _chunks(self, lines: list):
+        """Lists of spool lines whose JSON array stays under FLEET_MAX_BODY
+        uncompressed, so the gzip body does too."""
+        chunk, size = [], 2
+        for l in lines:
+            n = len(l.encode()) + 1
+            if chunk and size + n > FLEET_MAX_BODY:
+                yield chunk; chunk, size = [], 2
+            chunk.append(l); size += n
+        if chunk: yield chunk
+
+    def _post(self, chunk: list, timeout: float) -> int:
+        body = gzip.compress(("[" + ",".join(chunk) + "]").encode(), 6)
+        req = urllib.request.Request(self.url, data=body, method="POST", headers={
+            "Content-Type": "application/json", "Content-Encoding": "gzip",
+            **({"X-Agent-Token": self.token} if self.token else {})})
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            return json.load(r).get("accepted", 0)
+
+    def flush(self, timeout: float = 15) -> int:
+        """POST the spool in chunks; returns how many reports were accepted.
+        Raises OSError when the collector is unreachable or answers 5xx /
+        408 / 429; the unsent reports stay spooled."""
+        with self._lock:
+            pending, rejected, n = [], [], 0
+            for l in self._read():
+                try: json.loads(l); pending.append(l)
+                except ValueError: rejected.append(l)      # torn write: never sendable
+            try:
+                while pending:
+                    chunk = next(self._chunks(pending))
+                    try:
+                        n += self._post(chunk, timeout)
+                    except urllib.error.HTTPError as e:
+                        if not 400 <= e.code < 500 or e.code in (408, 429): raise
+                        rejected += chunk               # 400/401/413…: resending cannot help
+                    del pending[:len(chunk)]
+            finally:
+                self._write(pending)
+                self.rejected = len(rejected)
+                if rejected:
+                    with open(self.spool + ".rejected", "w", encoding="utf-8") as f:
+                        f.write("\n".join(rejected) + "\n")
+            return n
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  SNAPSHOTS  (content-addressed zlib sections · structural diff between runs)
+# ════════════════════════════════════════════════════════════════════════════════
+# A snapshot is a small manifest {id, ts, label, sections: {name: sha1}}; each
+# section is stored once as zlib-compressed canonical JSON under its hash, so
+# a section that did not change since the last run costs nothing and diffing
+# two snapshots skips it without loading it.
+SNAP_VERSION = 1
+
+# list sections: record -> identity key (everything else is compared as content)
+SNAP_KEYS = {
+    "startup": lambda r: f"{r['hive']}\\{r['name']}",
+    "drivers": lambda r: r["id"],
+    "crashes": lambda r: f"{r['time']}|{r['code']}|{r['file']}",
+}
+
+@traced(cat="collector")
+def collect_drivers() -> list:
+    """Signed PnP drivers: {id, device, vendor, version, date (YYYY-MM-DD)}."""
+    out = []
+    for r in wmi_query("SELECT DeviceID, DeviceName, Manufacturer, DriverVersion, DriverDate "
+                       "FROM Win32_PnPSignedDriver"):
+        if not (r.get("DeviceID") and r.get("DeviceName")): continue
+        dt = wmi_datetime(r.get("DriverDate"))
+        out.append({"id": r["DeviceID"], "device": r["DeviceName"].strip(),
+                    "vendor": (r.get("Manufacturer") or "").strip(),
+                    "version": r.get("DriverVersion") or "",
+                    "date": dt.strftime("%Y-%m-%d") if dt else ""})
+    return sorted(out, key=lambda d: d["id"])
+
+def collect_snapshot(crashes: list = (), sysinfo: dict = None) -> dict:
+    """Section data for a snapshot.  Only static sysinfo fields are kept, so
+    RAM-free / uptime noise never shows up as a change."""
+    si = sysinfo if sysinfo is not None else collect_sysinfo(list(SysinfoCache.TTL))
+    return {
+        "sysinfo": {k: si.get(k) for k in SysinfoCache.TTL if k in si},
+        "startup": sorted(({k: v for k, v in e.items() if not k.startswith("_")}
+                           for e in get_startup_entries()), key=SNAP_KEYS["startup"]),
+        "drivers": collect_drivers(),
+        "crashes": sorted(({k: c.get(k) for k in ("time", "code", "file", "culprit")}
+                           for c in crashes), key=SNAP_KEYS["crashes"]),
+    }
+
+def diff_section(old, new, key=None) -> dict:
+    """dict sections → {"changed": {k: (old, new)}}; list sections (with `key`)
+    → {"added": [...], "removed": [...], "changed": [(old, new), ...]}."""
+    if key is None:
+        old, new = old or {}, new or {}
+        return {"changed": {k: (old.get(k), new.get(k)) for k in sorted(old.keys() | new.keys())
+                            if old.get(k) != new.get(k)}}
+    a = {key(r): r for r in old or ()}
+    b = {key(r): r for r in new or ()}
+    return {"added":   [b[k] for k in b.keys() - a.keys()],
+            "removed": [a[k] for k in a.keys() - b.keys()],
+            "changed": [(a[k], b[k]) for k in a.keys() & b.keys() if a[k] != b[k]]}
+
+
+class SnapshotStore:
+    """snapshots/objects/<sha[:2]>/<sha> + snapshots/manifests/<id>.json."""
+
+    def __init__(self, root: str = None, keep: int = 100):
+        self.root = root or os.path.join(APP_DIR, "snapshots")
+        self.keep = keep
+        self._cache: dict = {}
+        os.makedirs(os.path.join(self.root, "manifests"), exist_ok=True)
+        os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+
+    def _obj(self, sha: str) -> str:
+        return os.path.join(self.root, "objects", sha[:2], sha)
+
+    def put(self, obj) -> tuple:
+        """(sha, stored) — `stored` is False when the content already existed."""
+        raw = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode()
+        sha = hashlib.sha1(raw).hexdigest()
+        path = self._obj(sha)
+        if os.path.exists(path): return sha, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f: f.write(zlib.compress(raw, 6))
+        os.replace(tmp, path)
+        return sha, True
+
+    def get(self, sha: str):
+        if sha not in self._cache:
+            with open(self._obj(sha), "rb") as f: self._cache[sha] = json.loads(zlib.decompress(f.read()))
+        return self._cache[sha]
+
+    def save(self, sections: dict, label: str = "") -> dict:
+        now = datetime.now()
+        man = {"v": SNAP_VERSION, "id": now.strftime("%Y%m%d-%H%M%S-%f"), "ts": now.timestamp(),
+               "label": label, "sections": {}, "new": 0}
+        for name, data in sections.items():
+            man["sections"][name], stored = self.put(data)
+            man["new"] += stored
+        save_json(os.path.join(self.root, "manifests", man["id"] + ".json"), man)
+        self.prune()
+        return man
+
+    def list(self) -> list:
+        """Manifest ids, oldest first."""
+        return sorted(f[:-5] for f in os.listdir(os.path.join(self.root, "manifests"))
+                      if f.endswith(".json"))
+
+    def manifest(self, sid: str) -> dict:
+        return load_json(os.path.join(self.root, "manifests", sid + ".json"), None)
+
+    def diff(self, a: str, b: str) -> dict:
+        """{section: diff_section(...)} for sections whose hash differs;
+        KeyError for an unknown id."""
+        ma, mb = self.manifest(a), self.manifest(b)
+        if ma is None or mb is None: raise KeyError(a if ma is None else b)
+        out = {}
+        for name in sorted(ma["sections"].keys() | mb["sections"].keys()):
+            ha, hb = ma["sections"].get(name), mb["sections"].get(name)
+            if ha == hb: continue
+            out[name] = diff_section(self.get(ha) if ha else None, self.get(hb) if hb else None,
+                                     SNAP_KEYS.get(name))
+        return out
+
+    def prune(self):
+        """Keep the newest `keep` manifests and drop objects none of them use."""
+        ids = self.list()
+        if len(ids) <= self.keep: return
+        for sid in ids[:-self.keep]:
+            os.remove(os.path.join(self.root, "manifests", sid + ".json"))
+        live = {h for sid in ids[-self.keep:] for h in (self.manifest(sid) or {}).get("sections", {}).values()}
+        for dp, _, names in os.walk(os.path.join(self.root, "objects")):
+            for n in names:
+                if n not in live: os.remove(os.path.join(dp, n))
+
+def snapshot_changes(diff: dict) -> list:
+    """Diff → [(S key, *args)] lines for the console / CLI."""
+    out = []
+    for k, (a, b) in diff.get("sysinfo", {}).get("changed", {}).items():
+        out.append(("snap_si", k, a, b))
+    st = diff.get("startup", {})
+    out += [("snap_su_add", e["name"], e.get("path", "")) for e in st.get("added", ())]
+    out += [("snap_su_rm", e["name"]) for e in st.get("removed", ())]
+    out += [("snap_su_chg", b["name"], b.get("path", "")) for _, b in st.get("changed", ())]
+    dr = diff.get("drivers", {})
+    out += [("snap_drv_upd", b["device"], a["version"], b["version"])
+            for a, b in dr.get("changed", ()) if a["version"] != b["version"]]
+    out += [("snap_drv_add", e["device"], e["version"]) for e in dr.get("added", ())]
+    out += [("snap_drv_rm", e["device"]) for e in dr.get("removed", ())]
+    cr = diff.get("crashes", {})
+    old = {c["code"] for c in cr.get("removed", ())} | {a["code"] for a, _ in cr.get("changed", ())}
+    new = collections.Counter(c["code"] for c in cr.get("added", ()))
+    out += [("snap_crash_new", code, n) for code, n in new.most_common() if code not in old]
+    return out
+
+
 # ════════════════════════════════════════════════════════════════════════════════
 #  APPLICATION
 # ════════════════════════════════════════════════════════════════════════════════
@@ -672,8 +3779,18 @@ class PCAnalystPro:
         self.report_dir = os.path.join(
             os.path.expanduser("~"), "Documents", "PC Analyst Reports")
         os.makedirs(self.report_dir, exist_ok=True)
+        self._tr    = TranslationBinder()
+        self._scope = ""
+        self.jobs   = JobExecutor(workers=4, on_change=self._job_changed)
+        self._fleet = FleetAgent.from_config()
+        self.alerts = RulesEngine(load_alert_rules(), sink=self._on_alert)
+        self._toasts: list = []
+        self._job_chips: dict = {}
+        self.sched  = ScanScheduler()
+        self.gov    = OverheadGovernor.from_config()
         self._build_ui()
         threading.Thread(target=self._monitor_loop, daemon=True).start()
+        if self.sched.entries: self.root.after(30_000, self._sched_tick)
 
     # ════════════════════════════════════════════════════════════════════════
     #  UI CONSTRUCTION
@@ -687,6 +3804,21 @@ class PCAnalystPro:
         self._build_notebook()
         self._build_console()
         self.root.title(T("app_title"))
+        self._tr.add("", lambda: self.root.title(T("app_title")))
+
+    def _bind(self, widget, key: str, fmt: str = "{}"):
+        """Register `widget` for retranslation under the tab being built."""
+        return self._tr.text(self._scope, widget, key, fmt)
+
+    def _filter_entry(self, parent, bg=C["surface"]) -> tk.StringVar:
+        """Right-aligned 'Filter:' box; returns the StringVar it edits."""
+        var = tk.StringVar()
+        tk.Entry(parent, textvariable=var, width=24, font=FONT_MONO,
+                 bg=C["bg"], fg=C["text"], insertbackground=C["text"],
+                 relief="flat").pack(side="right")
+        self._bind(tk.Label(parent, text=T("tbl_filter"), font=FONT_SMALL,
+                            bg=bg, fg=C["muted"]), "tbl_filter").pack(side="right", padx=6)
+        return var
 
     # ── Header ────────────────────────────────────────────────────────────────
 
@@ -697,6 +3829,7 @@ class PCAnalystPro:
         self.hdr_lbl = tk.Label(hdr, text=T("header_title"),
                                  font=FONT_H1, bg=C["surface"], fg=C["blue"])
         self.hdr_lbl.pack(side="left", padx=24, pady=16)
+        self._bind(self.hdr_lbl, "header_title")
 
         lf = tk.Frame(hdr, bg=C["surface"]); lf.pack(side="right", padx=16)
         self._lang_btns = {}
@@ -708,6 +3841,7 @@ class PCAnalystPro:
                           relief="flat", cursor="hand2", bd=0, padx=6, pady=4,
                           command=lambda c=code: self._change_lang(c))
             b.pack(side="left", padx=2); self._lang_btns[code] = b
+        self._tr.add("", self._paint_lang_btns)
 
         self.clock_lbl = tk.Label(hdr, font=FONT_MONO,
                                    bg=C["surface"], fg=C["muted"])
@@ -716,6 +3850,7 @@ class PCAnalystPro:
 
     def _tick(self):
         self.clock_lbl.config(text=datetime.now().strftime("%d %b %Y  %H:%M:%S"))
+        if self._job_chips: self._paint_jobs()
         self.root.after(1000, self._tick)
 
     # ── Notebook ──────────────────────────────────────────────────────────────
@@ -739,15 +3874,32 @@ class PCAnalystPro:
                 ("tab_network",  self._tab_network),
                 ("tab_sysinfo",  self._tab_sysinfo),
                 ("tab_startup",  self._tab_startup),
+                ("tab_procs",    self._tab_procs),
                 ("tab_thermal",  self._tab_thermal),
+                ("tab_bench",    self._tab_bench),
+                ("tab_diag",     self._tab_diag),
                 ("tab_language", self._tab_language)]
 
         self._tab_ids = []
         for key, builder in defs:
             f = tk.Frame(self.nb, bg=C["bg"])
             self.nb.add(f, text=T(key))
-            self._tab_ids.append((self.nb.tabs()[-1], key))
+            tid = self.nb.tabs()[-1]
+            self._tab_ids.append((tid, key))
+            self._tr.add("", lambda t=tid, k=key: self.nb.tab(t, text=T(k)))
+            self._scope = key
             builder(f)
+        self._scope = ""
+        self._tab_keys = dict(self._tab_ids)
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _):
+        tab = self._visible_tab()
+        with span("reveal_tab", "ui", tab=tab): self._tr.reveal(tab)
+        if tab == "tab_diag": self._refresh_diag()
+
+    def _visible_tab(self) -> str:
+        return self._tab_keys.get(self.nb.select(), "")
 
     # ── Dashboard ─────────────────────────────────────────────────────────────
 
@@ -766,6 +3918,74 @@ class PCAnalystPro:
                           bg=C["bg"], fg=color)
             vl.pack(side="left")
             self.bars[mkey] = (bar, l, vl)
+            self._tr.add(self._scope, lambda k=mkey, b=bar, l=l:
+                         l.config(text=f"{T(k)}:  {float(b['value']):.0f}%"))
+
+        io_frame = tk.Frame(p, bg=C["bg"]); io_frame.pack(fill="x", padx=24, pady=(0, 8))
+        self._io_lbls = {}
+        for i, (k, color) in enumerate((("m_disk_io", C["yellow"]), ("m_net_io", C["teal"]))):
+            self._bind(tk.Label(io_frame, text=T(k), font=FONT_UI, width=20, anchor="w",
+                                bg=C["bg"], fg=C["text"]), k).grid(row=i, column=0, sticky="w", pady=2)
+            vl = tk.Label(io_frame, text="…", font=FONT_MONO, anchor="w", bg=C["bg"], fg=color)
+            vl.grid(row=i, column=1, sticky="w", padx=10)
+            self._io_lbls[k] = vl
+
+        self._bind(lbl(p, T("m_cores"), font=FONT_H3), "m_cores").pack(anchor="w", padx=24)
+        self.core_cv = tk.Canvas(p, height=70, bg=C["surface"], highlightthickness=0)
+        self.core_cv.pack(fill="x", padx=24, pady=(4, 10))
+        self._core_bars: list = []
+
+        self._bind(lbl(p, T("m_volumes"), font=FONT_H3), "m_volumes").pack(anchor="w", padx=24)
+        self.vol_frame = tk.Frame(p, bg=C["bg"]); self.vol_frame.pack(fill="x", padx=24, pady=(4, 8))
+        self._vol_rows: dict = {}
+
+    def _paint_dashboard(self, d: dict):
+        for k in ("cpu", "ram", "gpu", "disk"):
+            if d.get(k) is not None: self._set_bar(f"m_{k}", d[k])
+        self._io_lbls["m_disk_io"].config(text=T("m_rw").format(
+            fmt_bytes(d["disk_read"]), fmt_bytes(d["disk_write"])))
+        self._io_lbls["m_net_io"].config(text=T("m_rx").format(
+            fmt_bytes(d["net_recv"]), fmt_bytes(d["net_sent"])))
+        self._paint_cores(d["cores"])
+        self._paint_volumes(d["volumes"])
+
+    def _paint_cores(self, cores: list):
+        """One rectangle per logical CPU on a single canvas; only coords change."""
+        cv, n = self.core_cv, len(cores)
+        if not n: return
+        w, h = max(cv.winfo_width(), 200), int(cv["height"])
+        if len(self._core_bars) != n:
+            cv.delete("all")
+            self._core_bars = [(cv.create_rectangle(0, 0, 0, 0, fill=C["blue"], width=0),
+                                cv.create_text(0, 0, text="", fill=C["muted"], font=FONT_TINY))
+                               for _ in range(n)]
+        slot = w / n
+        for i, (pct, (bar, txt)) in enumerate(zip(cores, self._core_bars)):
+            x0, top = i * slot + 2, h - 12 - (h - 16) * pct / 100
+            cv.coords(bar, x0, top, x0 + slot - 4, h - 12)
+            cv.itemconfigure(bar, fill=C["red"] if pct > 90 else C["yellow"] if pct > 70 else C["blue"])
+            cv.coords(txt, x0 + (slot - 4) / 2, h - 5)
+            cv.itemconfigure(txt, text=f"{pct:.0f}" if slot >= 18 else "")
+
+    def _paint_volumes(self, vols: list):
+        live = {m for m, *_ in vols}
+        for m in [m for m in self._vol_rows if m not in live]:
+            self._vol_rows.pop(m)[0].destroy()
+        for m, pct, used, total in vols:
+            if m not in self._vol_rows:
+                row = tk.Frame(self.vol_frame, bg=C["bg"]); row.pack(fill="x", pady=2)
+                tk.Label(row, text=m, font=FONT_MONO, width=20, anchor="w",
+                         bg=C["bg"], fg=C["text"]).pack(side="left")
+                bar = progressbar(row, C["yellow"], "VOL")
+                bar.pack(side="left", fill="x", expand=True, padx=10)
+                vl = tk.Label(row, text="", width=26, font=FONT_MONO, anchor="e",
+                              bg=C["bg"], fg=C["muted"])
+                vl.pack(side="left")
+                self._vol_rows[m] = (row, bar, vl)
+            _, bar, vl = self._vol_rows[m]
+            bar["value"] = pct
+            vl.config(text=f"{pct:4.0f}%  {fmt_bytes(used)} / {fmt_bytes(total)}",
+                      fg=C["red"] if pct > 90 else C["muted"])
 
     # ── Analysis ──────────────────────────────────────────────────────────────
 
@@ -777,16 +3997,32 @@ class PCAnalystPro:
         self.btn_ds.pack(side="left", padx=6)
         self.btn_qf = make_btn(bf, T("btn_quick_fix"), self._run_quick_fix, C["orange"])
         self.btn_qf.pack(side="left", padx=6)
+        self._bind(self.btn_qs, "btn_quick_scan")
+        self._bind(self.btn_ds, "btn_deep_scan")
+        self._bind(self.btn_qf, "btn_quick_fix")
+        self.btn_batch = make_btn(bf, T("btn_batch"), self._run_batch, C["purple"])
+        self.btn_batch.pack(side="left", padx=6)
+        self._bind(self.btn_batch, "btn_batch")
+        qf = tk.Frame(p, bg=C["bg"]); qf.pack(fill="x", padx=30, pady=(0, 10))
+        self.qf_prog = progressbar(qf, C["orange"], "QF")
+        self.qf_prog.pack(side="left", fill="x", expand=True)
+        self.qf_lbl = lbl(qf, "", font=FONT_SMALL, fg=C["muted"], width=28, anchor="w")
+        self.qf_lbl.pack(side="left", padx=(10, 0))
+        bt = tk.Frame(p, bg=C["bg"]); bt.pack(fill="x", padx=30, pady=(0, 10))
+        self.batch_prog = progressbar(bt, C["purple"], "BATCH")
+        self.batch_prog.pack(side="left", fill="x", expand=True)
+        self.batch_lbl = lbl(bt, "", font=FONT_SMALL, fg=C["muted"], width=28, anchor="w")
+        self.batch_lbl.pack(side="left", padx=(10, 0))
 
         lf = tk.Frame(p, bg=C["surface"],
                       highlightbackground=C["border"], highlightthickness=1)
         lf.pack(fill="x", padx=24, pady=(0, 8))
-        self.crash_h_lbl = slbl(lf, T("crash_history"), font=FONT_H3)
-        self.crash_h_lbl.pack(anchor="w", padx=12, pady=(10, 4))
+        hrow = tk.Frame(lf, bg=C["surface"]); hrow.pack(fill="x", padx=12, pady=(10, 4))
+        self.crash_h_lbl = slbl(hrow, T("crash_history"), font=FONT_H3)
+        self.crash_h_lbl.pack(side="left")
+        self._bind(self.crash_h_lbl, "crash_history")
+        self.crash_filter = self._filter_entry(hrow)
 
-        self.crash_tree = ttk.Treeview(lf,
-                                        columns=("time","code","category","file"),
-                                        show="headings", height=6)
         ts = ttk.Style()
         ts.configure("Treeview", background=C["bg"], fieldbackground=C["bg"],
                      foreground=C["text"], rowheight=24, font=FONT_MONO)
@@ -795,14 +4031,18 @@ class PCAnalystPro:
         ts.map("Treeview", background=[("selected", C["blue"])])
         self._tree_cols = [("time","col_time",160),("code","col_code",130),
                            ("category","col_cat",180),("file","col_src",290)]
-        for col, key, w in self._tree_cols:
-            self.crash_tree.heading(col, text=T(key))
-            self.crash_tree.column(col, width=w, anchor="w")
-        self.crash_tree.pack(fill="x", padx=12, pady=(0, 4))
-        self.crash_tree.bind("<Double-1>", self._on_crash_click)
+        self.crash_table = VirtualTable(
+            lf, self._tree_cols, height=6,
+            fmt=lambda r: (r["time"], r["code"], r["category"], r["file"]))
+        self.crash_table.pack(fill="x", padx=12, pady=(0, 4))
+        self.crash_table.tree.bind("<Double-1>", self._on_crash_click)
+        self._tr.add(self._scope, self.crash_table.retranslate)
+        self.crash_filter.trace_add(
+            "write", lambda *_: self.crash_table.set_filter(self.crash_filter.get()))
         self.crash_hint_lbl = slbl(lf, T("crash_hint"),
                                     font=FONT_TINY, fg=C["muted"])
         self.crash_hint_lbl.pack(anchor="w", padx=12, pady=(0, 8))
+        self._bind(self.crash_hint_lbl, "crash_hint")
 
     # ── Cleanup ───────────────────────────────────────────────────────────────
 
@@ -810,22 +4050,55 @@ class PCAnalystPro:
         of = tk.Frame(p, bg=C["bg"]); of.pack(fill="x", padx=24, pady=16)
         self.cl_title_lbl = lbl(of, T("cleanup_title"), font=FONT_H3)
         self.cl_title_lbl.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0,8))
+        self._bind(self.cl_title_lbl, "cleanup_title")
         self.clean_opts, self._cl_cbs = {}, {}
         for i, (k, sk) in enumerate([("temp","opt_temp"),("prefetch","opt_prefetch"),
-                                      ("updates","opt_updates"),("browser","opt_browser")]):
-            var = tk.BooleanVar(value=True); self.clean_opts[k] = var
+                                      ("updates","opt_updates"),("browser","opt_browser"),
+                                      ("dups","opt_dups"),("dry","opt_dry")]):
+            var = tk.BooleanVar(value=k not in ("dups", "dry")); self.clean_opts[k] = var
             cb = tk.Checkbutton(of, text=T(sk), variable=var, font=FONT_UI,
                                 bg=C["bg"], fg=C["text"], selectcolor=C["surface"],
                                 activebackground=C["bg"], activeforeground=C["text"])
             cb.grid(row=i+1, column=0, sticky="w", padx=8, pady=3)
             self._cl_cbs[k] = (cb, sk)
-        br = tk.Frame(of, bg=C["bg"]); br.grid(row=5, column=0, sticky="w", padx=8, pady=12)
+            self._bind(cb, sk)
+        br = tk.Frame(of, bg=C["bg"]); br.grid(row=7, column=0, sticky="w", padx=8, pady=12)
         self.btn_cl  = make_btn(br, T("btn_cleanup"), self._run_cleanup, C["yellow"])
         self.btn_cl.pack(side="left", padx=(0,10))
         self.btn_ram = make_btn(br, T("btn_opt_ram"), self._run_ram_opt, C["purple"])
-        self.btn_ram.pack(side="left")
+        self.btn_ram.pack(side="left", padx=(0,10))
+        self.btn_dup = make_btn(br, T("btn_dups"), self._run_find_dups, C["blue"])
+        self.btn_dup.pack(side="left")
+        self._bind(self.btn_cl, "btn_cleanup")
+        self._bind(self.btn_ram, "btn_opt_ram")
+        self._bind(self.btn_dup, "btn_dups")
         self.cl_prog = ttk.Progressbar(of, mode="indeterminate", length=440)
-        self.cl_prog.grid(row=6, column=0, sticky="w", padx=8)
+        self.cl_prog.grid(row=8, column=0, sticky="w", padx=8)
+        self._dups = None
+
+        # ── Disk usage analyzer ───────────────────────────────────────────────
+        du = tk.Frame(p, bg=C["surface"],
+                      highlightbackground=C["border"], highlightthickness=1)
+        du.pack(fill="x", padx=24, pady=(0, 8))
+        hrow = tk.Frame(du, bg=C["surface"]); hrow.pack(fill="x", padx=12, pady=(10, 4))
+        self._bind(slbl(hrow, T("du_title"), font=FONT_H3), "du_title").pack(side="left")
+        self.btn_du = make_btn(hrow, T("btn_du"), self._run_disk_usage, C["blue"], small=True)
+        self.btn_du.pack(side="right"); self._bind(self.btn_du, "btn_du")
+        self.du_vol = ttk.Combobox(hrow, width=12, state="readonly", values=self._volumes())
+        self.du_vol.pack(side="right", padx=8)
+        if self.du_vol["values"]: self.du_vol.current(0)
+        self.du_tree = ttk.Treeview(du, columns=("size", "files"),
+                                    show="tree headings", height=7)
+        self._du_cols = [("#0", "du_col_path", 420), ("size", "du_col_size", 110),
+                         ("files", "du_col_files", 90)]
+        for col, key, w in self._du_cols:
+            self.du_tree.heading(col, text=T(key))
+            self.du_tree.column(col, width=w, anchor="w")
+            self._tr.add(self._scope, lambda c=col, k=key:
+                         self.du_tree.heading(c, text=T(k)))
+        self.du_tree.pack(fill="x", padx=12, pady=(0, 10))
+        self.du_tree.bind("<<TreeviewOpen>>", self._du_expand)
+        self._du, self._du_result, self._du_paths = DiskUsageScanner(), None, {}
 
     # ── Network ───────────────────────────────────────────────────────────────
 
@@ -835,11 +4108,14 @@ class PCAnalystPro:
         self.btn_nd.pack(side="left", padx=6)
         self.btn_sp = make_btn(br, T("btn_speed"), self._run_speed_test, C["green"])
         self.btn_sp.pack(side="left", padx=6)
+        self._bind(self.btn_nd, "btn_net_diag")
+        self._bind(self.btn_sp, "btn_speed")
         mf = tk.Frame(p, bg=C["surface"],
                       highlightbackground=C["border"], highlightthickness=1)
         mf.pack(fill="x", padx=24, pady=(0,12))
         self.net_h_lbl = slbl(mf, T("net_health"), font=FONT_H3)
         self.net_h_lbl.pack(anchor="w", padx=12, pady=(10,6))
+        self._bind(self.net_h_lbl, "net_health")
         inner = tk.Frame(mf, bg=C["surface"]); inner.pack(fill="x", padx=12, pady=(0,12))
         self._net_rows, self.net_vals = {}, {}
         for i, (k, sk) in enumerate([("status","net_status"),("ping","net_ping"),
@@ -848,6 +4124,7 @@ class PCAnalystPro:
             rl = slbl(inner, f"{T(sk)}:", width=24, anchor="w", fg=C["muted"])
             rl.grid(row=i, column=0, sticky="w", pady=3)
             self._net_rows[k] = (rl, sk)
+            self._bind(rl, sk, "{}:")
             vl = slbl(inner, "—", font=FONT_MONO)
             vl.grid(row=i, column=1, sticky="w", padx=12, pady=3)
             self.net_vals[k] = vl
@@ -861,6 +4138,8 @@ class PCAnalystPro:
         self.btn_si_ref = make_btn(hrow, T("btn_refresh_si"),
                                     self._refresh_sysinfo, C["muted"], small=True)
         self.btn_si_ref.pack(side="right")
+        self._bind(self.si_title_lbl, "si_title")
+        self._bind(self.btn_si_ref, "btn_refresh_si")
         tf = tk.Frame(p, bg=C["surface"],
                       highlightbackground=C["border"], highlightthickness=1)
         tf.pack(fill="x", padx=24, pady=(0,12))
@@ -872,24 +4151,32 @@ class PCAnalystPro:
         for i, (sk, dk) in enumerate(fields):
             bg = C["surface"] if i % 2 == 0 else C["surface2"]
             row = tk.Frame(tf, bg=bg); row.pack(fill="x")
-            tk.Label(row, text=T(sk), font=FONT_SMALL, width=28,
-                     anchor="w", bg=bg, fg=C["muted"],
-                     padx=14, pady=8).pack(side="left")
+            kl = tk.Label(row, text=T(sk), font=FONT_SMALL, width=28,
+                          anchor="w", bg=bg, fg=C["muted"], padx=14, pady=8)
+            kl.pack(side="left"); self._bind(kl, sk)
             vl = tk.Label(row, text="…", font=FONT_MONO,
                           anchor="w", bg=bg, fg=C["blue"], padx=8, pady=8)
             vl.pack(side="left", fill="x", expand=True)
             self._si_rows[dk] = (vl, sk, bg)
+        self._si_cache = SysinfoCache()
         self._refresh_sysinfo()
 
     def _refresh_sysinfo(self):
-        def _work():
-            d = collect_sysinfo()
-            def _apply():
-                for k, (vl, sk, bg) in self._si_rows.items():
-                    vl.config(text=d.get(k, "N/A"))
-                    vl.master.winfo_children()[0].config(text=T(sk))
-            self.root.after(0, _apply)
-        threading.Thread(target=_work, daemon=True).start()
+        def _work(cancel):
+            d, expired = self._si_cache.collect()
+            self._post(lambda: self._si_apply({k: d.get(k, "N/A") for k in self._si_rows}))
+            if expired and not self.gov.defer(): self._submit("job_si_reval", _revalidate, expired)
+        def _revalidate(fields, cancel):
+            fresh   = collect_sysinfo(fields)
+            changed = self._si_cache.update(fresh)
+            for k in changed:
+                self.log(T("log_si_changed").format(k, fresh[k]), "yellow")
+            if changed: self._post(lambda: self._si_apply(fresh))
+        self._submit("btn_refresh_si", _work)
+
+    def _si_apply(self, d: dict):
+        for k, v in d.items():
+            if k in self._si_rows: self._si_rows[k][0].config(text=v)
 
     # ── Startup Manager ───────────────────────────────────────────────────────
 
@@ -897,6 +4184,7 @@ class PCAnalystPro:
         hrow = tk.Frame(p, bg=C["bg"]); hrow.pack(fill="x", padx=24, pady=(16,8))
         self.sm_title_lbl = lbl(hrow, T("sm_title"), font=FONT_H3)
         self.sm_title_lbl.pack(side="left")
+        self._bind(self.sm_title_lbl, "sm_title")
 
         br = tk.Frame(p, bg=C["bg"]); br.pack(fill="x", padx=24, anchor="w", pady=(0,8))
         self.btn_sm_ref = make_btn(br, T("btn_sm_refresh"),
@@ -908,50 +4196,47 @@ class PCAnalystPro:
         self.btn_sm_en = make_btn(br, T("btn_sm_enable"),
                                    self._startup_enable, C["green"], small=True)
         self.btn_sm_en.pack(side="left")
+        self.sm_filter = self._filter_entry(br, bg=C["bg"])
+        self._bind(self.btn_sm_ref, "btn_sm_refresh")
+        self._bind(self.btn_sm_dis, "btn_sm_disable")
+        self._bind(self.btn_sm_en, "btn_sm_enable")
 
         tf = tk.Frame(p, bg=C["surface"],
                       highlightbackground=C["border"], highlightthickness=1)
         tf.pack(fill="both", expand=True, padx=24, pady=(0,8))
 
-        self.sm_tree = ttk.Treeview(tf,
-            columns=("name","path","hive","state"),
-            show="headings", height=10)
         self._sm_cols = [("name","sm_col_name",200),("path","sm_col_path",400),
                          ("hive","sm_col_hive",70),("state","sm_col_state",100)]
-        for col, key, w in self._sm_cols:
-            self.sm_tree.heading(col, text=T(key))
-            self.sm_tree.column(col, width=w, anchor="w")
-        sb = ttk.Scrollbar(tf, orient="vertical", command=self.sm_tree.yview)
-        self.sm_tree.configure(yscrollcommand=sb.set)
-        self.sm_tree.pack(side="left", fill="both", expand=True, padx=12, pady=8)
-        sb.pack(side="right", fill="y", pady=8)
+        self.sm_table = VirtualTable(
+            tf, self._sm_cols, height=10,
+            fmt=lambda e: (e["name"], e["path"], e["hive"],
+                           T("sm_disabled") if e["disabled"] else T("sm_enabled")))
+        self.sm_table.pack(fill="both", expand=True, padx=12, pady=8)
+        self._tr.add(self._scope, self.sm_table.retranslate)
+        self._tr.add(self._scope, self.sm_table.refresh)
+        self.sm_filter.trace_add(
+            "write", lambda *_: self.sm_table.set_filter(self.sm_filter.get()))
 
         self.sm_hint_lbl = lbl(p, T("sm_hint"), font=FONT_TINY, fg=C["muted"])
         self.sm_hint_lbl.pack(anchor="w", padx=24, pady=(0,4))
+        self._bind(self.sm_hint_lbl, "sm_hint")
 
         self._refresh_startup()
 
     def _refresh_startup(self):
-        def _work():
+        def _work(cancel):
             entries = get_startup_entries()
             def _apply():
-                self.sm_tree.delete(*self.sm_tree.get_children())
                 self._startup_entries = entries
-                for e in entries:
-                    state = T("sm_disabled") if e["disabled"] else T("sm_enabled")
-                    self.sm_tree.insert("", "end",
-                        values=(e["name"], e["path"], e["hive"], state))
-            self.root.after(0, _apply)
-        threading.Thread(target=_work, daemon=True).start()
+                self.sm_table.clear(); self.sm_table.extend(entries)
+            self._post(_apply)
+        self._submit("btn_sm_refresh", _work)
 
     def _startup_toggle(self, disable: bool):
         if not WIN32_OK:
             self.log(T("sm_no_win32"), "yellow"); return
-        sel = self.sm_tree.selection()
-        if not sel: self.log(T("sm_no_sel"), "muted"); return
-        idx = self.sm_tree.index(sel[0])
-        if idx >= len(self._startup_entries): return
-        entry = self._startup_entries[idx]
+        entry = self.sm_table.selected()
+        if not entry: self.log(T("sm_no_sel"), "muted"); return
         ok = toggle_startup_entry(entry, disable)
         action = "Disabled" if disable else "Enabled"
         color  = "yellow" if disable else "green"
@@ -961,6 +4246,52 @@ class PCAnalystPro:
     def _startup_disable(self): self._startup_toggle(True)
     def _startup_enable(self):  self._startup_toggle(False)
 
+    # ── Processes ─────────────────────────────────────────────────────────────
+
+    def _tab_procs(self, p):
+        hrow = tk.Frame(p, bg=C["bg"]); hrow.pack(fill="x", padx=24, pady=(16,8))
+        self._bind(lbl(hrow, T("pr_title"), font=FONT_H3), "pr_title").pack(side="left")
+        self.pr_filter = self._filter_entry(hrow, bg=C["bg"])
+        tf = tk.Frame(p, bg=C["surface"],
+                      highlightbackground=C["border"], highlightthickness=1)
+        tf.pack(fill="both", expand=True, padx=24, pady=(0,8))
+        self.pr_table = VirtualTable(
+            tf, [("name","pr_col_name",220),("pid","pr_col_pid",70),("cpu","pr_col_cpu",80),
+                 ("rss","pr_col_rss",110),("io","pr_col_io",100),
+                 ("handles","pr_col_handles",90),("threads","pr_col_threads",90)], height=16,
+            key=lambda r: r["pid"],
+            fmt=lambda r: (r["name"], r["pid"], f"{r['cpu']:.1f}", f"{r['rss']:.1f}",
+                           f"{r['io']:.1f}", "" if r["handles"] is None else r["handles"],
+                           "" if r["threads"] is None else r["threads"]))
+        self.pr_table.index.sort(2, True)                       # CPU, busiest first
+        self.pr_table.pack(fill="both", expand=True, padx=12, pady=8)
+        self._tr.add(self._scope, self.pr_table.retranslate)
+        self.pr_filter.trace_add(
+            "write", lambda *_: self.pr_table.set_filter(self.pr_filter.get()))
+        self.pr_sum_lbl = lbl(p, "", font=FONT_SMALL, fg=C["muted"])
+        self.pr_sum_lbl.pack(anchor="w", padx=24)
+        self.pr_hint_lbl = lbl(p, T("pr_hint"), font=FONT_TINY, fg=C["muted"])
+        self.pr_hint_lbl.pack(anchor="w", padx=24, pady=(0,4))
+        self._bind(self.pr_hint_lbl, "pr_hint")
+        self._pr_sampler = ProcessSampler() if PSUTIL_OK else None
+        self.root.after(2000, self._poll_procs)
+
+    def _poll_procs(self):
+        """Every 2 s while visible, stretched so a pass stays under 1% of one core
+        and by the overhead governor."""
+        if not self.running: return
+        sm = self._pr_sampler
+        if sm and self._visible_tab() == "tab_procs": self.jobs.submit("tab_procs", self._procs_job)
+        self.root.after(self.gov.interval(max(2000, int(sm.cost * 100_000) if sm else 2000)),
+                        self._poll_procs)
+
+    def _procs_job(self, cancel: CancelToken):
+        t0 = time.perf_counter()
+        up, gone = self._pr_sampler.sample()
+        ms, n = (time.perf_counter() - t0) * 1000, len(self._pr_sampler.rows)
+        self._post(lambda: (self.pr_table.apply(up, gone),
+                            self.pr_sum_lbl.config(text=T("pr_summary").format(n, ms, len(up)))))
+
     # ── Thermal Monitoring ────────────────────────────────────────────────────
 
     def _tab_thermal(self, p):
@@ -970,6 +4301,8 @@ class PCAnalystPro:
         self.btn_th_ref = make_btn(hrow, T("btn_th_refresh"),
                                     self._refresh_thermal, C["muted"], small=True)
         self.btn_th_ref.pack(side="right")
+        self._bind(self.th_title_lbl, "th_title")
+        self._bind(self.btn_th_ref, "btn_th_refresh")
 
         tf = tk.Frame(p, bg=C["surface"],
                       highlightbackground=C["border"], highlightthickness=1)
@@ -981,69 +4314,272 @@ class PCAnalystPro:
         for i, (sk, dk) in enumerate(fields):
             bg = C["surface"] if i % 2 == 0 else C["surface2"]
             row = tk.Frame(tf, bg=bg); row.pack(fill="x")
-            tk.Label(row, text=T(sk), font=FONT_SMALL, width=28,
-                     anchor="w", bg=bg, fg=C["muted"],
-                     padx=14, pady=10).pack(side="left")
+            kl = tk.Label(row, text=T(sk), font=FONT_SMALL, width=28,
+                          anchor="w", bg=bg, fg=C["muted"], padx=14, pady=10)
+            kl.pack(side="left"); self._bind(kl, sk)
             vl = tk.Label(row, text="…", font=FONT_H3,
                           anchor="w", bg=bg, fg=C["teal"], padx=8)
             vl.pack(side="left", fill="x", expand=True)
             self._th_labels[dk] = (vl, sk, bg)
 
+        hrow = tk.Frame(p, bg=C["bg"]); hrow.pack(fill="x", padx=24, pady=(0,4))
+        self._bind(lbl(hrow, T("th_all"), font=FONT_H3), "th_all").pack(side="left")
+        sf = tk.Frame(p, bg=C["surface"],
+                      highlightbackground=C["border"], highlightthickness=1)
+        sf.pack(fill="x", padx=24, pady=(0,8))
+        self.th_table = VirtualTable(
+            sf, [("label","th_col_sensor",260),("group","th_col_group",110),
+                 ("value","th_col_value",120),("source","th_col_source",90)], height=8,
+            fmt=lambda s: (s.label, s.group, f"{s.value:.1f} {s.unit}", s.source))
+        self.th_table.pack(fill="x", padx=12, pady=8)
+        self._tr.add(self._scope, self.th_table.retranslate)
+
         self.th_hint_lbl = lbl(p, T("th_hint"), font=FONT_TINY, fg=C["muted"])
         self.th_hint_lbl.pack(anchor="w", padx=24, pady=(0,4))
+        self._bind(self.th_hint_lbl, "th_hint")
 
         self._refresh_thermal()
+        self.root.after(1000, self._poll_thermal)
+
+    def _poll_thermal(self):
+        if not self.running: return
+        if self._visible_tab() == "tab_thermal": self.jobs.submit("btn_th_refresh", self._thermal_job)
+        self.root.after(self.gov.interval(1000), self._poll_thermal)
 
     def _refresh_thermal(self):
-        def _work():
-            d = collect_thermal()
-            def _apply():
-                # CPU temp
-                ct = d.get("cpu_temp")
-                cpu_lbl = self._th_labels["cpu_temp"][0]
-                if ct:
-                    st = d.get("cpu_status","normal")
-                    cpu_lbl.config(text=ct,
-                                   fg=(C["red"] if st=="hot"
-                                       else C["yellow"] if st=="warm"
-                                       else C["teal"]))
-                else:
-                    cpu_lbl.config(text=T("th_na"), fg=C["muted"])
-
-                # GPU temp
-                gt = d.get("gpu_temp")
-                gpu_lbl = self._th_labels["gpu_temp"][0]
-                if gt:
-                    st = d.get("gpu_status","normal")
-                    gpu_lbl.config(text=gt,
-                                   fg=(C["red"] if st=="hot"
-                                       else C["yellow"] if st=="warm"
-                                       else C["teal"]))
-                else:
-                    gpu_lbl.config(text=T("th_na"), fg=C["muted"])
-
-                # Fan
-                fan = d.get("cpu_fan")
-                self._th_labels["cpu_fan"][0].config(
-                    text=fan or T("th_na"),
-                    fg=C["teal"] if fan else C["muted"])
-
-                # Overall status
-                cpu_s = d.get("cpu_status","")
-                gpu_s = d.get("gpu_status","")
-                worst = ("hot"  if "hot"  in (cpu_s, gpu_s) else
-                         "warm" if "warm" in (cpu_s, gpu_s) else "normal")
-                self._th_labels["status"][0].config(
-                    text=T(f"th_{worst}"),
-                    fg=(C["red"] if worst=="hot"
-                        else C["yellow"] if worst=="warm"
-                        else C["teal"]))
-
-                # Retranslate row labels
-                for dk, (vl, sk, _) in self._th_labels.items():
-                    vl.master.winfo_children()[0].config(text=T(sk))
-            self.root.after(0, _apply)
-        threading.Thread(target=_work, daemon=True).start()
+        self._submit("btn_th_refresh", self._thermal_job)
+
+    def _thermal_job(self, cancel: CancelToken):
+        d = collect_thermal()
+        def _apply():
+            self.th_table.clear(); self.th_table.extend(d["sensors"])
+            # CPU temp
+            ct = d.get("cpu_temp")
+            cpu_lbl = self._th_labels["cpu_temp"][0]
+            if ct:
+                st = d.get("cpu_status","normal")
+                cpu_lbl.config(text=ct,
+                               fg=(C["red"] if st=="hot"
+                                   else C["yellow"] if st=="warm"
+                                   else C["teal"]))
+            else:
+                cpu_lbl.config(text=T("th_na"), fg=C["muted"])
+
+            # GPU temp
+            gt = d.get("gpu_temp")
+            gpu_lbl = self._th_labels["gpu_temp"][0]
+            if gt:
+                st = d.get("gpu_status","normal")
+                gpu_lbl.config(text=gt,
+                               fg=(C["red"] if st=="hot"
+                                   else C["yellow"] if st=="warm"
+                                   else C["teal"]))
+            else:
+                gpu_lbl.config(text=T("th_na"), fg=C["muted"])
+
+            # Fan
+            fan = d.get("cpu_fan")
+            self._th_labels["cpu_fan"][0].config(
+                text=fan or T("th_na"),
+                fg=C["teal"] if fan else C["muted"])
+
+            # Overall status
+            cpu_s = d.get("cpu_status","")
+            gpu_s = d.get("gpu_status","")
+            worst = ("hot"  if "hot"  in (cpu_s, gpu_s) else
+                     "warm" if "warm" in (cpu_s, gpu_s) else "normal")
+            self._th_labels["status"][0].config(
+                text=T(f"th_{worst}"),
+                fg=(C["red"] if worst=="hot"
+                    else C["yellow"] if worst=="warm"
+                    else C["teal"]))
+        self._post(_apply)
+
+    # ── Benchmark ─────────────────────────────────────────────────────────────
+
+    def _tab_bench(self, p):
+        hrow = tk.Frame(p, bg=C["bg"]); hrow.pack(fill="x", padx=24, pady=(16,8))
+        self._bind(lbl(hrow, T("bd_title"), font=FONT_H3), "bd_title").pack(side="left")
+        self.btn_bd = make_btn(hrow, T("btn_bd"), self._run_disk_bench, C["blue"], small=True)
+        self.btn_bd.pack(side="right"); self._bind(self.btn_bd, "btn_bd")
+        self.bd_size = ttk.Combobox(hrow, width=8, state="readonly",
+                                    values=("256 MB", "1024 MB", "4096 MB"))
+        self.bd_size.pack(side="right", padx=8); self.bd_size.current(0)
+        self.bd_vol = ttk.Combobox(hrow, width=12, state="readonly", values=self._volumes())
+        self.bd_vol.pack(side="right")
+        if self.bd_vol["values"]: self.bd_vol.current(0)
+
+        tf = tk.Frame(p, bg=C["surface"],
+                      highlightbackground=C["border"], highlightthickness=1)
+        tf.pack(fill="x", padx=24, pady=(0,4))
+        self._bd_cols = [("test","bd_col_test",150),("mbps","bd_col_mbps",100),
+                         ("iops","bd_col_iops",100),("p50","bd_col_p50",100),
+                         ("p99","bd_col_p99",100),("delta","bd_col_delta",120)]
+        self.bd_tree = ttk.Treeview(tf, columns=[c for c, _, _ in self._bd_cols],
+                                    show="headings", height=8)
+        for col, key, w in self._bd_cols:
+            self.bd_tree.heading(col, text=T(key))
+            self.bd_tree.column(col, width=w, anchor="w")
+            self._tr.add(self._scope, lambda c=col, k=key:
+                         self.bd_tree.heading(c, text=T(k)))
+        self.bd_tree.pack(fill="x", padx=12, pady=8)
+        self.bd_prog = progressbar(p, C["blue"], "BENCH")
+        self.bd_prog.pack(fill="x", padx=24, pady=(0,4))
+        self.bd_hint_lbl = lbl(p, T("bd_hint"), font=FONT_TINY, fg=C["muted"])
+        self.bd_hint_lbl.pack(anchor="w", padx=24, pady=(0,4))
+        self._bind(self.bd_hint_lbl, "bd_hint")
+
+        hrow = tk.Frame(p, bg=C["bg"]); hrow.pack(fill="x", padx=24, pady=(12,8))
+        self._bind(lbl(hrow, T("bc_title"), font=FONT_H3), "bc_title").pack(side="left")
+        self.btn_bc = make_btn(hrow, T("btn_bc"), self._run_cpu_bench, C["purple"], small=True)
+        self.btn_bc.pack(side="right"); self._bind(self.btn_bc, "btn_bc")
+        tf = tk.Frame(p, bg=C["surface"],
+                      highlightbackground=C["border"], highlightthickness=1)
+        tf.pack(fill="x", padx=24, pady=(0,4))
+        self._bc_cols = [("test","bd_col_test",150),("score","bc_col_score",160),
+                         ("delta","bd_col_delta",120)]
+        self.bc_tree = ttk.Treeview(tf, columns=[c for c, _, _ in self._bc_cols],
+                                    show="headings", height=6)
+        for col, key, w in self._bc_cols:
+            self.bc_tree.heading(col, text=T(key))
+            self.bc_tree.column(col, width=w, anchor="w")
+            self._tr.add(self._scope, lambda c=col, k=key:
+                         self.bc_tree.heading(c, text=T(k)))
+        self.bc_tree.pack(fill="x", padx=12, pady=8)
+
+    def _run_disk_bench(self):
+        vol, size = self.bd_vol.get(), int(self.bd_size.get().split()[0])
+        if vol: self._submit("btn_bd", self._disk_bench, vol, size)
+
+    @traced(cat="task")
+    def _disk_bench(self, vol: str, size_mb: int, cancel: CancelToken):
+        self.log(T("log_bd_start").format(vol, size_mb), "blue")
+        def _prog(i, n, name):
+            self._post(lambda: self.bd_prog.configure(value=100 * i / n))
+        try:
+            res = bench_disk(vol, size_mb, cancel=cancel, progress=_prog)
+        except OSError as e:
+            self.log(T("log_bd_err") + str(e), "red"); return
+        cancel.check()
+        path = res.pop("_path")
+        where = os.path.dirname(path)
+        if os.path.normcase(where.rstrip("\\/")) != os.path.normcase(vol.rstrip("\\/")):
+            self.log(T("log_bd_fallback").format(vol, where), "yellow")
+        # Only runs of the same file size on the same location are comparable
+        machine = platform.node()
+        prev = load_history("disk_bench.jsonl", machine=machine, volume=where, size_mb=size_mb)
+        last = prev[-1]["results"] if prev else {}
+        append_history("disk_bench.jsonl", {
+            "ts": datetime.now().isoformat(timespec="seconds"), "machine": machine,
+            "volume": where, "size_mb": size_mb, "results": res})
+        rows = [(T("bd_row_file"), path, "—", "—", "—", "—")]
+        for name, r in res.items():
+            old = last.get(name, {}).get("iops" if "iops" in r else "mbps")
+            new = r.get("iops", r["mbps"])
+            delta = f"{(new - old) / old * 100:+.0f}%" if old else "—"
+            rows.append((name + ("" if r["direct"] else " *"), f"{r['mbps']:.1f}",
+                         f"{r['iops']:.0f}" if "iops" in r else "—",
+                         f"{r['p50_us']:.0f} µs" if "p50_us" in r else "—",
+                         f"{r['p99_us']:.0f} µs" if "p99_us" in r else "—", delta))
+            self.log(f"  {rows[-1][0]:<16} {rows[-1][1]:>9} MB/s  {rows[-1][2]:>8} IOPS  "
+                     f"p50 {rows[-1][3]:>9}  p99 {rows[-1][4]:>9}  {delta}", "green")
+        if not all(r["direct"] for r in res.values()): self.log(T("log_bd_cached"), "yellow")
+        self.log(T("log_bd_done").format(path, len(prev) + 1), "blue")
+        def _apply():
+            self.bd_tree.delete(*self.bd_tree.get_children())
+            for row in rows: self.bd_tree.insert("", "end", values=row)
+            self.bd_prog.configure(value=100)
+        self._post(_apply)
+
+    def _run_cpu_bench(self):
+        self._submit("btn_bc", self._cpu_bench)
+
+    @traced(cat="task")
+    def _cpu_bench(self, cancel: CancelToken):
+        self.log(T("log_bc_start"), "purple")
+        def _prog(i, n, name):
+            self._post(lambda: self.bd_prog.configure(value=100 * i / n))
+        res = bench_cpu(cancel=cancel, progress=_prog)
+        cancel.check()
+        si  = self._si_cache.collect()[0]
+        machine = platform.node()
+        prev = load_history("cpu_bench.jsonl", machine=machine)
+        last = prev[-1]["results"] if prev else {}
+        append_history("cpu_bench.jsonl", {
+            "ts": datetime.now().isoformat(timespec="seconds"), "machine": machine,
+            "python": platform.python_version(), "sysinfo": si, "results": res})
+        rows = []
+        for name, v in res.items():
+            unit  = "GB/s" if name.startswith("mem_") else "M ops/s"
+            old   = last.get(name)
+            delta = f"{(v - old) / old * 100:+.0f}%" if old else "—"
+            rows.append((name, f"{v:,.2f} {unit}", delta))
+            self.log(f"  {name:<14} {v:>10,.2f} {unit:<8} {delta}", "green")
+        self.log(T("log_bc_done").format(si.get("cpu", "?"), len(prev) + 1), "purple")
+        def _apply():
+            self.bc_tree.delete(*self.bc_tree.get_children())
+            for row in rows: self.bc_tree.insert("", "end", values=row)
+            self.bd_prog.configure(value=100)
+        self._post(_apply)
+
+    # ── Diagnostics ───────────────────────────────────────────────────────────
+
+    def _tab_diag(self, p):
+        hrow = tk.Frame(p, bg=C["bg"]); hrow.pack(fill="x", padx=24, pady=(16,8))
+        self._bind(lbl(hrow, T("dg_title"), font=FONT_H3), "dg_title").pack(side="left")
+        for key, cmd, col in [("btn_dg_clear",   self._clear_trace,  C["muted"]),
+                              ("btn_dg_export",  self._export_trace, C["blue"]),
+                              ("btn_dg_refresh", self._refresh_diag, C["green"])]:
+            b = make_btn(hrow, T(key), cmd, col, small=True)
+            b.pack(side="right", padx=(6,0)); self._bind(b, key)
+        crow = tk.Frame(p, bg=C["bg"]); crow.pack(fill="x", padx=24, pady=(0,4))
+        self.dg_enabled = tk.BooleanVar(value=TRACE.enabled)
+        cb = tk.Checkbutton(crow, text=T("dg_enable"), variable=self.dg_enabled,
+                            command=lambda: setattr(TRACE, "enabled", self.dg_enabled.get()),
+                            font=FONT_UI, bg=C["bg"], fg=C["text"], selectcolor=C["surface"],
+                            activebackground=C["bg"], activeforeground=C["text"])
+        cb.pack(side="left"); self._bind(cb, "dg_enable")
+        self.dg_count_lbl = lbl(crow, "", font=FONT_SMALL, fg=C["muted"])
+        self.dg_count_lbl.pack(side="left", padx=12)
+        self.dg_filter = self._filter_entry(crow, bg=C["bg"])
+
+        tf = tk.Frame(p, bg=C["surface"],
+                      highlightbackground=C["border"], highlightthickness=1)
+        tf.pack(fill="x", padx=24, pady=(0,4))
+        self.dg_table = VirtualTable(
+            tf, [("op","dg_col_op",260),("cat","dg_col_cat",90),("ms","dg_col_ms",100),
+                 ("thread","dg_col_thread",120),("at","dg_col_at",80),("args","dg_col_args",320)],
+            height=14,
+            fmt=lambda e: (e["name"], e["cat"], f"{e['ms']:.1f}", e["thread"],
+                           e["at"].strftime("%H:%M:%S"),
+                           "  ".join(f"{k}={v}" for k, v in e["args"].items())))
+        self.dg_table.pack(fill="x", padx=12, pady=8)
+        self._tr.add(self._scope, self.dg_table.retranslate)
+        self.dg_filter.trace_add(
+            "write", lambda *_: self.dg_table.set_filter(self.dg_filter.get()))
+        self.dg_hint_lbl = lbl(p, T("dg_hint"), font=FONT_TINY, fg=C["muted"])
+        self.dg_hint_lbl.pack(anchor="w", padx=24, pady=(0,4))
+        self._bind(self.dg_hint_lbl, "dg_hint")
+        self._tr.add(self._scope, self._refresh_diag)
+
+    def _refresh_diag(self):
+        self.dg_table.clear(); self.dg_table.extend(TRACE.slowest())
+        self.dg_count_lbl.config(text=T("dg_count").format(len(TRACE)))
+
+    def _clear_trace(self):
+        TRACE.clear(); self._refresh_diag()
+
+    def _export_trace(self):
+        name = f"Trace_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+        path = filedialog.asksaveasfilename(
+            initialdir=self.report_dir, initialfile=name, defaultextension=".json",
+            filetypes=[("Chrome trace","*.json"),("All","*.*")], title=T("dg_export_title"))
+        if not path: return
+        try:
+            n = TRACE.export(path)
+            self.log(f"{T('log_dg_export').format(n)} {os.path.basename(path)}", "green")
+        except OSError as e:
+            messagebox.showerror(T("export_err"), str(e))
 
     # ── Language Tab ──────────────────────────────────────────────────────────
 
@@ -1053,6 +4589,8 @@ class PCAnalystPro:
         self.lang_t_lbl.pack(anchor="w", pady=(0,6))
         self.lang_s_lbl = lbl(f, T("lang_sub"), fg=C["muted"])
         self.lang_s_lbl.pack(anchor="w", pady=(0,20))
+        self._bind(self.lang_t_lbl, "lang_title")
+        self._bind(self.lang_s_lbl, "lang_sub")
         br = tk.Frame(f, bg=C["bg"]); br.pack(anchor="w")
         self._lang_tab_btns = {}
         for code, label in [("en","🇬🇧  English"),("tr","🇹🇷  Türkçe")]:
@@ -1065,10 +4603,12 @@ class PCAnalystPro:
                           relief="flat", cursor="hand2", bd=0,
                           command=lambda c=code: self._change_lang(c))
             b.pack(side="left", padx=(0,12)); self._lang_tab_btns[code] = b
+        self._tr.add(self._scope, self._paint_lang_tab_btns)
         make_sep(f).pack(fill="x", pady=20)
         self.lang_n_lbl = lbl(f, T("lang_note"), fg=C["yellow"],
                                font=("Segoe UI",9,"italic"), justify="left")
         self.lang_n_lbl.pack(anchor="w")
+        self._bind(self.lang_n_lbl, "lang_note")
 
     # ── Console ───────────────────────────────────────────────────────────────
 
@@ -1077,8 +4617,14 @@ class PCAnalystPro:
         self.op_lbl = tk.Label(ch, text=T("op_log"), font=FONT_SMALL,
                                 bg=C["bg"], fg=C["muted"])
         self.op_lbl.pack(side="left")
+        self.job_bar = tk.Frame(ch, bg=C["bg"]); self.job_bar.pack(side="left", padx=12)
         self.btn_exp = make_btn(ch, T("btn_export"), self._export, C["muted"], small=True)
         self.btn_exp.pack(side="right", padx=4)
+        self.gov_lbl = tk.Label(ch, font=FONT_SMALL, bg=C["bg"], fg=C["muted"])
+        self.gov_lbl.pack(side="right", padx=12)
+        self._tr.add("", self._paint_gov)
+        self._bind(self.op_lbl, "op_log")
+        self._bind(self.btn_exp, "btn_export")
         self.console = tk.Text(self.root, bg=C["surface"], fg=C["text"],
                                 font=FONT_MONO, padx=12, pady=10,
                                 borderwidth=1, relief="flat",
@@ -1089,82 +4635,107 @@ class PCAnalystPro:
                           ("orange",C["orange"]),("teal",C["teal"]),("muted",C["muted"])]:
             self.console.tag_configure(tag, foreground=col)
 
+    def _paint_gov(self):
+        g = self.gov
+        txt = T("gov_status").format(g.cpu, fmt_bytes(g.rss))
+        if g.scale > 1: txt += T("gov_throttled").format(g.scale)
+        self.gov_lbl.config(text=txt, fg=C["yellow"] if g.over else C["muted"])
+
     # ════════════════════════════════════════════════════════════════════════
     #  LANGUAGE
     # ════════════════════════════════════════════════════════════════════════
 
-    def _change_lang(self, code: str): set_lang(code); self._retranslate()
-
-    def _retranslate(self):
-        self.root.title(T("app_title"))
-        self.hdr_lbl.config(text=T("header_title"))
-        for tid, key in self._tab_ids: self.nb.tab(tid, text=T(key))
+    def _change_lang(self, code: str):
+        t0 = time.perf_counter()
+        with span("change_lang", "ui", lang=code):
+            set_lang(code)
+            n = self._tr.switch(self._visible_tab())
+        ms = (time.perf_counter() - t0) * 1000
+        self.log(T("log_lang_switch").format(ms, n, len(self._tr), len(_TABLE)), "muted")
 
+    def _paint_lang_btns(self):
         for code, btn in self._lang_btns.items():
             a = (code == _LANG)
             btn.config(bg=C["blue"] if a else C["surface"],
                        fg=C["bg"]   if a else C["muted"])
+
+    def _paint_lang_tab_btns(self):
         for code, btn in self._lang_tab_btns.items():
             a = (code == _LANG)
             btn.config(bg=C["blue"] if a else C["surface"],
                        fg=C["bg"]   if a else C["text"])
 
-        for mkey, (bar, l, vl) in self.bars.items():
-            pct = l.cget("text").split(":")[1].strip() if ":" in l.cget("text") else "0%"
-            l.config(text=f"{T(mkey)}:  {pct}")
-
-        self.btn_qs.config(text=T("btn_quick_scan"))
-        self.btn_ds.config(text=T("btn_deep_scan"))
-        self.btn_qf.config(text=T("btn_quick_fix"))
-        self.crash_h_lbl.config(text=T("crash_history"))
-        self.crash_hint_lbl.config(text=T("crash_hint"))
-        for col, key, _ in self._tree_cols: self.crash_tree.heading(col, text=T(key))
-
-        self.cl_title_lbl.config(text=T("cleanup_title"))
-        for _, (cb, sk) in self._cl_cbs.items(): cb.config(text=T(sk))
-        self.btn_cl.config(text=T("btn_cleanup"))
-        self.btn_ram.config(text=T("btn_opt_ram"))
-
-        self.btn_nd.config(text=T("btn_net_diag"))
-        self.btn_sp.config(text=T("btn_speed"))
-        self.net_h_lbl.config(text=T("net_health"))
-        for k, (rl, sk) in self._net_rows.items(): rl.config(text=f"{T(sk)}:")
-
-        self.si_title_lbl.config(text=T("si_title"))
-        self.btn_si_ref.config(text=T("btn_refresh_si"))
-        for _, (vl, sk, _) in self._si_rows.items():
-            vl.master.winfo_children()[0].config(text=T(sk))
-
-        self.sm_title_lbl.config(text=T("sm_title"))
-        self.btn_sm_ref.config(text=T("btn_sm_refresh"))
-        self.btn_sm_dis.config(text=T("btn_sm_disable"))
-        self.btn_sm_en.config(text=T("btn_sm_enable"))
-        self.sm_hint_lbl.config(text=T("sm_hint"))
-        for col, key, _ in self._sm_cols: self.sm_tree.heading(col, text=T(key))
-        # Re-render state column translations
-        for i, item in enumerate(self.sm_tree.get_children()):
-            vals = list(self.sm_tree.item(item, "values"))
-            if i < len(self._startup_entries):
-                d = self._startup_entries[i]["disabled"]
-                vals[3] = T("sm_disabled") if d else T("sm_enabled")
-            self.sm_tree.item(item, values=vals)
-
-        self.th_title_lbl.config(text=T("th_title"))
-        self.btn_th_ref.config(text=T("btn_th_refresh"))
-        self.th_hint_lbl.config(text=T("th_hint"))
-        for _, (vl, sk, _) in self._th_labels.items():
-            vl.master.winfo_children()[0].config(text=T(sk))
-
-        self.lang_t_lbl.config(text=T("lang_title"))
-        self.lang_s_lbl.config(text=T("lang_sub"))
-        self.lang_n_lbl.config(text=T("lang_note"))
-        self.op_lbl.config(text=T("op_log"))
-        self.btn_exp.config(text=T("btn_export"))
+    # ════════════════════════════════════════════════════════════════════════
+    #  JOBS
+    # ════════════════════════════════════════════════════════════════════════
+
+    def _submit(self, kind: str, fn, *args):
+        """Queue `fn` as job `kind` (the S key of the button that starts it)."""
+        job = self.jobs.submit(kind, fn, *args)
+        if job is None: self.log(T("log_job_busy").format(T(kind).strip()), "muted")
+        return job
+
+    def _sched_tick(self):
+        """Start due schedule.json jobs on background tokens; every 30 s."""
+        jobs = {"deep_scan": ("btn_deep_scan", self._deep_scan),
+                "drivers":   ("job_drivers",   self._driver_aging),
+                "cleanup":   ("btn_cleanup",   self._cleanup)}
+        now = datetime.now()
+        try:
+            for e in self.sched.due(now, user_idle_seconds()):
+                kind, fn = jobs[e["job"]]
+                name = T(kind).strip()
+                gate = Backoff(self.sched.backoff.get("idle", 60), self.sched.backoff.get("cpu", 60))
+                token = PoliteToken(gate, on_wait=lambda r, n=name: self.log(
+                    T("log_sched_wait").format(n, T(f"sched_{r}")), "muted"))
+                if self.jobs.submit(kind, fn, token=token):
+                    self.log(T("log_sched_run").format(name), "muted")
+                    self.sched.mark(e, now)
+        finally:                                # one bad tick must not stop the scheduler
+            self.root.after(30_000, self._sched_tick)
+
+    def _job_changed(self, job: Job):
+        name = T(job.kind).strip()
+        if job.state == "cancelled": self.log(T("log_job_cancel").format(name), "yellow")
+        elif job.state == "failed":  self.log(T("log_job_fail").format(name, job.error), "red")
+        self._post(self._paint_jobs)
+
+    def _paint_jobs(self):
+        """One chip per queued/running job: name, elapsed time, cancel button."""
+        live = {j.kind: j for j in self.jobs.jobs() if j.active}
+        for kind in [k for k in self._job_chips if k not in live]:
+            self._job_chips.pop(kind)[0].destroy()
+        for kind, job in live.items():
+            if kind not in self._job_chips:
+                f = tk.Frame(self.job_bar, bg=C["surface"]); f.pack(side="left", padx=(0,6))
+                l = tk.Label(f, font=FONT_SMALL, bg=C["surface"], fg=C["yellow"], padx=6)
+                l.pack(side="left")
+                tk.Button(f, text="✕", font=FONT_SMALL, bg=C["surface"], fg=C["red"],
+                          activebackground=C["red"], activeforeground=C["white"],
+                          relief="flat", bd=0, cursor="hand2",
+                          command=lambda k=kind: self.jobs.cancel(k)).pack(side="left")
+                self._job_chips[kind] = (f, l)
+            icon = "…" if job.token() else ("⏳" if job.state == "queued" else "▶")
+            self._job_chips[kind][1].config(
+                text=f"{icon} {T(kind).strip()}  {job.elapsed():.0f}s")
 
     # ════════════════════════════════════════════════════════════════════════
     #  LOGGING
     # ════════════════════════════════════════════════════════════════════════
 
+    def _post(self, fn):
+        """root.after(0, fn) from any thread.  When tracing, the callback is a
+        "ui" span whose args carry the time it waited in the Tk queue."""
+        if not TRACE.enabled: return self.root.after(0, fn)
+        name = getattr(fn, "__qualname__", "ui").replace(".<locals>", "")
+        t_post = time.perf_counter()
+        def _run():
+            t0 = time.perf_counter()
+            try: fn()
+            finally: TRACE.record(name, "ui", t0, time.perf_counter(),
+                                  {"queued_ms": f"{(t0 - t_post) * 1000:.1f}"})
+        return self.root.after(0, _run)
+
     def log(self, text: str, color: str = ""):
         def _do():
             self.console.config(state="normal")
@@ -1172,30 +4743,62 @@ class PCAnalystPro:
             self.console.insert("end", f"{ts}  {text}\n", color or "")
             self.console.see("end")
             self.console.config(state="disabled")
-        self.root.after(0, _do)
+        self._post(_do)
 
     # ════════════════════════════════════════════════════════════════════════
     #  LIVE MONITOR
     # ════════════════════════════════════════════════════════════════════════
 
     def _monitor_loop(self):
+        if not PSUTIL_OK: return
+        sampler = MetricSampler()
+        time.sleep(1)
         while self.running:
             try:
-                cpu  = psutil.cpu_percent(interval=1) if PSUTIL_OK else 0
-                ram  = psutil.virtual_memory().percent if PSUTIL_OK else 0
-                disk = psutil.disk_usage("/").percent  if PSUTIL_OK else 0
-                gpu  = 0
+                sample = sampler.sample()
+                sample["gpu"] = None
                 if GPU_OK:
                     try:
                         h = pynvml.nvmlDeviceGetHandleByIndex(0)
-                        gpu = pynvml.nvmlDeviceGetUtilizationRates(h).gpu
+                        sample["gpu"] = pynvml.nvmlDeviceGetUtilizationRates(h).gpu
                     except Exception: pass
-                for k, v in [("m_cpu",cpu),("m_ram",ram),
-                               ("m_gpu",gpu),("m_disk",disk)]:
-                    self.root.after(0, lambda k=k, v=v: self._set_bar(k, v))
+                self._post(lambda d=sample: self._paint_dashboard(d))
+                # sensor reads are the costly part; skipped while over budget
+                if self.alerts.metrics & {"cpu_temp", "gpu_temp"} and not self.gov.defer():
+                    sample.update(thermal_metrics())
+                self.alerts.feed(sample)
+                self.gov.tick()
+                self._post(self._paint_gov)
             except Exception as e:
                 print(f"Monitor: {e}")
-            time.sleep(2)
+            time.sleep(2 * self.gov.scale)
+
+    def _on_alert(self, a: Alert):
+        """Monitor-thread sink: console line, toast, events.jsonl record."""
+        append_history("events.jsonl", {"type": "alert", **a._asdict()})
+        if a.state == "resolved":
+            self.log(T("alert_resolved").format(a.rule), "green"); return
+        val = f"{a.value:.1f}{'/min' if a.stat == 'rate' else ''}"
+        text = T("alert_fire").format(a.rule, a.metric, a.stat, val, a.op, a.threshold)
+        self.log(text, "red" if a.severity == "critical" else "yellow")
+        self._post(lambda: self._toast(a.rule, text, C["red"] if a.severity == "critical" else C["yellow"]))
+
+    def _toast(self, title: str, text: str, color: str, ms: int = 8000):
+        """Borderless popup stacked in the bottom-right screen corner."""
+        w = tk.Toplevel(self.root)
+        w.overrideredirect(True); w.attributes("-topmost", True)
+        w.configure(bg=C["surface"], highlightbackground=color, highlightthickness=2)
+        tk.Label(w, text=f"⚠  {title}", font=FONT_H3, bg=C["surface"], fg=color
+                 ).pack(anchor="w", padx=12, pady=(8, 2))
+        tk.Label(w, text=text.strip(), font=FONT_SMALL, bg=C["surface"], fg=C["text"],
+                 wraplength=340, justify="left").pack(anchor="w", padx=12, pady=(0, 10))
+        w.update_idletasks()
+        self._toasts = [t for t in self._toasts if t.winfo_exists()] + [w]
+        y = w.winfo_screenheight() - 60
+        for t in reversed(self._toasts):
+            y -= t.winfo_reqheight() + 8
+            t.geometry(f"+{t.winfo_screenwidth() - t.winfo_reqwidth() - 16}+{y}")
+        w.after(ms, w.destroy)
 
     def _set_bar(self, mkey: str, value: float):
         bar, l, vl = self.bars[mkey]
@@ -1208,9 +4811,10 @@ class PCAnalystPro:
     # ════════════════════════════════════════════════════════════════════════
 
     def _run_quick_scan(self):
-        threading.Thread(target=self._quick_scan, daemon=True).start()
+        self._submit("btn_quick_scan", self._quick_scan)
 
-    def _quick_scan(self):
+    @traced(cat="task")
+    def _quick_scan(self, cancel: CancelToken):
         self.log(T("log_qs_start"), "blue")
         self.log(T("log_svc_check"), "muted")
         critical = ["lsass.exe","csrss.exe","winlogon.exe","svchost.exe"]
@@ -1237,21 +4841,21 @@ class PCAnalystPro:
     # ════════════════════════════════════════════════════════════════════════
 
     def _run_deep_scan(self):
-        threading.Thread(target=self._deep_scan, daemon=True).start()
+        self._submit("btn_deep_scan", self._deep_scan)
 
-    def _deep_scan(self):
+    @traced(cat="task")
+    def _deep_scan(self, cancel: CancelToken):
         self.log(T("log_ds_start"), "blue")
         self.scan_results.clear()
-        self.root.after(0, lambda: self.crash_tree.delete(
-            *self.crash_tree.get_children()))
+        self._post(self.crash_table.clear)
         self.log(T("log_evtlog"), "muted")
-        if WIN32_OK: self._parse_event_logs()
-        else: self.log(T("log_no_pywin32"),"yellow"); self._parse_minidumps()
-        self.log(T("log_smart"), "muted"); self._smart_check()
+        if WIN32_OK: self._parse_event_logs(cancel)
+        else: self.log(T("log_no_pywin32"),"yellow"); self._parse_minidumps(cancel)
+        cancel.check(); self.log(T("log_smart"), "muted"); self._smart_check()
         # Driver aging scan: highlight drivers older than 2 years
-        self.log(T("drv_risk"), "muted"); self._driver_aging()
-        self.log(T("log_bg_proc"), "muted"); self._process_audit()
-        self.log(T("log_top_cpu"), "muted")
+        cancel.check(); self.log(T("drv_risk"), "muted"); self._driver_aging(cancel)
+        cancel.check(); self.log(T("log_bg_proc"), "muted"); self._process_audit()
+        cancel.check(); self.log(T("log_top_cpu"), "muted")
         if PSUTIL_OK:
             procs = sorted(psutil.process_iter(["name","cpu_percent"]),
                            key=lambda p: p.info.get("cpu_percent") or 0,
@@ -1262,84 +4866,77 @@ class PCAnalystPro:
                 self.log(f"  {pr.info['name']:<30} {cpu:>6.1f}% CPU", col)
         self.log(T("log_ds_done"), "blue")
         if not self.scan_results: self.log(T("log_no_crash"), "green")
-
-    def _parse_event_logs(self):
+        cancel.check()
+        try: self._snapshot()
+        except Exception as e: self.log(T("snap_err").format(e), "yellow")
+        if self._fleet: self._upload_report()
+
+    @traced(cat="task")
+    def _snapshot(self):
+        si = self._si_cache.collect()[0]
+        store = SnapshotStore()
+        prev = store.list()
+        man = store.save(collect_snapshot(self.scan_results, si), label="deep_scan")
+        self.log(T("snap_saved").format(man["id"][:15], man["new"], len(man["sections"])), "muted")
+        if not prev: return
+        when = datetime.fromtimestamp(store.manifest(prev[-1])["ts"]).strftime("%Y-%m-%d %H:%M")
+        lines = snapshot_changes(store.diff(prev[-1], man["id"]))
+        if not lines: self.log(T("snap_none").format(when), "green"); return
+        self.log(T("snap_since").format(when), "blue")
+        for key, *a in lines:
+            self.log(T(key).format(*a), "red" if key == "snap_crash_new" else "yellow")
+
+    def _upload_report(self):
+        si = self._si_cache.collect()[0]
+        self._fleet.submit(scan_payload(self.scan_results, si))
+        try:
+            self.log(T("log_fleet_sent").format(self._fleet.flush()), "green")
+        except OSError as e:
+            self.log(T("log_fleet_err").format(e), "yellow")
+        if self._fleet.rejected:
+            self.log(T("log_fleet_rejected").format(self._fleet.rejected,
+                                                    self._fleet.spool + ".rejected"), "yellow")
+
+    def _parse_event_logs(self, cancel: CancelToken):
         try:
-            h = win32evtlog.OpenEventLog(None, "System")
-            flags = (win32evtlog.EVENTLOG_BACKWARDS_READ |
-                     win32evtlog.EVENTLOG_SEQUENTIAL_READ)
-            count = 0
-            while count < 500:
-                recs = win32evtlog.ReadEventLog(h, flags, 0)
-                if not recs: break
-                for rec in recs:
-                    count += 1
-                    if rec.EventID & 0xFFFF == 1001:
-                        msg  = win32evtlogutil.SafeFormatMessage(rec, "System")
-                        code = self._extract_code(msg)
-                        fn, friendly = _find_driver_in_text(msg)
-                        culprit = friendly if friendly else None
-                        self._add_crash(rec.TimeGenerated.Format(), code, "Event Log", culprit=culprit)
-                    if count >= 500: break
-            win32evtlog.CloseEventLog(h)
+            for ev in crash_events(cancel=cancel):
+                ts = ev.time.strftime("%Y-%m-%d %H:%M") if ev.time else "?"
+                src = f"{T('src_evtlog')} · {ev.provider.rsplit('-', 1)[-1]} {ev.event_id}"
+                if ev.detail: src += f" · {ev.detail}"
+                self._add_crash(ts, ev.code, src, culprit=ev.culprit)
         except Exception as ex:
             self.log(T("log_evtlog_err") + str(ex), "yellow")
 
-    def _parse_minidumps(self):
-        mini = r"C:\Windows\Minidump"
-        if not os.path.isdir(mini): self.log(T("log_no_mini_dir"), "muted"); return
+    @traced(cat="collector")
+    def _parse_minidumps(self, cancel: CancelToken):
+        windir = os.environ.get("SystemRoot", r"C:\Windows")
+        mini, full = os.path.join(windir, "Minidump"), os.path.join(windir, "MEMORY.DMP")
         try:
             files = sorted(glob.glob(os.path.join(mini,"*.dmp")),
                            key=os.path.getmtime, reverse=True)[:10]
-            if not files: self.log(T("log_no_dmp"), "muted"); return
+            if os.path.isfile(full): files.insert(0, full)
+            if not files:
+                self.log(T("log_no_dmp" if os.path.isdir(mini) else "log_no_mini_dir"), "muted")
+                return
             for path in files:
+                cancel.check()
                 mtime = datetime.fromtimestamp(
                     os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M")
-                code = self._read_dump(path)
-                # Attempt to scan binary dump for known driver filenames
-                try:
-                    fn, friendly = self._scan_dump_for_driver(path)
-                except Exception:
-                    fn, friendly = (None, None)
-                culprit = friendly if friendly else None
-                self._add_crash(mtime, code, os.path.basename(path), culprit=culprit)
+                hdr = dump_header(path)
+                if path == full:
+                    self.log(T("log_full_dump").format(fmt_bytes(os.path.getsize(path)),
+                                                       hdr.dump_type or "?"), "muted")
+                # Scan the whole dump for known driver filenames
+                with span("dump_modules", "collector", file=os.path.basename(path)):
+                    fn, friendly, mods = _scan_dump_for_driver(path, cancel, hdr.code)
+                self._add_crash(mtime, hdr.code, os.path.basename(path), culprit=friendly)
+                if len(mods) > 1 or (mods and not fn):
+                    self.log(T("log_dump_mods").format(", ".join(mods)), "muted")
         except PermissionError:
             self.log(T("log_perm"), "yellow")
 
-    def _scan_dump_for_driver(self, path: str):
-        """Read initial bytes of dump and look for known driver filenames."""
-        try:
-            with open(path, "rb") as f:
-                data = f.read(0x4000)
-            # decode as latin1 to preserve byte values for ascii matches
-            txt = data.decode("latin-1", errors="ignore")
-            return _find_driver_in_text(txt)
-        except Exception:
-            return (None, None)
-
-    def _read_dump(self, path: str) -> str:
-        try:
-            with open(path, "rb") as f: data = f.read(0x1000)
-            if data[:4] != b"MDMP": return "UNKNOWN"
-            ns = struct.unpack_from("<I", data, 0x10)[0]
-            rva = struct.unpack_from("<I", data, 0x1C)[0]
-            for i in range(min(ns, 32)):
-                off = rva + i * 12
-                if off + 12 > len(data): break
-                stype = struct.unpack_from("<I", data, off)[0]
-                s_rva = struct.unpack_from("<I", data, off + 8)[0]
-                if stype == 6 and s_rva + 4 <= len(data):
-                    return f"0x{struct.unpack_from('<I', data, s_rva)[0]:08X}"
-            return "UNKNOWN"
-        except Exception: return "UNKNOWN"
-
-    @staticmethod
-    def _extract_code(msg: str) -> str:
-        m = re.search(r"0x[0-9A-Fa-f]{8}", msg)
-        return m.group(0).upper() if m else "UNKNOWN"
-
     def _add_crash(self, ts, code, src, culprit: str = None):
-        entry = BSOD_DB.get(code.upper(), BSOD_DB["UNKNOWN"])
+        entry = bsod_entry(code)
         cat = BF(entry, "category")
         rec = {"time": ts, "code": code, "category": cat, "file": src, "culprit": culprit}
         self.scan_results.append(rec)
@@ -1348,57 +4945,41 @@ class PCAnalystPro:
             self.log(f"  🔴  {ts}  |  {code}  |  {cat}  |  {culprit}", "red")
         else:
             self.log(f"  🔴  {ts}  |  {code}  |  {cat}", "red")
-        self.root.after(0, lambda: self.crash_tree.insert(
-            "", "end", values=(ts, code, cat, src)))
+        self.crash_table.post([rec])
 
+    @traced(cat="collector")
     def _smart_check(self):
         try:
-            out = ps_query(
-                "Get-CimInstance Win32_DiskDrive | "
-                "Select-Object Model,Size,Status | "
-                "ConvertTo-Csv -NoTypeInformation", timeout=12)
-            for line in out.splitlines()[1:]:
-                parts = [p.strip('"') for p in line.split('","')]
-                if len(parts) >= 3:
-                    model, size_b, status = parts[0], parts[1], parts[2]
-                    gb = int(size_b) // 1024**3 if size_b.isdigit() else 0
-                    self.log(f"{T('log_disk_lbl')} {model}  —  {gb} GB  —  {status}",
-                             "green" if status.lower()=="ok" else "red")
+            for r in wmi().query("SELECT Model, Size, Status FROM Win32_DiskDrive"):
+                model, status = (r["Model"] or "?").strip(), r["Status"] or "?"
+                gb = int(r["Size"] or 0) // 1024**3
+                self.log(f"{T('log_disk_lbl')} {model}  —  {gb} GB  —  {status}",
+                         "green" if status.lower()=="ok" else "red")
         except Exception as e:
             self.log(T("log_smart_err") + str(e), "yellow")
 
-    def _driver_aging(self):
+    @traced(cat="collector")
+    def _driver_aging(self, cancel: CancelToken):
         """Scan installed signed drivers and flag ones older than 2 years."""
-        def _work():
-            try:
-                ps = (
-                    "Get-CimInstance Win32_PnPSignedDriver | Select-Object DeviceName,Manufacturer,DriverVersion,"
-                    "@{n='DriverDate';e={if ($_.DriverDate) {$_.DriverDate.ToString('s')} else {''}}} | ConvertTo-Csv -NoTypeInformation"
-                )
-                out = ps_query(ps, timeout=20)
-                if not out:
-                    self.log(T("drv_age_none"), "green")
-                    return
-                outdated = []
-                for line in out.splitlines()[1:]:
-                    parts = [p.strip('"') for p in line.split('","')]
-                    if len(parts) < 4: continue
-                    name = parts[0]; date_s = parts[3]
-                    if not date_s: continue
-                    try:
-                        dt = datetime.fromisoformat(date_s)
-                        age_days = (datetime.now() - dt).days
-                        if age_days > 365 * 2:
-                            outdated.append(name)
-                            self.log(T("drv_age_old").format(name), "yellow")
-                    except Exception:
-                        continue
-                if not outdated:
-                    self.log(T("drv_age_none"), "green")
-            except Exception as e:
-                self.log("Driver aging scan failed: " + str(e), "yellow")
-        threading.Thread(target=_work, daemon=True).start()
+        try:
+            outdated = []
+            cancel.check()
+            rows = wmi().query("SELECT DeviceName, DriverDate FROM Win32_PnPSignedDriver")
+            for i, r in enumerate(rows):
+                if i % 50 == 0: cancel.check()         # scheduled runs pause here while the user is active
+                dt = wmi_datetime(r["DriverDate"])
+                if not (dt and r["DeviceName"]): continue
+                if (datetime.now() - dt.replace(tzinfo=None)).days > 365 * 2:
+                    outdated.append(r["DeviceName"])
+                    self.log(T("drv_age_old").format(r["DeviceName"]), "yellow")
+            if not outdated:
+                self.log(T("drv_age_none"), "green")
+        except JobCancelled:
+            raise
+        except Exception as e:
+            self.log("Driver aging scan failed: " + str(e), "yellow")
 
+    @traced(cat="collector")
     def _process_audit(self):
         if not PSUTIL_OK: return
         bad = {"cryptominer","xmrig","minerd","nssm","mimikatz","rat.exe"}
@@ -1409,46 +4990,105 @@ class PCAnalystPro:
                          f"(PID {pr.info['pid']})", "red")
                 found = True
         if not found: self.log(T("log_no_susp"), "green")
+        self._hash_audit()
+
+    @traced(cat="collector")
+    def _hash_audit(self):
+        t0, exes = time.perf_counter(), {}
+        for pr in psutil.process_iter(["name","pid","exe"]):
+            if pr.info.get("exe"): exes.setdefault(pr.info["exe"], pr.info)
+        cache = HashCache()
+        digests, hashed = hash_files(exes, cache)
+        try: cache.save()
+        except OSError: pass
+        block = load_hash_list("blocklist.txt")
+        allow = load_hash_list("allowlist.txt")
+        blocked = allowed = 0
+        for path, d in digests.items():         # a block-list hit wins over the allow list
+            if d in block:
+                blocked += 1; info = exes[path]
+                self.log(f"{T('log_susp')} {info['name']} (PID {info['pid']}) — "
+                         f"{T('log_hash_block')} {block[d] or d[:16]}", "red")
+            elif d in allow: allowed += 1
+        self.log(T("log_hash_sum").format(
+            len(digests), hashed, time.perf_counter() - t0, blocked, allowed,
+            len(digests) - blocked - allowed), "red" if blocked else "muted")
 
     # ════════════════════════════════════════════════════════════════════════
     #  QUICK FIX PRO
     # ════════════════════════════════════════════════════════════════════════
 
     def _run_quick_fix(self):
-        threading.Thread(target=self._quick_fix, daemon=True).start()
+        self._submit("btn_quick_fix", self._quick_fix)
 
-    def _quick_fix(self):
+    @traced(cat="task")
+    def _quick_fix(self, cancel: CancelToken):
         self.log(T("log_qf_start"), "orange")
+        # (log key, command, share of the bar, inactivity limit in seconds)
         steps = [
-            ("log_qf_dns",  ["ipconfig", "/flushdns"]),
-            ("log_qf_dism", ["DISM", "/Online", "/Cleanup-Image", "/RestoreHealth"]),
-            ("log_qf_sfc",  ["sfc", "/scannow"]),
+            ("log_qf_dns",  ["ipconfig", "/flushdns"],                              2,  30),
+            ("log_qf_dism", ["DISM", "/Online", "/Cleanup-Image", "/RestoreHealth"], 55, 900),
+            ("log_qf_sfc",  ["sfc", "/scannow"],                                    43, 600),
         ]
-        for lkey, cmd in steps:
+        total, done = sum(w for _, _, w, _ in steps), 0
+        def _show(pct, text):
+            self._post(lambda: (self.qf_prog.configure(value=pct),
+                                self.qf_lbl.config(text=text)))
+        for lkey, cmd, weight, idle in steps:
+            cancel.check()
             self.log(T(lkey), "muted")
+            tool = cmd[0].upper()
+            _show(100 * done / total, tool)
+            def _prog(pct, base=done, w=weight, tool=tool):
+                _show(100 * (base + w * pct / 100) / total, f"{tool}  {pct:.1f}%")
             try:
-                subprocess.run(cmd, capture_output=True, timeout=360,
-                               creationflags=subprocess.CREATE_NO_WINDOW)
-                self.log(T("log_qf_ok"), "green")
+                r = stream_cmd(cmd, idle_timeout=idle, on_progress=_prog, cancel=cancel)
+                if r.returncode == 0: self.log(T("log_qf_ok"), "green")
+                else: self.log(T("log_qf_rc").format(r.returncode, r.tail[-1] if r.tail else ""), "red")
+                self.log(T("log_qf_log").format(r.log_path), "muted")
+            except JobCancelled:
+                _show(100 * done / total, ""); raise
+            except subprocess.TimeoutExpired as e:
+                self.log(T("log_qf_idle").format(e.timeout), "red")
             except Exception as e:
                 self.log(T("log_qf_err") + str(e), "red")
+            done += weight
+        _show(100, "")
         self.log(T("log_qf_done"), "orange")
 
+    # ════════════════════════════════════════════════════════════════════════
+    #  BATCH ANALYSIS
+    # ════════════════════════════════════════════════════════════════════════
+
+    def _run_batch(self):
+        src = filedialog.askdirectory(title=T("batch_pick"))
+        if not src: return
+        out = os.path.join(self.report_dir,
+                           f"Batch_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.csv")
+        self._submit("btn_batch", self._batch, src, out)
+
+    def _batch(self, src: str, out: str, cancel: CancelToken):
+        workers = os.cpu_count() or 1
+        self.log(T("log_batch_start").format(len(batch_files(src)), workers), "blue")
+        def _prog(done, total):
+            self._post(lambda: (self.batch_prog.configure(value=100 * done / max(total, 1)),
+                                self.batch_lbl.config(text=f"{done}/{total}")))
+        r = batch_analyze(src, out, workers, progress=_prog, cancel=cancel)
+        cancel.check()
+        self.log(T("log_batch_done").format(r["files"], r["rows"], r["errors"],
+                                            r["seconds"], r["csv"]), "green")
+        if r["top"]:
+            self.log(T("log_batch_top").format(", ".join(f"{c} ×{n}" for c, n in r["top"])), "muted")
+
     # ════════════════════════════════════════════════════════════════════════
     #  CRASH MODAL
     # ════════════════════════════════════════════════════════════════════════
 
     def _on_crash_click(self, _):
-        sel = self.crash_tree.selection()
-        if not sel: return
-        ts, code = self.crash_tree.item(sel[0], "values")[:2]
-        entry = BSOD_DB.get(code.upper(), BSOD_DB["UNKNOWN"])
-        # try find culprit from scan_results matching timestamp+code
-        culprit = None
-        for r in self.scan_results:
-            if r.get("time") == ts and r.get("code") == code:
-                culprit = r.get("culprit")
-                break
+        rec = self.crash_table.selected()
+        if not rec: return
+        ts, code, culprit = rec["time"], rec["code"], rec.get("culprit")
+        entry = bsod_entry(code)
         m = tk.Toplevel(self.root)
         m.title(f"{T('modal_title')} — {code}")
         m.configure(bg=C["bg"]); m.resizable(False,False); m.grab_set()
@@ -1503,19 +5143,13 @@ class PCAnalystPro:
             # run in background to avoid UI freeze
             warn_lbl = tk.Label(m, text="", font=FONT_SMALL, bg=C["bg"], fg=C["red"], wraplength=440, justify="left")
             warn_lbl.pack(fill="x", padx=20, pady=(8,4))
-            def _check_thermal():
-                d = collect_thermal()
-                ct = d.get("cpu_temp")
-                maxtemp = None
-                if ct:
-                    m = re.search(r"([0-9]+(\.[0-9]+)?)", ct)
-                    if m:
-                        try: maxtemp = float(m.group(1))
-                        except Exception: maxtemp = None
-                if maxtemp and maxtemp > 85:
+            def _check_thermal(cancel):
+                maxtemp = max((s.value for s in sensors().read() if s.kind == "temp"
+                               and s.group in ("cpu", "core", "zone")), default=None)
+                if maxtemp and maxtemp > TEMP_LIMITS["cpu"][1]:
                     txt = T("diag_overheat").format(int(maxtemp))
-                    self.root.after(0, lambda: warn_lbl.config(text=txt))
-            threading.Thread(target=_check_thermal, daemon=True).start()
+                    self._post(lambda: warn_lbl.config(text=txt))
+            self._submit("modal_title", _check_thermal)
         make_btn(m, T("btn_close"), m.destroy, C["blue"]).pack(pady=(0,16))
 
     # ════════════════════════════════════════════════════════════════════════
@@ -1523,9 +5157,10 @@ class PCAnalystPro:
     # ════════════════════════════════════════════════════════════════════════
 
     def _run_ram_opt(self):
-        threading.Thread(target=self._ram_opt, daemon=True).start()
+        self._submit("btn_opt_ram", self._ram_opt)
 
-    def _ram_opt(self):
+    @traced(cat="task")
+    def _ram_opt(self, cancel: CancelToken):
         self.log(T("log_ram_opt"), "purple")
         before, after = optimise_ram()
         if before == 0 == after: return
@@ -1540,52 +5175,136 @@ class PCAnalystPro:
     # ════════════════════════════════════════════════════════════════════════
 
     def _run_cleanup(self):
-        threading.Thread(target=self._cleanup, daemon=True).start()
-
-    def _cleanup(self):
-        self.root.after(0, self.cl_prog.start)
-        self.log(T("log_cl_start"), "yellow")
-        total = 0
-        def clean(folder, ext=""):
-            freed = 0
-            for rd, _, files in os.walk(folder):
-                for fn in files:
-                    if ext and not fn.endswith(ext): continue
-                    fp = os.path.join(rd, fn)
-                    try: freed += os.path.getsize(fp); os.remove(fp)
-                    except (PermissionError, FileNotFoundError, OSError): pass
-            return freed
-        if self.clean_opts["temp"].get():
-            for f in [os.environ.get("TEMP",""), os.environ.get("TMP",""),
-                      r"C:\Windows\Temp"]:
-                if f and os.path.isdir(f):
-                    n = clean(f); total += n
-                    self.log(f"  Temp [{f}]: {n/1024**2:.2f} {T('log_freed')}", "green")
-        if self.clean_opts["prefetch"].get():
-            pf = r"C:\Windows\Prefetch"
-            if os.path.isdir(pf):
-                n = clean(pf,".pf"); total += n
-                self.log(f"  Prefetch: {n/1024**2:.2f} {T('log_freed')}", "green")
-            else: self.log(T("log_pf_nf"), "muted")
-        if self.clean_opts["updates"].get():
-            wu = r"C:\Windows\SoftwareDistribution\Download"
-            if os.path.isdir(wu):
-                n = clean(wu); total += n
-                self.log(f"  WU Cache: {n/1024**2:.2f} {T('log_freed')}", "green")
-            else: self.log(T("log_wu_nf"), "muted")
-        if self.clean_opts["browser"].get():
-            la = os.environ.get("LOCALAPPDATA","")
-            for br, p in {
-                "Chrome":  os.path.join(la,"Google","Chrome","User Data","Default","Cache"),
-                "Edge":    os.path.join(la,"Microsoft","Edge","User Data","Default","Cache"),
-                "Firefox": self._ff_cache(),
-            }.items():
-                if p and os.path.isdir(p):
-                    n = clean(p); total += n
-                    self.log(f"  {br}: {n/1024**2:.2f} {T('log_freed')}", "green")
-        self.log(f"{T('log_total_freed')} {total/1024**2:.2f} MB", "yellow")
-        self.log(T("log_cl_done"), "yellow")
-        self.root.after(0, self.cl_prog.stop)
+        self._submit("btn_cleanup", self._cleanup)
+
+    @traced(cat="task")
+    def _cleanup(self, cancel: CancelToken):
+        self._post(self.cl_prog.start)
+        try:
+            self.log(T("log_cl_start"), "yellow")
+            total = 0
+            dry   = self.clean_opts["dry"].get()
+            if dry: self.log(T("log_dry"), "muted")
+            freed_lbl = T("log_freed_dry") if dry else T("log_freed")
+            def clean(folder, ext=""): return clean_folder(folder, ext, dry)
+            cancel.check()
+            if self.clean_opts["temp"].get():
+                for f in [os.environ.get("TEMP",""), os.environ.get("TMP",""),
+                          r"C:\Windows\Temp"]:
+                    if f and os.path.isdir(f):
+                        n = clean(f); total += n
+                        self.log(f"  Temp [{f}]: {n/1024**2:.2f} {freed_lbl}", "green")
+            cancel.check()
+            if self.clean_opts["prefetch"].get():
+                pf = r"C:\Windows\Prefetch"
+                if os.path.isdir(pf):
+                    n = clean(pf,".pf"); total += n
+                    self.log(f"  Prefetch: {n/1024**2:.2f} {freed_lbl}", "green")
+                else: self.log(T("log_pf_nf"), "muted")
+            cancel.check()
+            if self.clean_opts["updates"].get():
+                wu = r"C:\Windows\SoftwareDistribution\Download"
+                if os.path.isdir(wu):
+                    n = clean(wu); total += n
+                    self.log(f"  WU Cache: {n/1024**2:.2f} {freed_lbl}", "green")
+                else: self.log(T("log_wu_nf"), "muted")
+            cancel.check()
+            if self.clean_opts["browser"].get():
+                la = os.environ.get("LOCALAPPDATA","")
+                for br, p in {
+                    "Chrome":  os.path.join(la,"Google","Chrome","User Data","Default","Cache"),
+                    "Edge":    os.path.join(la,"Microsoft","Edge","User Data","Default","Cache"),
+                    "Firefox": self._ff_cache(),
+                }.items():
+                    if p and os.path.isdir(p):
+                        n = clean(p); total += n
+                        self.log(f"  {br}: {n/1024**2:.2f} {freed_lbl}", "green")
+            cancel.check()
+            if self.clean_opts["dups"].get():
+                if self._dups:
+                    n = remove_duplicates(self._dups.groups, dry); total += n
+                    self.log(f"  {T('log_dup_lbl')}: {n/1024**2:.2f} {freed_lbl}", "green")
+                    if not dry: self._dups = None
+                else: self.log(T("log_dup_first"), "muted")
+            self.log(f"{T('log_total_freed')} {total/1024**2:.2f} MB", "yellow")
+            self.log(T("log_cl_done"), "yellow")
+        finally:
+            self._post(self.cl_prog.stop)
+
+    # ════════════════════════════════════════════════════════════════════════
+    #  DISK USAGE
+    # ════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _volumes() -> list:
+        if PSUTIL_OK:
+            try: return [p.mountpoint for p in psutil.disk_partitions(all=False)]
+            except Exception: pass
+        return [os.environ.get("SystemDrive", "C:") + "\\" if os.name == "nt" else "/"]
+
+    def _run_disk_usage(self):
+        vol = self.du_vol.get()
+        if vol: self._submit("btn_du", self._disk_usage, vol)
+
+    @traced(cat="task")
+    def _disk_usage(self, vol: str, cancel: CancelToken):
+        self.log(T("log_du_start").format(vol), "blue")
+        r = self._du.scan(vol, cancel)
+        cancel.check()
+        self.log(T("log_du_sum").format(fmt_bytes(r.total), r.files, r.visited,
+                                        r.listed, r.seconds), "green")
+        self.log(T("log_du_dirs"), "muted")
+        for size, path in r.top_dirs[:10]:
+            self.log(f"  {fmt_bytes(size):>10}  {path}", "yellow")
+        self.log(T("log_du_files"), "muted")
+        for size, path in r.top_files[:10]:
+            self.log(f"  {fmt_bytes(size):>10}  {path}", "yellow")
+        self._post(lambda: self._du_show(r))
+
+    def _du_show(self, r: DiskUsage):
+        self._du_result, self._du_paths = r, {}
+        self.du_tree.delete(*self.du_tree.get_children())
+        self._du_insert("", r.root)
+
+    def _du_insert(self, parent: str, path: str):
+        tot, cnt, subs = self._du_result.tree.get(path, (0, 0, ()))   # unreadable root
+        iid = self.du_tree.insert(parent, "end", text=os.path.basename(path.rstrip("\\/")) or path,
+                                  values=(fmt_bytes(tot), cnt))
+        self._du_paths[iid] = path
+        if subs: self.du_tree.insert(iid, "end", text="…")    # placeholder → lazy expand
+        return iid
+
+    def _du_expand(self, _):
+        iid = self.du_tree.focus()
+        kids = self.du_tree.get_children(iid)
+        if len(kids) != 1 or self.du_tree.item(kids[0], "text") != "…": return
+        self.du_tree.delete(kids[0])
+        tree = self._du_result.tree
+        subs = [d for d in tree[self._du_paths[iid]][2] if d in tree]
+        for d in sorted(subs, key=lambda d: tree[d][0], reverse=True)[:200]:
+            self._du_insert(iid, d)
+
+    def _run_find_dups(self):
+        folder = filedialog.askdirectory(title=T("dup_pick"))
+        if folder: self._submit("btn_dups", self._find_dups, folder)
+
+    @traced(cat="task")
+    def _find_dups(self, folder: str, cancel: CancelToken):
+        self._post(self.cl_prog.start)
+        self.log(T("log_dup_start").format(folder), "blue")
+        try:
+            r = find_duplicates([folder], cancel=cancel)
+            cancel.check()
+        finally:
+            self._post(self.cl_prog.stop)
+        self._dups = r
+        pct = 100 * r.bytes_read / r.scanned if r.scanned else 0
+        self.log(T("log_dup_sum").format(len(r.groups), sum(len(g[1]) - 1 for g in r.groups),
+                                         fmt_bytes(r.wasted)), "yellow" if r.groups else "green")
+        self.log(T("log_dup_io").format(fmt_bytes(r.bytes_read), fmt_bytes(r.scanned),
+                                        pct, r.files, r.seconds), "muted")
+        for size, paths in r.groups[:10]:
+            self.log(f"  {fmt_bytes(size):>10} × {len(paths)}  {paths[0]}", "muted")
 
     @staticmethod
     def _ff_cache() -> str:
@@ -1602,26 +5321,29 @@ class PCAnalystPro:
     # ════════════════════════════════════════════════════════════════════════
 
     def _run_net_diag(self):
-        threading.Thread(target=self._net_diag, daemon=True).start()
+        self._submit("btn_net_diag", self._net_diag)
 
-    def _net_diag(self):
+    @traced(cat="task")
+    def _net_diag(self, cancel: CancelToken):
         self.log(T("log_net_start"), "blue")
         try:
-            subprocess.run(["ipconfig","/flushdns"], capture_output=True,
-                           timeout=10, creationflags=subprocess.CREATE_NO_WINDOW)
+            run_cmd(["ipconfig","/flushdns"], timeout=10, cancel=cancel)
             self.log(T("log_dns_ok"), "green")
             self._nv("dns", T("net_flushed"), C["green"])
+        except JobCancelled:
+            raise
         except Exception as e:
             self.log(T("log_dns_err")+str(e), "yellow")
             self._nv("dns", str(e), C["yellow"])
+        cancel.check(); self._dns_bench(cancel)
         connected = False
         for ip, name in [("8.8.8.8","Google DNS"),("1.1.1.1","Cloudflare DNS")]:
+            cancel.check()
             try:
-                r = subprocess.run(["ping","-n","4",ip], capture_output=True,
-                                   text=True, timeout=15,
-                                   creationflags=subprocess.CREATE_NO_WINDOW)
-                if "TTL=" in r.stdout:
-                    m   = re.search(r"Average = (\d+)ms", r.stdout)
+                r   = run_cmd(["ping","-n","4",ip], timeout=15, cancel=cancel)
+                out = r.stdout.decode(errors="replace")
+                if "TTL=" in out:
+                    m   = re.search(r"Average = (\d+)ms", out)
                     avg = (m.group(1)+" ms") if m else "OK"
                     self.log(f"  {name} ({ip}): {T('log_reach')} {avg}", "green")
                     self._nv("ping",   avg,          C["green"])
@@ -1629,6 +5351,8 @@ class PCAnalystPro:
                     connected = True; break
                 else:
                     self.log(f"  {name} ({ip}): {T('log_unreach')}", "red")
+            except JobCancelled:
+                raise
             except Exception as ex:
                 self.log(T("log_ping_err")+str(ex), "red")
         if not connected:
@@ -1636,18 +5360,42 @@ class PCAnalystPro:
             self._nv("ping",   "—",           C["muted"])
         self.log(T("log_net_done"), "blue")
 
+    def _dns_bench(self, cancel: CancelToken):
+        mine = [((ip, 53), T("dns_system")) for ip in system_resolvers()]
+        servers = mine + [a for a in DNS_ALTERNATIVES if a[0][0] not in {s[0][0] for s in mine}]
+        self.log(T("log_dns_bench").format(len(servers)), "muted")
+        try:
+            res = dns_benchmark(servers, cancel=cancel)
+        except OSError as e:
+            self.log(T("log_dns_err") + str(e), "yellow"); return
+        for r in sorted(res, key=lambda r: (r.fail_rate > 0.05, r.cached_p50 + r.uncached_p50)):
+            col = "red" if r.fail_rate > 0.05 else "green" if r.fail_rate == 0 else "yellow"
+            self.log(T("log_dns_row").format(f"{r.server[0]} ({r.label})", r.cached_p50, r.cached_p90,
+                                             r.uncached_p50, r.uncached_p90, r.fail_rate), col)
+        best = best_resolver(res)
+        if best is None:
+            self.log(T("log_dns_none"), "red"); self._nv("dns", T("log_dns_none").strip(), C["red"]); return
+        if any(best.server == s for s, _ in mine):
+            self.log(T("log_dns_keep").format(best.server[0]), "green")
+        else:
+            self.log(T("log_dns_best").format(best.server[0], best.label), "yellow")
+        self._nv("dns", f"{best.server[0]} ({best.label})  {best.cached_p50:.0f} / "
+                        f"{best.uncached_p50:.0f} ms", C["green"])
+
     def _run_speed_test(self):
         if not SPEED_OK:
             messagebox.showwarning(T("sp_miss_title"), T("sp_miss_msg")); return
-        threading.Thread(target=self._speed_test, daemon=True).start()
+        self._submit("btn_speed", self._speed_test)
 
-    def _speed_test(self):
+    @traced(cat="task")
+    def _speed_test(self, cancel: CancelToken):
         self.log(T("log_sp_start"), "blue")
         for k in ("download","upload","ping"):
             self._nv(k, T("log_testing"), C["yellow"])
         try:
             st = _st.Speedtest(secure=True); st.get_best_server()
-            dl = st.download()/1e6; ul = st.upload()/1e6; pm = st.results.ping
+            cancel.check(); dl = st.download()/1e6
+            cancel.check(); ul = st.upload()/1e6; pm = st.results.ping
             self._nv("download", f"{dl:.2f}  Mbps", C["green"])
             self._nv("upload",   f"{ul:.2f}  Mbps", C["green"])
             self._nv("ping",     f"{pm:.0f} ms",
@@ -1656,14 +5404,16 @@ class PCAnalystPro:
             self.log(f"{T('log_ul')}   {ul:.2f} Mbps","green")
             self.log(f"{T('log_ping_r')} {pm:.0f} ms",
                      "green" if pm<80 else "yellow")
+        except JobCancelled:
+            raise
         except Exception as e:
             self.log(T("log_sp_err")+str(e), "red")
             self._nv("download","Error",C["red"]); self._nv("upload","Error",C["red"])
         self.log(T("log_sp_done"), "blue")
 
     def _nv(self, key: str, text: str, color: str):
-        self.root.after(0, lambda: self.net_vals[key].config(text=text, fg=color)
-                        if key in self.net_vals else None)
+        self._post(lambda: self.net_vals[key].config(text=text, fg=color)
+                   if key in self.net_vals else None)
 
     # ════════════════════════════════════════════════════════════════════════
     #  EXPORT
@@ -1709,13 +5459,68 @@ class PCAnalystPro:
 
     def on_close(self):
         self.running = False
+        self.jobs.shutdown()
+        if _SENSORS: _SENSORS.close()
         self.root.destroy()
 
 
 # ════════════════════════════════════════════════════════════════════════════════
 #  ENTRY POINT
 # ════════════════════════════════════════════════════════════════════════════════
+def _cli_batch(args) -> int:
+    out = args.output or os.path.join(os.path.abspath(args.batch), "crash_table.csv")
+    def _prog(done, total):
+        if done == total or done % 500 == 0: print(f"\r{done}/{total}", end="", flush=True)
+    r = batch_analyze(args.batch, out, args.workers, progress=_prog)
+    print(f"\n{r['files']} files, {r['rows']} records ({r['errors']} errors) "
+          f"in {r['seconds']:.1f} s → {r['csv']}")
+    for code, n in r["top"]: print(f"  {code:<18} {n}")
+    return 0
+
+def _cli_diff(args) -> int:
+    store = SnapshotStore()
+    ids = store.list()
+    pick = []
+    for want in args.diff[:2]:                  # full id or a unique prefix (as logged)
+        hits = [i for i in ids if i.startswith(want)]
+        if len(hits) != 1:
+            print("Unknown" if not hits else "Ambiguous", "snapshot id:", want, "— recent:", *ids[-5:])
+            return 1
+        pick += hits
+    pick = (pick or ids[-2:-1]) + ids[-1:] if len(pick) < 2 else pick
+    if len(pick) < 2 or pick[0] == pick[1]: print("Need two snapshots:", *ids[-5:]); return 1
+    a, b = pick
+    print(T("snap_since").format(a))
+    for key, *x in snapshot_changes(store.diff(a, b)) or [("snap_none", a)]:
+        print(T(key).format(*x))
+    return 0
+
+def _cli_collector(args) -> int:
+    host, _, port = args.collector.rpartition(":")
+    store = FleetStore(args.db or app_path("fleet.db"))
+    srv = CollectorServer((host or "0.0.0.0", int(port)), store, args.token)
+    print(f"Collector on http://{srv.server_address[0]}:{srv.server_address[1]}  db={store.path}")
+    try: srv.serve_forever()
+    except KeyboardInterrupt: pass
+    finally: srv.server_close(); store.close()
+    return 0
+
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="PC Analyst Pro")
+    ap.add_argument("--batch", metavar="DIR",
+                    help="analyse a folder tree of dumps / event exports and exit (no GUI)")
+    ap.add_argument("-o", "--output", metavar="CSV", help="batch output (default: DIR/crash_table.csv)")
+    ap.add_argument("--workers", type=int, help="batch worker processes (default: all cores)")
+    ap.add_argument("--collector", metavar="[HOST:]PORT",
+                    help="run the fleet collector service and exit on Ctrl+C (no GUI)")
+    ap.add_argument("--db", help="collector database (default: APP_DIR/fleet.db)")
+    ap.add_argument("--diff", nargs="*", metavar="ID",
+                    help="diff two snapshots (default: the last two) and exit")
+    ap.add_argument("--token", help="shared agent token required by the collector")
+    args = ap.parse_args()
+    if args.batch:     raise SystemExit(_cli_batch(args))
+    if args.collector: raise SystemExit(_cli_collector(args))
+    if args.diff is not None: raise SystemExit(_cli_diff(args))
     root = tk.Tk()
     app  = PCAnalystPro(root)
     root.protocol("WM_DELETE_WINDOW", app.on_close)
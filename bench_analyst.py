@@ -0,0 +1,723 @@
+"""
+PC Analyst Pro — Performance Regression Benchmarks
+===================================================
+python bench_analyst.py                  # run all, compare with bench_baseline.json
+python bench_analyst.py --save           # run all, store results as the new baseline
+python bench_analyst.py --scale 0.05     # smaller fixtures for a quick check
+python bench_analyst.py -k dump -k event # only benchmarks whose name contains a key
+
+Every hot path runs against synthetic fixtures (minidumps, event-record
+streams, temp trees, canned PowerShell output, a stand-in DISM script, a
+loopback fleet collector), so the suite needs neither Windows nor admin
+rights.  Each benchmark reports throughput (best of N runs) and Python peak
+memory (tracemalloc, separate run).  The process exits 1 when throughput
+drops, or peak memory grows, beyond the tolerance relative to the stored
+baseline.
+"""
+
+# ── Standard library ──────────────────────────────────────────────────────────
+import os, sys, gzip, json, time, heapq, random, shutil, socket, struct, argparse, subprocess, tempfile, threading, tracemalloc
+import http.client
+from datetime import datetime
+
+import analyst_gui as ag
+
+MIN_SAMPLE_S = 0.2
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  FIXTURE GENERATORS
+# ════════════════════════════════════════════════════════════════════════════════
+_CODES   = ["0x0000000A", "0x0000001E", "0x00000050", "0x0000007E",
+            "0x00000116", "0x000000D1", "0x0000003B", "0x12345678"]
+_DRIVERS = ["nvlddmkm.sys", "igdkmd64.sys", "rtwlane.sys", "ntfs.sys", "storport.sys"]
+
+def make_minidump(path: str, size: int, code: int, driver: str = None, rnd=random):
+    """MINIDUMP_HEADER + 3-entry stream directory + exception stream, padded
+    with random bytes to `size`; `driver` (if any) is embedded at 0x2000."""
+    size = max(size, 0x4000)
+    body = bytearray(rnd.randbytes(size))
+    struct.pack_into("<4sIIIIIQ", body, 0, b"MDMP", 0xA793, 3, 0x20, 0, 0, 0)
+    for i, (stype, ssize, rva) in enumerate([(6, 0xA8, 0x100), (4, 0x400, 0x200),
+                                             (3, 0x400, 0x600)]):
+        struct.pack_into("<III", body, 0x20 + i * 12, stype, ssize, rva)
+    struct.pack_into("<II", body, 0x100, 1, 0)
+    struct.pack_into("<I", body, 0x108, code)
+    if driver: body[0x2000:0x2000 + len(driver)] = driver.encode()
+    with open(path, "wb") as f: f.write(body)
+
+def make_kernel_dump(path: str, size: int, code: int, params=(1, 2, 3, 4), drivers=(),
+                     x64: bool = True, seed: int = 5):
+    """Sparse-ish PAGEDUMP/PAGEDU64 file of `size` bytes: header page, then
+    1 MB blocks of random bytes.  Each of `drivers` is written once, ASCII and
+    UTF-16LE alternating, at spread offsets (the last one straddles a 64 MB
+    window boundary when the file is large enough)."""
+    rnd, block = random.Random(seed), 1 << 20
+    hdr = bytearray(0x2000 if x64 else 0x1000)
+    hdr[:0x1000] = b"PAGE" * 0x400                       # unused fields read as "PAGE"
+    if x64:
+        struct.pack_into("<8sII", hdr, 0, b"PAGEDU64", 15, 19041)
+        struct.pack_into("<I4Q", hdr, 0x38, code, 0, 0, 0, 0); struct.pack_into("<4Q", hdr, 0x40, *params)
+        struct.pack_into("<I", hdr, 0xF98, 2)
+    else:
+        struct.pack_into("<8sII", hdr, 0, b"PAGEDUMP", 15, 2600)
+        struct.pack_into("<I4I", hdr, 0x28, code, *params)
+        struct.pack_into("<I", hdr, 0xF88, 2)
+    marks = {}
+    for i, d in enumerate(drivers):
+        raw = f"\\{d}\0".encode("utf-16-le" if i % 2 else "ascii")
+        at = (64 << 20) - len(raw) // 2 if i == len(drivers) - 1 and size > 65 << 20 \
+             else len(hdr) + (i + 1) * (size - len(hdr)) // (len(drivers) + 2)
+        marks[at] = raw
+    with open(path, "wb") as f:
+        f.write(hdr); pos = len(hdr)
+        filler = rnd.randbytes(block)
+        while pos < size:
+            n = min(block, size - pos); f.write(filler[:n]); pos += n
+        for at, raw in marks.items(): f.seek(at); f.write(raw)
+    return path
+
+class DnsStub:
+    """Loopback UDP resolver for the DNS benchmark: answers every query after
+    `delay` seconds (names starting "pca-" after `miss_delay`, like a cache
+    miss) with NXDOMAIN, SERVFAIL for a `servfail` fraction and no answer
+    for a `drop` fraction.  A timer heap keeps delayed replies concurrent."""
+
+    def __init__(self, delay=0.0, miss_delay=0.0, drop=0.0, servfail=0.0, seed=9):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.addr = self.sock.getsockname()
+        self.delay, self.miss_delay, self.drop, self.servfail = delay, miss_delay, drop, servfail
+        self.rnd, self.heap, self.seen, self.running = random.Random(seed), [], 0, True
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while self.running:
+            now = time.perf_counter()
+            while self.heap and self.heap[0][0] <= now:
+                _, _, pkt, peer = heapq.heappop(self.heap); self.sock.sendto(pkt, peer)
+            self.sock.settimeout(max(0.0, min(0.05, self.heap[0][0] - now)) if self.heap else 0.05)
+            try: data, peer = self.sock.recvfrom(512)
+            except (socket.timeout, OSError): continue
+            self.seen += 1
+            if self.rnd.random() < self.drop: continue
+            rcode = 2 if self.rnd.random() < self.servfail else 3
+            reply = data[:2] + struct.pack(">HHHHH", 0x8180 | rcode, 1, 0, 0, 0) + data[12:]
+            wait = self.miss_delay if data[13:17] == b"pca-" else self.delay
+            heapq.heappush(self.heap, (time.perf_counter() + wait, self.seen, reply, peer))
+
+    def close(self):
+        self.running = False; self.sock.close()
+
+# Stand-in for DISM / SFC: progress redrawn with CR, optional UTF-16LE output
+# (like sfc.exe), a chosen exit code, an optional delay between progress
+# steps and an optional silent phase at the end.
+_STANDIN = r"""
+import os, sys, time
+steps, utf16, code, hang = int(sys.argv[1]), sys.argv[2] == "1", int(sys.argv[3]), float(sys.argv[4])
+step = float(sys.argv[5]) if len(sys.argv) > 5 else 0.0
+out = sys.stdout.buffer
+def w(s): out.write(s.encode("utf-16-le" if utf16 else "utf-8")); out.flush()
+w(f"Deployment Image Servicing and Management tool\r\nProcess id: {os.getpid()}\r\n")
+for i in range(steps + 1):
+    if i and step: time.sleep(step)
+    w(f"\r[{'=' * (i * 20 // steps):<20}] {100 * i / steps:.1f}%")
+w("\r\nThe operation completed successfully.\r\n")
+time.sleep(hang)
+sys.exit(code)
+"""
+
+def make_standin(root: str) -> str:
+    os.makedirs(root, exist_ok=True)
+    path = os.path.join(root, "standin.py")
+    with open(path, "w", encoding="utf-8") as f: f.write(_STANDIN)
+    return path
+
+def check_stream_cmd(script: str):
+    """Behavioural check of stream_cmd against the stand-in; raises on a mismatch."""
+    def run(steps, utf16, code, hang=0.0, idle=30, step=0.0, cancel=None, on_line=None):
+        pcts = []
+        r = ag.stream_cmd([sys.executable, script, str(steps), "1" if utf16 else "0", str(code), str(hang),
+                           str(step)], name="standin", idle_timeout=idle, on_progress=pcts.append,
+                          on_line=on_line, cancel=cancel)
+        return r, pcts
+    for utf16 in (False, True):
+        r, pcts = run(10, utf16, 0)
+        if pcts != [10.0 * i for i in range(11)] or r.returncode != 0 \
+           or r.tail[-1] != "The operation completed successfully.":
+            raise AssertionError(f"stream_cmd (utf16={utf16}): {pcts} rc={r.returncode} tail={r.tail[-2:]}")
+    if run(3, False, 87)[0].returncode != 87: raise AssertionError("stream_cmd: exit code lost")
+    t0 = time.monotonic()
+    try: run(3, False, 0, hang=30, idle=0.5)
+    except subprocess.TimeoutExpired: pass
+    else: raise AssertionError("stream_cmd: idle child was not killed")
+    if time.monotonic() - t0 > 10: raise AssertionError("stream_cmd: idle kill took too long")
+    # a silent phase after steady progress outlives idle_timeout (limit → 3× the step gap)
+    r, pcts = run(3, False, 0, hang=1.4, idle=0.8, step=0.6)
+    if r.returncode != 0 or pcts[-1] != 100.0: raise AssertionError("stream_cmd: slow phase was killed")
+    # cancel kills the child both while it is silent and while it is chatty
+    for steps, hang in ((3, 30), (2_000_000, 0)):
+        tok, pid = ag.CancelToken(), []
+        def on_line(line):
+            if line.startswith("Process id:"): pid.append(int(line.split(":")[1]))
+        threading.Timer(0.5, tok.cancel).start()
+        t0 = time.monotonic()
+        try: run(steps, False, 0, hang=hang, cancel=tok, on_line=on_line)
+        except ag.JobCancelled: pass
+        else: raise AssertionError("stream_cmd: cancel did not raise JobCancelled")
+        if time.monotonic() - t0 > 10: raise AssertionError("stream_cmd: cancel took too long")
+        if not pid or ag.psutil.pid_exists(pid[0]):
+            raise AssertionError(f"stream_cmd: cancelled child {pid} still running")
+    r = ag.run_cmd([sys.executable, "-c", "import sys; print('ok'); sys.exit(3)"], timeout=30)
+    if (r.returncode, r.stdout.strip()) != (3, b"ok"): raise AssertionError(f"run_cmd: {r}")
+
+def make_fleet_reports(n: int, seed: int = 6, first: int = 0) -> list:
+    rnd = random.Random(seed)
+    return [{"v": 1, "machine": f"pc{i % 2000:04d}", "ts": 1.7e9 + i, "os": "Windows 11", "cpu": "x",
+             "disks": [{"mount": m, "percent": rnd.uniform(30, 99), "total_gb": 512} for m in "CD"],
+             "crashes": [{"time": f"2024-{1 + j % 12:02d}-{1 + i % 28:02d} 10:00", "code": rnd.choice(_CODES),
+                          "source": "Event Log", "culprit": None} for j in range(rnd.randint(0, 6))]}
+            for i in range(first, first + n)]
+
+def check_fleet_http(root: str):
+    """Loopback check of CollectorServer + FleetAgent (token, gzip, 413,
+    malformed rows, rejected batches, spool cap, chunking, collector down);
+    raises on a mismatch."""
+    os.makedirs(root, exist_ok=True)
+    store = ag.FleetStore(os.path.join(root, "check.db"))
+    srv = ag.CollectorServer(("127.0.0.1", 0), store, token="s3cret"); srv.start()
+    url = f"http://127.0.0.1:{srv.server_address[1]}"
+    def post(body: bytes, headers: dict) -> int:
+        c = http.client.HTTPConnection("127.0.0.1", srv.server_address[1], timeout=10)
+        c.request("POST", "/v1/reports", body, {"X-Agent-Token": "s3cret", **headers})
+        code = c.getresponse().status; c.close()
+        return code
+    try:
+        agent = ag.FleetAgent(url, "s3cret", os.path.join(root, "spool.jsonl"))
+        agent.submit({"machine": "pc1", "ts": 1.7e9, "crashes": [{"time": "2024-01-01 10:00", "code": "0x9F"}]})
+        agent.submit({"machine": "pc2", "ts": "2am"})
+        agent.submit({"machine": "pc3", "crashes": [{"time": {"y": 2024}}, {"time": "t", "code": "0xD1"}],
+                      "disks": [{"mount": "C:\\", "percent": "n/a"}, "D:"]})
+        if agent.flush() != 2 or os.path.exists(agent.spool) or agent.rejected:
+            raise AssertionError("fleet: good reports not accepted alongside bad rows")
+        got = {(m["name"]) for m in store.machines()}
+        if got != {"pc1", "pc3"} or len(store.top_crashes()) != 2:
+            raise AssertionError(f"fleet: stored {got}, {store.top_crashes()}")
+        bad = ag.FleetAgent(url, "wrong", os.path.join(root, "bad.jsonl"))
+        bad.submit({"machine": "pc4"})
+        if bad.flush() != 0 or bad.rejected != 1 or os.path.exists(bad.spool) \
+           or not os.path.exists(bad.spool + ".rejected"):
+            raise AssertionError("fleet: a 401 batch was not set aside")
+        if post(b"", {"Content-Length": str(ag.FLEET_MAX_BODY + 1)}) != 413:
+            raise AssertionError("fleet: oversized body accepted")
+        bomb = gzip.compress(b" " * (ag.FLEET_MAX_RAW + 1), 9)
+        if post(bomb, {"Content-Encoding": "gzip"}) != 413:
+            raise AssertionError("fleet: gzip bomb accepted")
+        if post(b"{not json", {}) != 400: raise AssertionError("fleet: bad JSON accepted")
+        for r in make_fleet_reports(ag.FLEET_SPOOL_MAX + 5): agent.submit(r)
+        if len(agent._read()) != ag.FLEET_SPOOL_MAX: raise AssertionError("fleet: spool not capped")
+        lim, ag.FLEET_MAX_BODY = ag.FLEET_MAX_BODY, 4096
+        try: chunks = list(agent._chunks(agent._read()))
+        finally: ag.FLEET_MAX_BODY = lim
+        if len(chunks) < 2 or max(sum(len(l) + 1 for l in c) for c in chunks if len(c) > 1) > 4096:
+            raise AssertionError("fleet: spool not chunked under the body limit")
+    finally:
+        srv.shutdown(); srv.server_close(); store.close()
+    down = ag.FleetAgent(url, "s3cret", os.path.join(root, "spool.jsonl"))
+    try: down.flush(timeout=2)
+    except OSError: pass
+    else: raise AssertionError("fleet: flush to a stopped collector did not raise")
+    if len(down._read()) != ag.FLEET_SPOOL_MAX: raise AssertionError("fleet: spool lost while down")
+
+def make_dump_folder(root: str, count: int, size: int, seed: int = 1) -> list:
+    rnd, paths = random.Random(seed), []
+    os.makedirs(root, exist_ok=True)
+    for i in range(count):
+        p = os.path.join(root, f"{i:06d}.dmp")
+        make_minidump(p, size, int(rnd.choice(_CODES), 16),
+                      rnd.choice(_DRIVERS) if rnd.random() < 0.5 else None, rnd)
+        paths.append(p)
+    return paths
+
+def make_wer_messages(n: int, seed: int = 2) -> list:
+    """`n` rendered WER BugCheck (1001) messages; ~60% name a known driver."""
+    rnd = random.Random(seed)
+    return [f"The computer has rebooted from a bugcheck.  The bugcheck was: "
+            f"{rnd.choice(_CODES).lower()} (0xffffc00000000000, 0x0000000000000002, "
+            f"0x0000000000000000, 0xfffff80000000000). Faulting module: "
+            f"{rnd.choice(_DRIVERS) if rnd.random() < 0.6 else 'unknown'}. "
+            f"A dump was saved in: C:\\Windows\\MEMORY.DMP. Report Id: {i:08x}."
+            for i in range(n)]
+
+def make_event_stream(n: int, crash_ratio: float = 0.05, seed: int = 2) -> list:
+    """`n` raw System-log events (EventQuery layer shape); ~crash_ratio of
+    them crash-relevant (WER 1001, Kernel-Power 41, 6008, WHEA)."""
+    rnd, out = random.Random(seed), []
+    noise = [("Service Control Manager", 7036), ("Service Control Manager", 7040),
+             ("EventLog", 6005), ("EventLog", 6006), ("Microsoft-Windows-DistributedCOM", 10016),
+             ("Microsoft-Windows-DNS-Client", 1014)]
+    t0 = datetime(2024, 1, 1)
+    for i in range(n):
+        ts = t0.replace(month=1 + i % 12, day=1 + i % 28, hour=i % 24, minute=i % 60)
+        if rnd.random() < crash_ratio:
+            k = rnd.randrange(4)
+            if k == 0:
+                out.append({"provider": "Microsoft-Windows-WER-SystemErrorReporting", "id": 1001,
+                            "time": ts, "data": {
+                    "param1": f"{rnd.choice(_CODES).lower()} (0xffffc00000000000, "
+                              f"0x0000000000000002, 0x0000000000000000, 0xfffff80000000000)",
+                    "param2": "C:\\Windows\\Minidump\\missing.dmp"}})
+            elif k == 1:
+                out.append({"provider": "Microsoft-Windows-Kernel-Power", "id": 41, "time": ts,
+                            "data": {"BugcheckCode": rnd.choice(["0", "159", "278"]),
+                                     "BugcheckParameter1": "0x3", "SleepInProgress": "0"}})
+            elif k == 2:
+                out.append({"provider": "EventLog", "id": 6008, "time": ts,
+                            "data": {"0": "10:00:00", "1": "01/05/2024"}})
+            else:
+                out.append({"provider": "Microsoft-Windows-WHEA-Logger", "id": rnd.choice([18, 19, 47]),
+                            "time": ts, "data": {"ErrorSource": "Machine Check Exception"}})
+        else:
+            prov, eid = rnd.choice(noise)
+            out.append({"provider": prov, "id": eid, "time": ts, "data": {"param1": str(i)}})
+    return out
+
+def make_event_xml(path: str, events: list):
+    """Write raw events as a `wevtutil qe /f:xml`-style export."""
+    ns = "http://schemas.microsoft.com/win/2004/08/events/event"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<Events>")
+        for e in events:
+            data = "".join(f"<Data>{v}</Data>" if k.isdigit() else f'<Data Name="{k}">{v}</Data>'
+                           for k, v in e["data"].items())
+            f.write(f'<Event xmlns="{ns}"><System><Provider Name="{e["provider"]}"/>'
+                    f'<EventID>{e["id"]}</EventID><TimeCreated SystemTime="'
+                    f'{e["time"].isoformat()}.0000000Z"/></System><EventData>{data}</EventData></Event>')
+        f.write("</Events>")
+
+def make_fleet(root: str, machines: int, dumps: int, events: int, dump_size: int):
+    """<root>/pcNN/Minidump/*.dmp + <root>/pcNN/System.xml, as the helpdesk collects them."""
+    for m in range(machines):
+        make_dump_folder(os.path.join(root, f"pc{m:02d}", "Minidump"), dumps, dump_size, seed=m)
+        make_event_xml(os.path.join(root, f"pc{m:02d}", "System.xml"),
+                       make_event_stream(events, seed=m))
+
+def make_temp_tree(root: str, nfiles: int, per_dir: int = 500,
+                   sized_ratio: float = 0.1, dup_ratio: float = 0.02, seed: int = 3) -> int:
+    """`nfiles` files in root/dNNN/dNNN; most are empty (cheap to create at
+    1M scale), `sized_ratio` carry 1–8 KB and `dup_ratio` repeat one of a
+    small pool of payloads.  Returns total bytes written."""
+    rnd, total = random.Random(seed), 0
+    pool = [rnd.randbytes(rnd.randint(1024, 8192)) for _ in range(32)]
+    for i in range(nfiles):
+        d = os.path.join(root, f"d{i // (per_dir * 100):03d}", f"d{(i // per_dir) % 100:03d}")
+        if i % per_dir == 0: os.makedirs(d, exist_ok=True)
+        r = rnd.random()
+        data = (rnd.choice(pool) if r < dup_ratio else
+                rnd.randbytes(rnd.randint(1024, 8192)) if r < sized_ratio else b"")
+        with open(os.path.join(d, f"f{i:07d}.tmp"), "wb") as f: f.write(data)
+        total += len(data)
+    return total
+
+def make_drivers(rows: int, seed: int = 4) -> list:
+    """Win32_PnPSignedDriver-like rows with typed DriverDate."""
+    rnd = random.Random(seed)
+    return [{"DeviceName": f"Device {i} ({rnd.choice(_DRIVERS)})", "Manufacturer": f"Vendor {i % 37}",
+             "DriverVersion": f"{rnd.randint(1, 31)}.{rnd.randint(0, 99)}.{i}",
+             "DriverDate": datetime(rnd.randint(2010, 2024), rnd.randint(1, 12), rnd.randint(1, 28))}
+            for i in range(rows)]
+
+def make_ps_json(rows: list) -> str:
+    """Canned `Get-CimInstance … | ConvertTo-Json -Compress` output (PS 5.1 dates)."""
+    return json.dumps([{**r, "DriverDate": f"/Date({int(r['DriverDate'].timestamp() * 1000)})/"}
+                       for r in rows], separators=(",", ":"))
+
+def make_fake_wmi(drivers: list) -> "ag.FakeWmiProvider":
+    f = ag.FakeWmiProvider()
+    f.add("Win32_OperatingSystem", [{"Caption": "Microsoft Windows 11 Pro"}])
+    f.add("Win32_Processor",       [{"Name": "AMD Ryzen 7 5800X 8-Core Processor"}])
+    f.add("Win32_BIOS",            [{"SMBIOSBIOSVersion": "F33"}])
+    f.add("Win32_DiskDrive",       [{"Model": "Samsung SSD 980", "Size": 1000204886016, "Status": "OK"}])
+    f.add("Win32_VideoController", [{"Name": "NVIDIA GeForce RTX 3070"}])
+    f.add("Win32_PnPSignedDriver", drivers)
+    f.add("MSAcpi_ThermalZoneTemperature",
+          [{"InstanceName": f"ACPI\\ThermalZone\\TZ{i:02d}_0", "CurrentTemperature": 3032 + i * 10}
+           for i in range(4)], "root/wmi")
+    f.add("Sensor", [{"Identifier": f"/amdcpu/0/temperature/{i}", "Name": f"Core #{i}",
+                      "SensorType": "Temperature", "Value": 50.0 + i} for i in range(16)] +
+                    [{"Identifier": f"/lpc/nct6798d/fan/{i}", "Name": f"Fan #{i}",
+                      "SensorType": "Fan", "Value": 900.0 + i} for i in range(6)],
+          "root/LibreHardwareMonitor")
+    return f
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  BENCHMARKS  — each returns (setup, run, unit); run() → work items processed
+# ════════════════════════════════════════════════════════════════════════════════
+BENCHES = []
+
+def bench(name: str, repeat: int = 3, destructive: bool = False):
+    """Register a benchmark.  A destructive run consumes its fixture, so setup
+    is re-run before every measured run."""
+    def deco(fn): BENCHES.append((name, fn, repeat, destructive)); return fn
+    return deco
+
+@bench("read_dump")
+def _b_read_dump(ctx):
+    n, kb = max(20, int(2000 * ctx.scale)), ctx.dump_kb
+    paths = make_dump_folder(os.path.join(ctx.tmp, "dumps"), n, kb * 1024)
+    def run():
+        for p in paths: ag._read_dump(p); ag._scan_dump_for_driver(p)
+        return len(paths)
+    return None, run, "dumps/s"
+
+@bench("kernel_dump_scan", repeat=2)
+def _b_kernel_dump(ctx):
+    mb = max(80, int(2048 * ctx.scale))
+    path = os.path.join(ctx.tmp, "MEMORY.DMP")
+    if not os.path.exists(path) or os.path.getsize(path) != mb << 20:
+        make_kernel_dump(path, mb << 20, 0x9F, drivers=("ntfs.sys", "rtwlane.sys", "nvlddmkm.sys"))
+    def run():
+        ag.dump_header(path); ag.scan_dump_modules(path, names=list(ag.DRIVER_MAP) + ["missing.sys"])
+        return mb
+    return None, run, "MB/s"
+
+@bench("find_driver_in_text")
+def _b_find_driver(ctx):
+    msgs = make_wer_messages(max(1000, int(100_000 * ctx.scale)))
+    def run():
+        for m in msgs: ag._find_driver_in_text(m)
+        return len(msgs)
+    return None, run, "msgs/s"
+
+@bench("crash_events_query")
+def _b_events(ctx):
+    recs = make_event_stream(max(1000, int(100_000 * ctx.scale)))
+    fake = ag.FakeEventProvider({"System": recs})
+    def run():
+        ag.crash_events(fake, limit=len(recs))
+        return len(recs)
+    return None, run, "records/s"
+
+@bench("event_xml_render")
+def _b_event_xml(ctx):
+    xml = ('<Event xmlns="http://schemas.microsoft.com/win/2004/08/events/event"><System>'
+           '<Provider Name="Microsoft-Windows-Kernel-Power"/><EventID>41</EventID>'
+           '<TimeCreated SystemTime="2024-05-01T10:11:12.1234567Z"/></System><EventData>'
+           '<Data Name="BugcheckCode">159</Data><Data Name="BugcheckParameter1">0x3</Data>'
+           '<Data Name="SleepInProgress">0</Data></EventData></Event>')
+    n = max(1000, int(50_000 * ctx.scale))
+    def run():
+        for _ in range(n): ag.crash_record(ag.event_from_xml(xml), "power")
+        return n
+    return None, run, "events/s"
+
+@bench("ps_json_rows")
+def _b_ps(ctx):
+    txt  = make_ps_json(make_drivers(max(500, int(20_000 * ctx.scale))))
+    outs = [txt.encode("utf-8"), b"\xff\xfe" + txt.encode("utf-16le"), txt.encode("cp1254")]
+    def run():
+        rows = 0
+        for b in outs: rows += len(ag.PowerShellWmiProvider._parse(ag._decode_ps(b)))
+        return rows
+    return None, run, "rows/s"
+
+@bench("collectors_fake_wmi")
+def _b_collectors(ctx):
+    fake = make_fake_wmi(make_drivers(max(500, int(20_000 * ctx.scale))))
+    reg  = ag.SensorRegistry([ag.WmiSensors(fake)])
+    def run():
+        prev = ag._WMI; ag.set_wmi(fake)
+        try:
+            ag.collect_sysinfo(["os", "cpu", "bios", "disk", "gpu"])
+            ag.collect_thermal(reg)
+            sum(1 for r in ag.wmi_query("SELECT DeviceName, DriverDate FROM Win32_PnPSignedDriver")
+                      if (datetime.now() - ag.wmi_datetime(r["DriverDate"])).days > 730)
+        finally:
+            ag.set_wmi(prev)
+        return 1
+    return None, run, "passes/s"
+
+def _tree(ctx):
+    root = os.path.join(ctx.tmp, "tree")
+    shutil.rmtree(root, ignore_errors=True)
+    make_temp_tree(root, ctx.files)
+    return root
+
+@bench("disk_usage_scan", repeat=2)
+def _b_du(ctx):
+    root = ctx.tree or _tree(ctx); ctx.tree = root
+    def run():
+        return ag.DiskUsageScanner().scan(root).files
+    return None, run, "files/s"
+
+@bench("disk_usage_rescan")
+def _b_du_re(ctx):
+    root = ctx.tree or _tree(ctx); ctx.tree = root
+    sc = ag.DiskUsageScanner(); sc.scan(root)
+    def run():
+        return sc.scan(root).files
+    return None, run, "files/s"
+
+@bench("find_duplicates", repeat=2)
+def _b_dups(ctx):
+    root = ctx.tree or _tree(ctx); ctx.tree = root
+    def run():
+        return ag.find_duplicates([root]).files
+    return None, run, "files/s"
+
+@bench("clean_folder", destructive=True)
+def _b_clean(ctx):
+    holder = {}
+    def setup(): holder["root"] = _tree(ctx); ctx.tree = None
+    def run():
+        ag.clean_folder(holder["root"])
+        return ctx.files
+    return setup, run, "files/s"
+
+@bench("translate_lookup")
+def _b_T(ctx):
+    keys = list(ag.S) * max(1, int(2000 * ctx.scale))
+    def run():
+        for k in keys: ag.T(k)
+        return len(keys)
+    return None, run, "lookups/s"
+
+@bench("lang_switch_10k_widgets")
+def _b_switch(ctx):
+    b, sink = ag.TranslationBinder(), []
+    keys = list(ag.S)
+    for i in range(10_000):                      # 10 tabs × 1k widgets
+        k = keys[i % len(keys)]
+        b.add(f"tab{i % 10}", lambda k=k: sink.append(ag.T(k)))
+    def run():
+        sink.clear()
+        for code in ("tr", "en"): ag.set_lang(code); b.switch("tab0")
+        return 2
+    return None, run, "switches/s"
+
+@bench("row_index_100k")
+def _b_rows(ctx):
+    rnd  = random.Random(5)
+    rows = [{"time": f"2024-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+             "code": rnd.choice(_CODES), "category": "Driver", "file": f"{i}.dmp"}
+            for i in range(100_000)]
+    fmt = lambda r: (r["time"], r["code"], r["category"], r["file"])
+    def run():
+        ix = ag.RowIndex(fmt); ix.extend(rows)
+        ix.sort(0, True); ix.filter("0x0000007e"); ix.filter("")
+        return len(rows)
+    return None, run, "rows/s"
+
+@bench("batch_analyze", repeat=2)
+def _b_batch(ctx):
+    root = os.path.join(ctx.tmp, "fleet")
+    make_fleet(root, 8, max(5, int(250 * ctx.scale)), max(200, int(5000 * ctx.scale)),
+               ctx.dump_kb * 1024)
+    out = os.path.join(ctx.tmp, "fleet.csv")
+    def run():
+        return ag.batch_analyze(root, out)["files"]
+    return None, run, "files/s"
+
+@bench("fleet_ingest")
+def _b_fleet(ctx):
+    reps  = make_fleet_reports(max(500, int(20_000 * ctx.scale)))
+    store = ag.FleetStore(os.path.join(ctx.tmp, "fleet.db"))
+    def run():
+        for i in range(0, len(reps), 50): store.ingest(reps[i:i + 50])
+        store.top_crashes(limit=10); store.disks_over(90)
+        return len(reps)
+    return None, run, "reports/s"
+
+@bench("fleet_http_loopback", repeat=2)
+def _b_fleet_http(ctx):
+    """Agents on localhost: spool a batch, flush it through the collector."""
+    root = os.path.join(ctx.tmp, "fleet_http")
+    check_fleet_http(root)
+    reps  = make_fleet_reports(max(500, int(20_000 * ctx.scale)), seed=7)
+    store = ag.FleetStore(os.path.join(root, "bench.db"))
+    srv   = ag.CollectorServer(("127.0.0.1", 0), store); srv.start()
+    agent = ag.FleetAgent(f"http://127.0.0.1:{srv.server_address[1]}", spool=os.path.join(root, "b.jsonl"))
+    def run():
+        n = 0
+        for i in range(0, len(reps), ag.FLEET_SPOOL_MAX):
+            for r in reps[i:i + ag.FLEET_SPOOL_MAX]: agent.submit(r)
+            n += agent.flush()
+        if n != len(reps): raise AssertionError(f"fleet: {n} of {len(reps)} accepted")
+        return n
+    return None, run, "reports/s"
+
+@bench("snapshot_save_diff")
+def _b_snapshot(ctx):
+    n    = max(200, int(5000 * ctx.scale))
+    drv  = [{"id": f"PCI\\VEN_{i:05X}", "device": f"Device {i}", "vendor": f"Vendor {i % 37}",
+             "version": f"1.{i % 9}.{i}", "date": "2022-01-01"} for i in range(n)]
+    base = {"sysinfo": {"os": "Windows 11 Pro", "bios": "F33", "cpu": "Ryzen 7 5800X"},
+            "startup": [{"name": f"App{i}", "path": f"C:\\App{i}.exe", "hive": "HKCU",
+                         "disabled": False} for i in range(40)],
+            "drivers": drv,
+            "crashes": [{"time": f"2024-01-{1 + i % 28:02d} 10:00", "code": _CODES[i % len(_CODES)],
+                         "file": "Event Log", "culprit": None} for i in range(200)]}
+    changed = dict(base, drivers=drv[:-1] + [dict(drv[-1], version="9.9")])
+    store = ag.SnapshotStore(os.path.join(ctx.tmp, "snapshots"), keep=10)
+    def run():
+        a = store.save(base); b = store.save(changed)
+        store._cache.clear()
+        store.diff(a["id"], b["id"])
+        return 2
+    return None, run, "snapshots/s"
+
+@bench("rules_engine_feed")
+def _b_rules(ctx):
+    rnd = random.Random(7)
+    samples = [{"cpu": rnd.uniform(0, 100), "ram": rnd.uniform(40, 95), "disk": 80.0, "gpu": rnd.uniform(0, 100),
+                "cpu_temp": rnd.uniform(40, 95), "gpu_temp": rnd.uniform(40, 95)}
+               for _ in range(max(5000, int(200_000 * ctx.scale)))]
+    eng = ag.RulesEngine(ag.ALERT_RULES_DEFAULT)
+    def run():
+        for i, smp in enumerate(samples): eng.feed(smp, i * 2.0)
+        return len(samples)
+    return None, run, "samples/s"
+
+@bench("process_row_diff")
+def _b_proc_diff(ctx):
+    rnd  = random.Random(8)
+    rows = [{"pid": 4 * i, "name": f"proc{i}.exe", "cpu": 0.0, "rss": rnd.uniform(1, 900), "io": 0.0,
+             "handles": rnd.randint(50, 3000), "threads": rnd.randint(1, 120)} for i in range(450)]
+    ticks = [[dict(rows[j], cpu=round(rnd.uniform(0, 30), 1)) for j in rnd.sample(range(450), 25)]
+             for _ in range(max(50, int(2000 * ctx.scale)))]
+    fmt = lambda r: (r["name"], r["pid"], f"{r['cpu']:.1f}", f"{r['rss']:.1f}",
+                     f"{r['io']:.1f}", r["handles"], r["threads"])
+    def run():
+        ix = ag.RowIndex(fmt, key=lambda r: r["pid"]); ix.sort(2, True); ix.apply(rows)
+        for up in ticks: ix.apply(up)
+        return len(ticks)
+    return None, run, "ticks/s"
+
+@bench("metric_sample")
+def _b_metrics(ctx):
+    if not ag.PSUTIL_OK: return None, lambda: 0, "samples/s"
+    sampler = ag.MetricSampler()
+    n = max(20, int(400 * ctx.scale))
+    def run():
+        for _ in range(n): sampler.sample()
+        return n
+    return None, run, "samples/s"
+
+@bench("dns_benchmark_loopback")
+def _b_dns(ctx):
+    stubs = [DnsStub(), DnsStub(drop=0.02), DnsStub(servfail=0.05)]
+    servers = [(s.addr, f"stub{i}") for i, s in enumerate(stubs)]
+    rounds = max(3, int(100 * ctx.scale))
+    def run():
+        res = ag.dns_benchmark(servers, rounds=rounds, inflight=32, timeout=0.2)
+        return sum(r.sent for r in res)
+    return None, run, "queries/s"
+
+@bench("stream_cmd_standin", repeat=2)
+def _b_stream_cmd(ctx):
+    script = make_standin(os.path.join(ctx.tmp, "standin"))
+    check_stream_cmd(script)
+    steps = max(200, int(20_000 * ctx.scale))
+    def run():
+        ag.stream_cmd([sys.executable, script, str(steps), "0", "0", "0"], name="standin")
+        return steps
+    return None, run, "lines/s"
+
+@bench("hash_files_cached")
+def _b_hash(ctx):
+    root = os.path.join(ctx.tmp, "dumps")
+    if not os.path.isdir(root): make_dump_folder(root, max(20, int(2000 * ctx.scale)), ctx.dump_kb * 1024)
+    paths = [os.path.join(root, f) for f in os.listdir(root)]
+    cache = ag.HashCache(os.path.join(ctx.tmp, "hash_cache.json"))
+    ag.hash_files(paths, cache)
+    def run():
+        return len(ag.hash_files(paths, cache)[0])
+    return None, run, "files/s"
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+#  RUNNER
+# ════════════════════════════════════════════════════════════════════════════════
+class Ctx:
+    def __init__(self, tmp, scale, dump_kb):
+        self.tmp, self.scale, self.dump_kb = tmp, scale, dump_kb
+        self.files = max(1000, int(1_000_000 * scale))
+        self.tree  = None
+
+def measure(ctx, fn, repeat: int, destructive: bool) -> dict:
+    setup, run, unit = fn(ctx)
+    best = 0.0
+    for _ in range(repeat):                      # rate = items / seconds, best sample
+        if setup: setup()
+        items, t0 = 0, time.perf_counter()
+        while True:                              # loop short runs to >= MIN_SAMPLE_S
+            items += run(); dt = time.perf_counter() - t0
+            if destructive or dt >= MIN_SAMPLE_S: break
+        best = max(best, items / dt if dt else 0.0)
+    if setup: setup()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"throughput": best, "unit": unit, "peak_kb": peak / 1024}
+
+def compare(results: dict, base: dict, tol: float, mem_tol: float) -> list:
+    bad = []
+    for name, r in results.items():
+        b = base.get(name)
+        if not b: continue
+        if r["throughput"] < b["throughput"] * (1 - tol):
+            bad.append(f"{name}: throughput {r['throughput']:,.0f} < baseline "
+                       f"{b['throughput']:,.0f} {r['unit']} (-{tol:.0%} allowed)")
+        if r["peak_kb"] > b["peak_kb"] * (1 + mem_tol) + 64:
+            bad.append(f"{name}: peak memory {r['peak_kb']:,.0f} KB > baseline "
+                       f"{b['peak_kb']:,.0f} KB (+{mem_tol:.0%} allowed)")
+    return bad
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="PC Analyst Pro performance benchmarks")
+    ap.add_argument("-k", dest="keys", action="append", default=[],
+                    help="only run benchmarks whose name contains KEY")
+    ap.add_argument("--scale", type=float, default=1.0,
+                    help="fixture size factor (1.0 = 1M-file tree, 100k events)")
+    ap.add_argument("--dump-kb", type=int, default=256, help="size of each synthetic minidump")
+    ap.add_argument("--tolerance", type=float, default=0.20, help="allowed throughput drop")
+    ap.add_argument("--mem-tolerance", type=float, default=0.25, help="allowed peak-memory growth")
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--save", action="store_true", help="store results as the new baseline")
+    ap.add_argument("--tmp", help="fixture directory (default: a fresh temp dir)")
+    a = ap.parse_args(argv)
+
+    tmp = a.tmp or tempfile.mkdtemp(prefix="pcanalyst_bench_")
+    ctx, results = Ctx(tmp, a.scale, a.dump_kb), {}
+    try:
+        for name, fn, repeat, destructive in BENCHES:
+            if a.keys and not any(k in name for k in a.keys): continue
+            r = results[name] = measure(ctx, fn, repeat, destructive)
+            print(f"  {name:<26} {r['throughput']:>14,.0f} {r['unit']:<11} "
+                  f"peak {r['peak_kb']:>10,.0f} KB", flush=True)
+    finally:
+        if not a.tmp: shutil.rmtree(tmp, ignore_errors=True)
+
+    base = ag.load_json(a.baseline, {})
+    meta = {"scale": a.scale, "dump_kb": a.dump_kb}
+    if a.save:
+        kept = base.get("results", {}) if base.get("meta") == meta else {}
+        ag.save_json(a.baseline, {"meta": meta, "results": {**kept, **results}})
+        print(f"Baseline saved → {a.baseline}")
+        return 0
+    if not base:
+        print("No baseline yet — run with --save to create one."); return 0
+    if base.get("meta") != meta:
+        print(f"Baseline was recorded with {base.get('meta')}, not {meta}; not comparing.")
+        return 0
+    bad = compare(results, base.get("results", {}), a.tolerance, a.mem_tolerance)
+    for line in bad: print("  REGRESSION  " + line)
+    print("OK — no regressions." if not bad else f"{len(bad)} regression(s).")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())